@@ -0,0 +1,65 @@
+"""Compare reloading parsed reports from a binary archive, from NDJSON and by parsing again.
+
+Run from the repository root:
+
+    python benchmarks/bench_archive.py
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Archive, Batch, Export
+import corpus
+
+def read_archive(path):
+    with Archive.Archive(path) as archive:
+        return [record.wind_speed for record in archive]
+
+def read_columns(path):
+    archive = Archive.Archive(path)
+    speeds = archive.columns()['wind_speed'].mean()
+    archive.close()
+    return speeds
+
+def read_ndjson(path):
+    with open(path) as f:
+        return [json.loads(line)['wind']['speed'] for line in f]
+
+def main(count=100000, repeat=3):
+    raw = corpus.generate(count)
+    reports = Batch.parse_many(raw)
+    directory = tempfile.mkdtemp()
+
+    try:
+        archive = os.path.join(directory, 'metars.arc')
+        ndjson = os.path.join(directory, 'metars.json')
+        with Archive.ArchiveWriter(archive) as writer:
+            writer.write_many(reports)
+        with open(ndjson, 'w') as f:
+            Export.write_ndjson(reports, f)
+
+        times = [
+            ('parse', min(timeit.repeat(lambda: [report.wind_speed for report in Batch.parse_many(raw)], number=1, repeat=repeat))),
+            ('ndjson', min(timeit.repeat(lambda: read_ndjson(ndjson), number=1, repeat=repeat))),
+            ('archive records', min(timeit.repeat(lambda: read_archive(archive), number=1, repeat=repeat))),
+        ]
+        try:
+            import numpy
+            times.append(('archive columns', min(timeit.repeat(lambda: read_columns(archive), number=1, repeat=repeat))))
+        except ImportError:
+            pass
+
+        print('{} reports, reading the wind speed of each report'.format(count))
+        print('size: archive {:.1f} MB (+ {:.1f} MB raw), ndjson {:.1f} MB'.format(
+            os.path.getsize(archive) / 1e6, os.path.getsize(archive + '.raw') / 1e6, os.path.getsize(ndjson) / 1e6))
+        for name, elapsed in times:
+            print('{:16s} {:10.3f} us/report'.format(name + ':', elapsed / count * 1e6))
+    finally:
+        shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    main()
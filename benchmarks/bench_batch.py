@@ -0,0 +1,54 @@
+"""Compare `Batch.parse_many` with creating each `Report` in a loop.
+
+The reports are measured twice: six reports repeated, and the random reports
+of `corpus.py`, which share fewer tokens and date and time groups.
+
+Run from the repository root:
+
+    python benchmarks/bench_batch.py
+"""
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Batch
+import corpus
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'EGPK 020920Z 25010G21KT 8000 -RA FEW014 SCT020 BKN042 09/08 Q0991',
+    'PAUN 131256Z AUTO 08006KT 10SM SCT021 M04/M05 A2931 RMK AO2 SNE15 SLP927 P0000 T10391050 FZRANO',
+    'UTDL 021030Z 08004MPS 7000 NSC 18/M04 Q1022 R26/CLRD70 NOSIG RMK QFE729/0972',
+    'ZMUB 021000Z VRB01MPS CAVOK M09/M13 Q1025 NOSIG RMK QFE660.4 66',
+    'CYBC 021001Z AUTO 33003KT 2 1/4SM R10/5500FT/N -RA BR BKN024 OVC045 04/03 A2926 RMK VIS VRB 5/8-3 SLP912',
+]
+
+def compare(name, reports, repeat):
+    """Print the time per report of a `Report()` loop and of `parse_many()`."""
+    count = len(reports)
+    loop = min(timeit.repeat(lambda: [Metar.Report(raw) for raw in reports], number=1, repeat=repeat))
+    batch = min(timeit.repeat(lambda: Batch.parse_many(reports), number=1, repeat=repeat))
+
+    print('{} reports, {}'.format(count, name))
+    print('Report() loop: {:8.2f} us/report'.format(loop / count * 1e6))
+    print('parse_many():  {:8.2f} us/report ({:+.1f}% compared to the loop)'.format(batch / count * 1e6, (batch / loop - 1) * 100))
+
+def main(count=20000, repeat=5):
+    reports = (REPORTS * (count // len(REPORTS) + 1))[:count]
+
+    compare('{} repeated'.format(len(REPORTS)), reports, repeat)
+    compare('synthetic corpus', corpus.generate(count), repeat)
+
+    try:
+        import numpy
+    except ImportError:
+        return
+
+    results = min(timeit.repeat(lambda: [report.result() for report in Batch.parse_many(reports)], number=1, repeat=repeat))
+    columns = min(timeit.repeat(lambda: Batch.parse_columns(reports), number=1, repeat=repeat))
+    print('parse_many() + result(): {:8.2f} us/report'.format(results / count * 1e6))
+    print('parse_columns():         {:8.2f} us/report'.format(columns / count * 1e6))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""Compare eager and lazy parsing when only a few values are read.
+
+Run from the repository root:
+
+    python benchmarks/bench_lazy.py
+"""
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Batch
+from bench_batch import REPORTS
+
+def read_ident_and_altimeter(reports):
+    for report in reports:
+        report.get_ident()
+        report.get_altimeter_pressure()
+
+def main(count=20000, repeat=5):
+    reports = (REPORTS * (count // len(REPORTS) + 1))[:count]
+
+    eager = min(timeit.repeat(lambda: read_ident_and_altimeter(Batch.parse_many(reports)), number=1, repeat=repeat))
+    lazy = min(timeit.repeat(lambda: read_ident_and_altimeter(Batch.parse_many(reports, lazy=True)), number=1, repeat=repeat))
+
+    print('{} reports, reading ident and altimeter pressure'.format(count))
+    print('eager: {:8.2f} us/report'.format(eager / count * 1e6))
+    print('lazy:  {:8.2f} us/report ({:+.1f}% compared to eager)'.format(lazy / count * 1e6, (lazy / eager - 1) * 100))
+
+if __name__ == '__main__':
+    main()
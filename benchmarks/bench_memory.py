@@ -0,0 +1,36 @@
+"""Measure the memory used per report by `Report` and `CompactReport`.
+
+Run from the repository root:
+
+    python benchmarks/bench_memory.py
+"""
+import os
+import sys
+import tracemalloc
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Batch
+from bench_batch import REPORTS
+
+def measure(create, count):
+    """Return the number of bytes allocated per report by `create`."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    reports = create()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+def main(count=20000):
+    # Add a trailing space so every report holds its own stripped copy of the raw text, like reports read from a file
+    lines = [raw + ' ' for raw in (REPORTS * (count // len(REPORTS) + 1))[:count]]
+
+    report = measure(lambda: Batch.parse_many(lines), count)
+    compact = measure(lambda: [Metar.CompactReport.from_report(r) for r in Batch.parse_many(lines)], count)
+
+    print('{} reports, including the raw text'.format(count))
+    print('Report:        {:6.0f} bytes/report'.format(report))
+    print('CompactReport: {:6.0f} bytes/report'.format(compact))
+
+if __name__ == '__main__':
+    main()
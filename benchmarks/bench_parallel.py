@@ -0,0 +1,47 @@
+"""Measure how `Batch.parse_parallel` scales with the number of worker processes.
+
+For each number of workers, prints the throughput next to the cost of
+sending the decoded values back to the main process, which is the part
+that does not scale with more workers.
+
+Run from the repository root:
+
+    python benchmarks/bench_parallel.py [max_workers]
+"""
+import os
+import sys
+import time
+import pickle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Batch, Metar
+from bench_batch import REPORTS
+
+def main(max_workers=None, count=200000, chunksize=2000):
+    max_workers = max_workers or os.cpu_count() or 1
+    reports = (REPORTS * (count // len(REPORTS) + 1))[:count]
+
+    start = time.perf_counter()
+    Batch.parse_many(reports)
+    serial = time.perf_counter() - start
+
+    # Cost of sending the values back and rebuilding the compact reports in the main process
+    values = Batch._parse_chunk(reports[:chunksize], None)
+    start = time.perf_counter()
+    [Metar.CompactReport(v) for v in pickle.loads(pickle.dumps(values))]
+    transfer = (time.perf_counter() - start) / chunksize
+
+    print('{} reports, {} reports per chunk'.format(count, chunksize))
+    print('parse_many(): {:8.0f} reports/s'.format(count / serial))
+    print('transfer:     {:8.2f} us/report (limits throughput to {:.0f} reports/s)'.format(transfer * 1e6, 1 / transfer))
+    print('workers  reports/s  speedup')
+
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        for _ in Batch.parse_parallel(reports, workers=workers, chunksize=chunksize):
+            pass
+        elapsed = time.perf_counter() - start
+        print('{:7d}  {:9.0f}  {:7.2f}'.format(workers, count / elapsed, serial / elapsed))
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else None)
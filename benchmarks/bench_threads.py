@@ -0,0 +1,65 @@
+"""Measure how `Batch.parse_threaded` scales with the number of threads.
+
+With the GIL, threads parse one at a time and the throughput stays flat. On
+free-threaded builds (`python3.13t`) it should grow with the number of
+threads. Pass interpreters with `--python` to run the benchmark in each of
+them, for example a regular and a free-threaded build of the same version.
+
+Run from the repository root:
+
+    python benchmarks/bench_threads.py [max_workers] [--python python3.13 python3.13t]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Batch
+from bench_batch import REPORTS
+
+def gil_enabled():
+    """Return whether the interpreter runs with the GIL. Only free-threaded builds (3.13+) can run without it."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+def run(max_workers, count, chunksize):
+    reports = (REPORTS * (count // len(REPORTS) + 1))[:count]
+
+    start = time.perf_counter()
+    Batch.parse_many(reports)
+    serial = time.perf_counter() - start
+
+    print('Python {} ({}), {} reports, {} reports per chunk'.format(
+        sys.version.split()[0], 'GIL' if gil_enabled() else 'free-threaded', count, chunksize))
+    print('parse_many(): {:8.0f} reports/s'.format(count / serial))
+    print('threads  reports/s  speedup')
+
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        for _ in Batch.parse_threaded(reports, workers=workers, chunksize=chunksize):
+            pass
+        elapsed = time.perf_counter() - start
+        print('{:7d}  {:9.0f}  {:7.2f}'.format(workers, count / elapsed, serial / elapsed))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('max_workers', nargs='?', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--chunksize', type=int, default=1000)
+    parser.add_argument('--python', nargs='+', metavar='INTERPRETER', help='run the benchmark in each of these interpreters')
+    args = parser.parse_args()
+
+    if not args.python:
+        run(args.max_workers, args.count, args.chunksize)
+        return
+
+    for index, interpreter in enumerate(args.python):
+        if index:
+            print()
+        subprocess.run([interpreter, os.path.abspath(__file__), str(args.max_workers),
+                        '--count', str(args.count), '--chunksize', str(args.chunksize)], check=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Generate a reproducible corpus of synthetic METAR reports.
+
+The corpus covers the formats handled by the parser: KT and MPS winds with
+gusts, VRB and variable directions, metric, CAVOK and (fractional) statute
+mile visibilities, M-prefixed temperatures, Q and A altimeters, and
+AUTO/COR modifiers with remarks.
+
+Run from the repository root to print a corpus:
+
+    python benchmarks/corpus.py [count] [seed]
+"""
+import random
+import string
+import sys
+
+SM_VISIBILITIES = ['10SM', '7SM', '5SM', '3SM', '2SM', '1SM', '1 1/2SM', '2 1/4SM', '3/4SM', '1/2SM', '1/4SM', 'M1/4SM', 'M2 1/4SM', '0SM']
+WEATHER = ['-RA', 'RA', '+RA', 'BR', 'FG', '-SN', 'SN', 'HZ', 'TSRA', '-DZ', 'VCSH', 'FZFG']
+CLOUDS = ['FEW', 'SCT', 'BKN', 'OVC']
+
+def _temperature(value):
+    return '{}{:02d}'.format('M' if value < 0 else '', abs(value))
+
+def generate_report(rng):
+    """Return a random METAR report."""
+    american = rng.random() < 0.4
+    ident = ('K' if american else rng.choice('EKLPRUYZ')) + ''.join(rng.choice(string.ascii_uppercase) for _ in range(3))
+    groups = [ident, '{:02d}{:02d}{:02d}Z'.format(rng.randint(1, 28), rng.randint(0, 23), rng.randrange(0, 60, 5))]
+
+    modifier = rng.random()
+    if modifier < 0.02:
+        groups.append('COR AUTO')
+    elif modifier < 0.05:
+        groups.append('COR')
+    elif modifier < 0.2:
+        groups.append('AUTO')
+
+    # Wind
+    unit = 'KT' if american or rng.random() < 0.8 else 'MPS'
+    wind = rng.random()
+    if wind < 0.02:
+        groups.append('/////' + unit)
+    elif wind < 0.07:
+        groups.append('00000' + unit)
+    else:
+        direction = 'VRB' if wind < 0.17 else '{:03d}'.format(rng.randrange(10, 370, 10))
+        speed = rng.randint(1, 35)
+        gust = 'G{:02d}'.format(speed + rng.randint(5, 20)) if rng.random() < 0.2 else ''
+        groups.append('{}{:02d}{}{}'.format(direction, speed, gust, unit))
+        if direction != 'VRB' and rng.random() < 0.1:
+            start = rng.randrange(0, 360, 10)
+            groups.append('{:03d}V{:03d}'.format(start, (start + rng.randrange(60, 180, 10)) % 360))
+
+    # Visibility
+    if american:
+        groups.append(rng.choice(SM_VISIBILITIES))
+    else:
+        visibility = rng.random()
+        if visibility < 0.15:
+            groups.append('CAVOK')
+        elif visibility < 0.6:
+            groups.append('9999')
+        else:
+            groups.append('{:04d}'.format(rng.choice([200, 800, 1500, 3000, 5000, 8000])))
+
+    # Present weather and clouds
+    if 'CAVOK' not in groups:
+        if rng.random() < 0.3:
+            groups.append(rng.choice(WEATHER))
+
+        layers = rng.randint(0, 3)
+        if layers == 0:
+            groups.append('CLR' if american else 'NSC')
+        height = 0
+        for i in range(layers):
+            height += rng.randint(5, 60)
+            groups.append('{}{:03d}'.format(CLOUDS[min(i + rng.randint(0, 1), 3)], height))
+
+    # Temperature and dew point
+    temperature = rng.randint(-30, 35)
+    dew_point = temperature - rng.randint(0, 10)
+    groups.append('{}/{}'.format(_temperature(temperature), _temperature(dew_point)))
+
+    # Altimeter and remarks
+    if american:
+        groups.append('A{}'.format(rng.randint(2900, 3100)))
+        groups.append('RMK {} SLP{:03d} T{}{:03d}{}{:03d}'.format(
+            rng.choice(['AO1', 'AO2']), rng.randint(0, 999),
+            int(temperature < 0), abs(temperature) * 10 + rng.randint(0, 9),
+            int(dew_point < 0), abs(dew_point) * 10 + rng.randint(0, 9)))
+    else:
+        groups.append('Q{:04d}'.format(rng.randint(980, 1040)))
+        if rng.random() < 0.5:
+            groups.append('NOSIG')
+
+    return ' '.join(groups)
+
+def generate(count, seed=0):
+    """Return a list of `count` random METAR reports. The same seed returns the same reports."""
+    rng = random.Random(seed)
+    return [generate_report(rng) for _ in range(count)]
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    print('\n'.join(generate(count, seed)))
@@ -0,0 +1,132 @@
+"""Benchmark suite on a synthetic METAR corpus.
+
+Measures the reports per second and memory per report of parsing (`Report`),
+`result()`, `json()` and `Export.to_json()`, and the time per report spent
+in each field group. The results are printed as JSON, so the results of two
+versions can be compared:
+
+    python benchmarks/suite.py --output before.json
+    git checkout ...
+    python benchmarks/suite.py --compare before.json
+
+Run from the repository root.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Export
+import corpus
+
+# Fixed reference date, so every run decodes the same dates
+REFERENCE = datetime(2020, 11, 28, tzinfo=timezone.utc)
+
+def per_second(function, count, repeat):
+    """Return the number of reports per second processed by `function`, using the fastest of `repeat` runs."""
+    return count / min(timeit.repeat(function, number=1, repeat=repeat))
+
+def bytes_per_report(create, count):
+    """Return the number of bytes kept per report by the objects returned by `create`."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = create()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+def field_groups(reports, repeat):
+    """Return the time in microseconds per report spent splitting, tokenizing and decoding each field group."""
+    count = len(reports)
+    times = {}
+
+    times['split'] = min(timeit.repeat(lambda: [Metar.Report(raw, REFERENCE, lazy=True) for raw in reports], number=1, repeat=repeat))
+
+    lazy = [Metar.Report(raw, REFERENCE, lazy=True) for raw in reports]
+    times['tokenize'] = min(timeit.repeat(lambda: [report._tokenize() for report in lazy], number=1, repeat=repeat))
+
+    # Decoding a group again overwrites the same attributes, so the reports can be reused
+    for group in Metar.FIELD_GROUPS:
+        decode = [getattr(report, '_decode_' + group) for report in lazy]
+        times[group] = min(timeit.repeat(lambda: [function() for function in decode], number=1, repeat=repeat))
+
+    return {name: elapsed / count * 1e6 for name, elapsed in times.items()}
+
+def run(count, seed, repeat):
+    """Run all benchmarks and return the results."""
+    # Add a trailing space so every report holds its own stripped copy of the raw text, like reports read from a file
+    reports = [raw + ' ' for raw in corpus.generate(count, seed)]
+    parsed = [Metar.Report(raw, REFERENCE) for raw in reports]
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'count': count,
+        'seed': seed,
+        'results': {
+            'report': {
+                'reports_per_second': per_second(lambda: [Metar.Report(raw, REFERENCE) for raw in reports], count, repeat),
+                'bytes_per_report': bytes_per_report(lambda: [Metar.Report(raw, REFERENCE) for raw in reports], count),
+            },
+            'result': {
+                'reports_per_second': per_second(lambda: [report.result() for report in parsed], count, repeat),
+                'bytes_per_report': bytes_per_report(lambda: [report.result() for report in parsed], count),
+            },
+            'json': {
+                'reports_per_second': per_second(lambda: [report.json() for report in parsed], count, repeat),
+                'bytes_per_report': bytes_per_report(lambda: [report.json() for report in parsed], count),
+            },
+            'to_json': {
+                'reports_per_second': per_second(lambda: [Export.to_json(report) for report in parsed], count, repeat),
+                'bytes_per_report': bytes_per_report(lambda: [Export.to_json(report) for report in parsed], count),
+            },
+        },
+        'field_groups_us_per_report': field_groups(reports, repeat),
+    }
+
+def compare(results, baseline):
+    """Print the change of each result compared to a baseline."""
+    print('{:40s} {:>12s} {:>12s} {:>8s}'.format('', 'baseline', 'current', 'change'), file=sys.stderr)
+
+    rows = []
+    for name, values in results['results'].items():
+        for key, value in values.items():
+            rows.append(('{} {}'.format(name, key), baseline['results'].get(name, {}).get(key), value))
+    for name, value in results['field_groups_us_per_report'].items():
+        rows.append(('{} us/report'.format(name), baseline['field_groups_us_per_report'].get(name), value))
+
+    for name, old, new in rows:
+        if old:
+            print('{:40s} {:12.2f} {:12.2f} {:+7.1f}%'.format(name, old, new, (new / old - 1) * 100), file=sys.stderr)
+        else:
+            print('{:40s} {:>12s} {:12.2f}'.format(name, '-', new), file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000, help='number of reports in the corpus')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the corpus')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs, of which the fastest is used')
+    parser.add_argument('--output', help='write the results to this file instead of stdout')
+    parser.add_argument('--compare', help='results of an earlier run to compare with')
+    args = parser.parse_args()
+
+    results = run(args.count, args.seed, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=4)
+    else:
+        print(json.dumps(results, indent=4))
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+from datetime import timedelta
+
+# Columns of `Batch.parse_columns()` aggregated by default. Converted values are used, so that stations reporting in different units can be compared.
+VALUES = ('wind_direction', 'wind_speed_ms', 'wind_gust_ms', 'temperature', 'dew_point', 'altimeter_pressure_pa')
+
+def _seconds(interval):
+    """Return the length of an interval in whole seconds."""
+    if isinstance(interval, timedelta):
+        return int(interval.total_seconds())
+    return int(interval)
+
+def aggregate(columns, interval=timedelta(hours=1), values=None):
+    """Compute the minimum, maximum, mean and count of values per station and time bucket.
+
+    Works on the columns returned by `Batch.parse_columns()`, without a loop
+    over the reports. Missing values are left out, as are reports that could
+    not be parsed. The wind direction is left out for calm winds (speed 0)
+    and variable winds ('VRB'), and averaged as an angle (the mean of 350 and
+    10 degrees is 0). Requires NumPy.
+
+    Parameters
+    ----------
+    columns : dict
+      Columns returned by `Batch.parse_columns()`.
+    interval : timedelta or int
+      Length of the time buckets, or a number of seconds. Buckets start at multiples of the interval since 1970-01-01 UTC.
+    values : iterable of str, optional
+      Columns to aggregate. Defaults to the columns of `VALUES` that are
+      present, e.g. only the wind for `parse_columns(..., fields=['wind'])`.
+
+    Returns
+    -------
+    dict
+      Column name to array, with one row per station and bucket, ordered by
+      station and time: `ident`, `bucket` (start time, `datetime64` in UTC),
+      `reports` (number of reports) and `<value>_min`, `<value>_max`,
+      `<value>_mean` and `<value>_count` for each value. Only the mean and
+      count are returned for the wind direction. The statistics are masked
+      arrays, masked for buckets without values.
+    """
+    import numpy
+
+    step = _seconds(interval)
+    if step <= 0:
+        raise ValueError('interval must be positive')
+
+    if values is None:
+        values = [name for name in VALUES if name in columns]
+    else:
+        missing = [name for name in values if name not in columns]
+        if missing:
+            raise ValueError('Missing columns: {}'.format(', '.join(missing)))
+
+    valid = numpy.asarray(columns['parsed'], dtype=bool) & ~numpy.isnat(columns['observed'])
+    idents = numpy.asarray(columns['ident'])[valid]
+    seconds = columns['observed'][valid].astype('datetime64[s]').astype(numpy.int64)
+    buckets = seconds - seconds % step
+
+    # Number each station and bucket pair, in order of station and time
+    ident_names, ident_codes = numpy.unique(idents, return_inverse=True)
+    bucket_starts, bucket_codes = numpy.unique(buckets, return_inverse=True)
+    keys, groups = numpy.unique(ident_codes.astype(numpy.int64) * len(bucket_starts) + bucket_codes, return_inverse=True)
+    groups = groups.ravel()
+    count = len(keys)
+
+    result = {
+        'ident': ident_names[keys // max(len(bucket_starts), 1)],
+        'bucket': bucket_starts[keys % max(len(bucket_starts), 1)].astype('datetime64[s]'),
+        'reports': numpy.bincount(groups, minlength=count),
+    }
+
+    for name in values:
+        column = columns[name]
+        present = ~numpy.ma.getmaskarray(column)[valid]
+        data = numpy.ma.getdata(column)[valid].astype(numpy.float64)
+
+        if name == 'wind_direction':
+            present &= numpy.ma.getdata(columns['wind_speed'])[valid] != 0      # calm
+            present &= ~numpy.ma.getmaskarray(columns['wind_speed'])[valid]
+            result.update(_directions(numpy, data, present, groups, count))
+        else:
+            result.update(_statistics(numpy, name, data, present, groups, count))
+
+    return result
+
+def _statistics(numpy, name, data, present, groups, count):
+    """Return the minimum, maximum, mean and count of the present values of each group."""
+    groups = groups[present]
+    data = data[present]
+
+    counts = numpy.bincount(groups, minlength=count)
+    empty = counts == 0
+
+    minimum = numpy.full(count, numpy.inf)
+    maximum = numpy.full(count, -numpy.inf)
+    numpy.minimum.at(minimum, groups, data)
+    numpy.maximum.at(maximum, groups, data)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        mean = numpy.bincount(groups, weights=data, minlength=count) / counts
+
+    return {
+        name + '_min': numpy.ma.array(numpy.where(empty, 0, minimum), mask=empty),
+        name + '_max': numpy.ma.array(numpy.where(empty, 0, maximum), mask=empty),
+        name + '_mean': numpy.ma.array(numpy.where(empty, 0, mean), mask=empty),
+        name + '_count': counts,
+    }
+
+def _directions(numpy, data, present, groups, count):
+    """Return the mean direction (in degrees, 0-360) and count of the present directions of each group."""
+    groups = groups[present]
+    radians = numpy.radians(data[present])
+
+    counts = numpy.bincount(groups, minlength=count)
+    sines = numpy.bincount(groups, weights=numpy.sin(radians), minlength=count)
+    cosines = numpy.bincount(groups, weights=numpy.cos(radians), minlength=count)
+    mean = numpy.degrees(numpy.arctan2(sines, cosines)) % 360
+
+    # Opposite directions cancel out and have no mean
+    empty = (counts == 0) | (numpy.hypot(sines, cosines) < 1e-9 * numpy.maximum(counts, 1))
+
+    return {
+        'wind_direction_mean': numpy.ma.array(numpy.where(empty, 0, mean.round(6) % 360), mask=empty),
+        'wind_direction_count': counts,
+    }
@@ -0,0 +1,303 @@
+import mmap
+import struct
+from collections import namedtuple
+from datetime import datetime, timezone
+
+MAGIC = b'METARARC'
+VERSION = 1
+
+# File header: magic, version, record size
+HEADER = struct.Struct('<8sII')
+
+# Fixed width record of the decoded values of a report, little endian and aligned:
+# observed, raw offset, visibility in m, pressure in Pa, raw length, ident,
+# wind direction, wind speed, wind gust, temperature, dew point, flags
+RECORD = struct.Struct('<qQddI4shhhhhB5x')
+
+# Offset and length of the raw report in a record
+RAW_SPAN = struct.Struct('<8xQ16xI')
+
+# Values stored for missing values
+MISSING_TIME = -2 ** 63
+MISSING_INT = -2 ** 15
+
+# Bits of the flags
+PARSED = 1
+AUTO = 2
+COR = 4
+VARIABLE = 8                                    # variable wind direction ('VRB')
+MPS = 16                                        # wind speed in meters per second instead of knots
+LESS = 32                                       # visibility less than the value ('M1/4SM')
+
+# Column names and datatypes of a record, for NumPy
+DTYPE = [
+    ('observed', '<i8'),
+    ('raw_offset', '<u8'),
+    ('visibility_distance_m', '<f8'),
+    ('altimeter_pressure_pa', '<f8'),
+    ('raw_length', '<u4'),
+    ('ident', 'S4'),
+    ('wind_direction', '<i2'),
+    ('wind_speed', '<i2'),
+    ('wind_gust', '<i2'),
+    ('temperature', '<i2'),
+    ('dew_point', '<i2'),
+    ('flags', 'u1'),
+    ('padding', 'V5'),
+]
+
+Record = namedtuple('Record', [
+    'ident', 'observed', 'parsed', 'report_modifier',
+    'wind_direction', 'wind_speed', 'wind_speed_unit', 'wind_gust',
+    'temperature', 'dew_point', 'visibility_distance_m', 'visibility_less', 'altimeter_pressure_pa', 'raw',
+])
+
+def _int(value):
+    """Return an int value, or the missing value for None and strings ('VRB')."""
+    if value is None or value.__class__ is str:
+        return MISSING_INT
+    return value
+
+def _float(value):
+    """Return a float value, or NaN for None."""
+    if value is None:
+        return float('nan')
+    return value
+
+def _raw_path(path):
+    """Return the path of the side file with the raw reports of an archive."""
+    return '{}.raw'.format(path)
+
+
+class ArchiveWriter:
+    """Writes parsed reports to a binary archive.
+
+    The decoded values of each report are written as a fixed width record to
+    `path`, and the raw report to the side file `path + '.raw'`, one per line.
+
+    Example:
+
+        with ArchiveWriter('metars.arc') as writer:
+            writer.write_many(Batch.parse_many(open('metars.txt')))
+    """
+    def __init__(self, path, chunksize=1000):
+        """Create an archive, replacing an existing one.
+
+        Parameters
+        ----------
+        path : str or path
+          File to write the records to.
+        chunksize : int
+          Number of reports written to the files at once.
+        """
+        self.chunksize = chunksize
+        self.count = 0                          # number of reports written
+
+        self._records = open(path, 'wb')
+        self._raw = open(_raw_path(path), 'wb')
+        self._records.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+
+        self._offset = 0                        # offset of the next raw report in the side file
+        self._record_buffer = bytearray()
+        self._raw_buffer = []
+        self._pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, report):
+        """Write a report.
+
+        Parameters
+        ----------
+        report : Report or CompactReport
+          Parsed report.
+        """
+        raw = report.raw.encode('utf-8')
+        modifier = report.report_modifier
+        direction = report.wind_direction
+        distance = report.visibility_distance
+
+        flags = PARSED if report.parsed else 0
+        if modifier == 'AUTO':
+            flags |= AUTO
+        elif modifier == 'COR':
+            flags |= COR
+        if direction == 'VRB':
+            flags |= VARIABLE
+        if report.wind_speed_unit == 'mps':
+            flags |= MPS
+        if distance is not None and distance.__class__ is not str and distance < 0:
+            flags |= LESS
+
+        observed = report.observed
+        self._record_buffer += RECORD.pack(
+            MISSING_TIME if observed is None else int(observed.timestamp()),
+            self._offset,
+            _float(report.visibility_distance_m),
+            _float(report.altimeter_pressure_pa),
+            len(raw),
+            (report.ident or '').encode('ascii', 'replace'),
+            _int(direction),
+            _int(report.wind_speed),
+            _int(report.wind_gust),
+            _int(report.temperature),
+            _int(report.dew_point),
+            flags,
+        )
+        self._raw_buffer.append(raw)
+        self._offset += len(raw) + 1
+        self.count += 1
+
+        self._pending += 1
+        if self._pending >= self.chunksize:
+            self.flush()
+
+    def write_many(self, reports):
+        """Write many reports, see `write()`.
+
+        Parameters
+        ----------
+        reports : iterable of Report or CompactReport
+          Parsed reports.
+        """
+        for report in reports:
+            self.write(report)
+
+    def flush(self):
+        """Write the buffered reports to the files."""
+        self._records.write(self._record_buffer)
+        self._raw_buffer.append(b'')
+        self._raw.write(b'\n'.join(self._raw_buffer))
+        self._record_buffer = bytearray()
+        self._raw_buffer = []
+        self._pending = 0
+
+    def close(self):
+        """Write the buffered reports and close the files."""
+        if self._records.closed:
+            return
+        self.flush()
+        self._records.close()
+        self._raw.close()
+
+
+class Archive:
+    """Memory-mapped reader of a binary archive written by `ArchiveWriter`.
+
+    Records are read on access, by index, without loading the archive.
+
+    Example:
+
+        with Archive('metars.arc') as archive:
+            print(len(archive), archive[-1].wind_speed)
+            speeds = archive.columns()['wind_speed']   # NumPy view of the file
+    """
+    def __init__(self, path):
+        """Open an archive.
+
+        Parameters
+        ----------
+        path : str or path
+          File with the records.
+        """
+        with open(path, 'rb') as f:
+            self._records = self._map(f)
+
+        if len(self._records) < HEADER.size or HEADER.unpack_from(self._records, 0)[0] != MAGIC:
+            self.close()
+            raise ValueError('Not a METAR archive: {}'.format(path))
+        _, version, size = HEADER.unpack_from(self._records, 0)
+        if version != VERSION or size != RECORD.size:
+            self.close()
+            raise ValueError('Unsupported METAR archive version {}: {}'.format(version, path))
+
+        with open(_raw_path(path), 'rb') as f:
+            self._raw = self._map(f)
+
+        self._count = (len(self._records) - HEADER.size) // RECORD.size
+
+    @staticmethod
+    def _map(f):
+        """Map a file in memory. Empty files cannot be mapped, and are read as empty bytes."""
+        if not f.seek(0, 2):
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def _position(self, index):
+        """Return the position of a record in the file."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('archive index out of range')
+        return HEADER.size + index * RECORD.size
+
+    def __getitem__(self, index):
+        """Return the record of a report as a `Record`. Missing values are None."""
+        (observed, offset, distance, pressure, length, ident,
+         direction, speed, gust, temperature, dew_point, flags) = RECORD.unpack_from(self._records, self._position(index))
+
+        if flags & COR:
+            modifier = 'COR'
+        elif flags & AUTO:
+            modifier = 'AUTO'
+        else:
+            modifier = None
+
+        return Record(
+            ident=ident.rstrip(b'\x00').decode('ascii') or None,
+            observed=None if observed == MISSING_TIME else datetime.fromtimestamp(observed, timezone.utc),
+            parsed=bool(flags & PARSED),
+            report_modifier=modifier,
+            wind_direction='VRB' if flags & VARIABLE else (None if direction == MISSING_INT else direction),
+            wind_speed=None if speed == MISSING_INT else speed,
+            wind_speed_unit=None if speed == MISSING_INT else ('mps' if flags & MPS else 'kt'),
+            wind_gust=None if gust == MISSING_INT else gust,
+            temperature=None if temperature == MISSING_INT else temperature,
+            dew_point=None if dew_point == MISSING_INT else dew_point,
+            visibility_distance_m=None if distance != distance else distance,
+            visibility_less=bool(flags & LESS),
+            altimeter_pressure_pa=None if pressure != pressure else pressure,
+            raw=self._raw[offset:offset + length].decode('utf-8'),
+        )
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def raw(self, index):
+        """Return the raw report of a record."""
+        offset, length = RAW_SPAN.unpack_from(self._records, self._position(index))
+        return self._raw[offset:offset + length].decode('utf-8')
+
+    def records(self):
+        """Return all records as a NumPy structured array, a read-only view of the file without copying.
+
+        Missing values are `MISSING_TIME` and `MISSING_INT` for integers and NaN for floats. Requires NumPy.
+        """
+        import numpy
+
+        return numpy.frombuffer(self._records, dtype=numpy.dtype(DTYPE), count=self._count, offset=HEADER.size)
+
+    def columns(self):
+        """Return each column of the records as a read-only NumPy view of the file, see `records()`."""
+        records = self.records()
+        return {name: records[name] for name, _ in DTYPE if name != 'padding'}
+
+    def close(self):
+        """Close the archive. NumPy views of the archive must be released first."""
+        for mapped in (self._records, getattr(self, '_raw', None)):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
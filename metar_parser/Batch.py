@@ -0,0 +1,312 @@
+import os
+from array import array
+from collections import deque
+from itertools import islice
+from types import MappingProxyType
+
+from metar_parser.Metar import Report, CompactReport, FIELDS, FIELD_GROUPS, FIELD_ATTRIBUTES, SPEED_TO_MS, DISTANCE_TO_M, PRESSURE_TO_PA, projection, shared_decoders, utc_today, validate
+
+
+def _accepted(reports, rejected):
+    """Yield the reports that pass `validate()`. The other lines are passed to `rejected` with the reason, if given."""
+    for raw in reports:
+        reason = validate(raw)
+        if reason is None:
+            yield raw
+        elif rejected is not None:
+            rejected(raw, reason)
+
+def parse_many(reports, reference=None, lazy=False, fields=None, skip_invalid=False, rejected=None):
+    """Parse many METAR reports at once.
+
+    Returns the same reports as creating a `Report` per line, faster: the
+    reports of a batch share many tokens ('9999', 'NOSIG', 'Q1013') and date
+    and time groups, which are matched and decoded once for the whole batch,
+    see `shared_decoders()` and `benchmarks/bench_batch.py`.
+
+    Parameters
+    ----------
+    reports : iterable of str
+      Input METAR reports, one report per item.
+    reference : datetime, optional
+      Date used to fill in the year and month of the reports, see `Report`.
+    lazy : boolean
+      Decode the field groups of each report on first access.
+    fields : iterable of str, optional
+      Field groups to decode, see `Report`. All groups are decoded by default.
+    skip_invalid : boolean
+      Skip lines that are not METAR reports, see `validate()`, without creating a `Report` for them.
+    rejected : callable, optional
+      Called with each skipped line and the reason it was skipped. Implies `skip_invalid`.
+    """
+    if reference is None:
+        reference = utc_today()
+    if fields is not None:
+        fields = projection(fields)[0]
+    if skip_invalid or rejected is not None:
+        reports = _accepted(reports, rejected)
+
+    fullmatch, observed_at = shared_decoders()
+    new = Report.__new__
+    parse = Report._parse
+    parsed = []
+    for raw in reports:
+        report = new(Report)
+        parse(report, raw, reference, lazy, fields, fullmatch, observed_at)
+        parsed.append(report)
+    return parsed
+
+
+def _parse_chunk(reports, reference, fields=None):
+    """Parse a chunk of reports in a worker process, returning the values of each report as a plain tuple."""
+    if fields is None:
+        return [tuple(CompactReport.from_report(report)) for report in parse_many(reports, reference)]
+
+    # Values of the field groups that are not selected are None
+    selected = {'raw', 'ident'}.union(*[FIELD_GROUPS[group] for group in ('datetime',) + tuple(fields)])
+    names = [name if name in selected else None for name in FIELDS]
+    return [tuple([None if name is None else getattr(report, name) for name in names]) for report in parse_many(reports, reference, fields=fields)]
+
+def parse_parallel(reports, workers=None, chunksize=1000, ordered=True, reference=None, fields=None, skip_invalid=False, rejected=None):
+    """Parse many METAR reports in a pool of processes.
+
+    The reports are split into chunks which are parsed by the worker
+    processes. Only the decoded values are sent back, which are yielded as
+    `CompactReport` objects. At most two chunks per worker are pending at a
+    time, so memory use does not depend on the number of reports.
+
+    Parameters
+    ----------
+    reports : iterable of str
+      Input METAR reports, one report per item.
+    workers : int, optional
+      Number of worker processes. Defaults to the number of CPUs.
+    chunksize : int
+      Number of reports sent to a worker at once.
+    ordered : boolean
+      Yield the reports in input order. Otherwise chunks are yielded as soon as they are parsed.
+    reference : datetime, optional
+      Date used to fill in the year and month of the reports, see `Report`.
+    fields : iterable of str, optional
+      Field groups to decode, see `Report`. The values of the other groups are None.
+    skip_invalid : boolean
+      Skip lines that are not METAR reports, see `validate()`. Lines are checked before they are sent to the workers.
+    rejected : callable, optional
+      Called with each skipped line and the reason it was skipped. Implies `skip_invalid`.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if fields is not None:
+        fields = projection(fields)[0]
+    if skip_invalid or rejected is not None:
+        reports = _accepted(reports, rejected)
+
+    with ProcessPoolExecutor(workers) as executor:
+        for chunk in _pooled(executor, workers, _parse_chunk, reports, chunksize, ordered, reference, fields):
+            for values in chunk:
+                yield CompactReport(values)
+
+def parse_threaded(reports, workers=None, chunksize=1000, ordered=True, reference=None, lazy=False, fields=None, skip_invalid=False, rejected=None):
+    """Parse many METAR reports in a pool of threads.
+
+    Works like `parse_parallel()`, but the chunks are parsed by `parse_many()`
+    in threads and the `Report` objects are yielded as they are, without
+    copying values between processes. Parsing a report shares no mutable
+    state with other threads. Threads only run in parallel on free-threaded
+    Python builds; with the GIL they parse one at a time, and
+    `parse_parallel()` is the way to use multiple cores.
+
+    Parameters
+    ----------
+    reports : iterable of str
+      Input METAR reports, one report per item.
+    workers : int, optional
+      Number of threads. Defaults to the number of CPUs.
+    chunksize : int
+      Number of reports parsed by a thread at once.
+    ordered : boolean
+      Yield the reports in input order. Otherwise chunks are yielded as soon as they are parsed.
+    reference : datetime, optional
+      Date used to fill in the year and month of the reports, see `Report`.
+    lazy : boolean
+      Decode the field groups of each report on first access.
+    fields : iterable of str, optional
+      Field groups to decode, see `Report`. All groups are decoded by default.
+    skip_invalid : boolean
+      Skip lines that are not METAR reports, see `validate()`. Lines are checked before they are sent to the threads.
+    rejected : callable, optional
+      Called with each skipped line and the reason it was skipped. Implies `skip_invalid`.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if fields is not None:
+        fields = projection(fields)[0]
+    if skip_invalid or rejected is not None:
+        reports = _accepted(reports, rejected)
+
+    with ThreadPoolExecutor(workers) as executor:
+        for chunk in _pooled(executor, workers, parse_many, reports, chunksize, ordered, reference, lazy, fields):
+            yield from chunk
+
+def _pooled(executor, workers, parse, reports, chunksize, ordered, *args):
+    """Yield the result of `parse(chunk, *args)` for each chunk of reports, parsed in an executor.
+
+    At most two chunks per worker are pending at a time.
+    """
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    reports = iter(reports)
+    pending = deque()
+
+    while True:
+        chunk = list(islice(reports, chunksize))
+        if chunk:
+            pending.append(executor.submit(parse, chunk, *args))
+
+        if not pending:
+            break
+
+        if chunk and len(pending) < 2 * workers:
+            continue
+
+        if ordered:
+            done = [pending.popleft()]
+        else:
+            done = wait(pending, return_when=FIRST_COMPLETED).done
+            for future in done:
+                pending.remove(future)
+
+        for future in done:
+            yield future.result()
+
+
+class _ColumnReport(Report):
+    """Report reused for every line by `parse_columns`, which converts units per column instead."""
+    def _convert(self, value, unit, constants):
+        return None
+
+
+# Numeric columns returned by `parse_columns` and their datatype
+NUMERIC_COLUMNS = MappingProxyType({
+    'wind_direction': 'int16',
+    'wind_speed': 'int16',
+    'wind_gust': 'int16',
+    'temperature': 'int16',
+    'dew_point': 'int16',
+    'visibility_distance': 'float64',
+    'altimeter_pressure': 'float64',
+})
+
+# String columns returned by `parse_columns` and their datatype
+STRING_COLUMNS = MappingProxyType({
+    'ident': 'U4',
+    'report_modifier': 'U4',
+    'wind_speed_unit': 'U3',
+    'visibility_distance_unit': 'U2',
+    'altimeter_pressure_unit': 'U4',
+})
+
+# Field groups with values in the columns, decoded by `parse_columns` by default
+COLUMN_GROUPS = frozenset(FIELD_ATTRIBUTES[name] for name in list(NUMERIC_COLUMNS) + list(STRING_COLUMNS) if name != 'ident')
+
+def parse_columns(reports, reference=None, fields=None, skip_invalid=False, rejected=None):
+    """Parse many METAR reports into NumPy columns.
+
+    Values are decoded straight into typed columns, without keeping a `Report`
+    per line. Numeric columns are masked arrays, masked where a value is
+    missing, and `observed` is a `datetime64` column in UTC. The converted
+    values (`wind_speed_ms`, `wind_gust_ms`, `visibility_distance_m`,
+    `altimeter_pressure_pa`) are computed per column. Requires NumPy.
+
+    Parameters
+    ----------
+    reports : iterable of str
+      Input METAR reports, one report per item.
+    reference : datetime, optional
+      Date used to fill in the year and month of the reports, see `Report`.
+    fields : iterable of str, optional
+      Field groups to decode, see `Report`. Only the columns of these groups are returned.
+      Defaults to the groups with columns, `COLUMN_GROUPS`.
+    skip_invalid : boolean
+      Skip lines that are not METAR reports, see `validate()`. Skipped lines have no row.
+    rejected : callable, optional
+      Called with each skipped line and the reason it was skipped. Implies `skip_invalid`.
+
+    Returns
+    -------
+    dict
+      Column name to array, with one row per report.
+    """
+    import numpy
+
+    numeric_columns = NUMERIC_COLUMNS
+    string_columns = STRING_COLUMNS
+    if fields is None:
+        # Skip the groups without columns, such as the clouds and remarks
+        fields = COLUMN_GROUPS
+    else:
+        fields = projection(fields)[0]
+        numeric_columns = {name: dtype for name, dtype in NUMERIC_COLUMNS.items() if FIELD_ATTRIBUTES[name] in fields}
+        string_columns = {name: dtype for name, dtype in STRING_COLUMNS.items() if name == 'ident' or FIELD_ATTRIBUTES[name] in fields}
+    if skip_invalid or rejected is not None:
+        reports = _accepted(reports, rejected)
+
+    nan = float('nan')
+    nat = numpy.iinfo(numpy.int64).min
+    parsed = array('b')
+    observed = array('q')
+    numbers = {name: array('d') for name in numeric_columns}
+    strings = {name: [] for name in string_columns}
+
+    if reference is None:
+        reference = utc_today()
+    fullmatch, observed_at = shared_decoders()
+    report = _ColumnReport.__new__(_ColumnReport)
+    for raw in reports:
+        report._parse(raw, reference, False, fields, fullmatch, observed_at)
+
+        parsed.append(report.parsed)
+        observed.append(nat if report.observed is None else int(report.observed.timestamp()))
+
+        for name, column in numbers.items():
+            value = getattr(report, name)
+            column.append(nan if value is None or value.__class__ is str else value)    # 'VRB' has no direction
+
+        for name, column in strings.items():
+            value = getattr(report, name)
+            column.append('' if value is None else value)
+
+    columns = {
+        'parsed': numpy.asarray(parsed).astype(bool),
+        'observed': numpy.asarray(observed).astype('datetime64[s]'),
+    }
+
+    for name, dtype in string_columns.items():
+        columns[name] = numpy.array(strings[name], dtype=dtype)
+
+    for name, dtype in numeric_columns.items():
+        values = numpy.asarray(numbers[name])
+        missing = numpy.isnan(values)
+        columns[name] = numpy.ma.array(numpy.where(missing, 0, values).astype(dtype), mask=missing)
+
+    if 'wind_speed' in columns:
+        speed_to_ms = _factors(numpy, columns['wind_speed_unit'], SPEED_TO_MS)
+        columns['wind_speed_ms'] = columns['wind_speed'] * speed_to_ms
+        columns['wind_gust_ms'] = columns['wind_gust'] * speed_to_ms
+    if 'visibility_distance' in columns:
+        columns['visibility_distance_m'] = abs(columns['visibility_distance']) * _factors(numpy, columns['visibility_distance_unit'], DISTANCE_TO_M)
+    if 'altimeter_pressure' in columns:
+        columns['altimeter_pressure_pa'] = columns['altimeter_pressure'] * _factors(numpy, columns['altimeter_pressure_unit'], PRESSURE_TO_PA)
+
+    return columns
+
+def _factors(numpy, units, constants):
+    """Return the conversion constant for each unit in a column, masked for unknown units."""
+    factors = numpy.ma.masked_all(units.shape, dtype=numpy.float64)
+    for unit, constant in constants.items():
+        factors[units == unit] = constant
+    return factors
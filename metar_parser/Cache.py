@@ -0,0 +1,86 @@
+import sys
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+from metar_parser.Metar import Report, CompactReport
+
+
+class ReportCache:
+    """A bounded least recently used cache of parsed METAR reports, keyed on the raw report.
+
+    Feeds often deliver the same report every poll until a new observation is
+    made. Parsing such a report again returns the cached result.
+    """
+    def __init__(self, maxsize=10000, ttl=None, reference=None):
+        """Create an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int
+          Maximum number of reports kept. The least recently used report is removed first.
+        ttl : float, optional
+          Number of seconds a report is kept. Reports are kept until removed by default.
+        reference : date or datetime, optional
+          Date used to fill in the year and month of the reports, see `Report`.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.reference = reference
+
+        self.hits = 0                           # number of reports found in the cache
+        self.misses = 0                         # number of reports parsed
+
+        self._reports = OrderedDict()           # raw report to (expiry time, compact report)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._reports)
+
+    def parse(self, raw):
+        """Return the parsed report as an immutable `CompactReport`.
+
+        Parameters
+        ----------
+        raw : str
+          Input METAR report.
+        """
+        now = monotonic()
+
+        with self._lock:
+            entry = self._reports.get(raw)
+            if entry is not None and (entry[0] is None or entry[0] > now):
+                self._reports.move_to_end(raw)
+                self.hits += 1
+                return entry[1]
+
+        report = Report(raw, self.reference)
+        if report.ident is not None:
+            report.ident = sys.intern(report.ident)
+        compact = CompactReport.from_report(report)
+
+        with self._lock:
+            self.misses += 1
+            self._reports[raw] = (None if self.ttl is None else now + self.ttl, compact)
+            self._reports.move_to_end(raw)
+            while len(self._reports) > self.maxsize:
+                self._reports.popitem(last=False)
+
+        return compact
+
+    def parse_many(self, reports):
+        """Return a list of parsed reports, see `parse()`.
+
+        Parameters
+        ----------
+        reports : iterable of str
+          Input METAR reports, one report per item.
+        """
+        return [self.parse(raw) for raw in reports]
+
+    def clear(self):
+        """Remove all reports and reset the counters."""
+        with self._lock:
+            self._reports.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,156 @@
+from operator import attrgetter
+
+from metar_parser.Metar import Report, RESULT_FORMS
+from metar_parser.Export import RESULT_SCHEMA, project_schema
+
+
+def _plan(schema):
+    """Return (key, keys of the section or None, getter of the values, converters or None) for each compared key of a schema.
+
+    The converters are those of `RESULT_FORMS`, one per value of a section, or None if all values are stored as is.
+    """
+    plan = []
+    for key, value in schema:
+        if key in ('raw', 'ident'):
+            continue
+        if isinstance(value, str):
+            plan.append((key, None, attrgetter(value), RESULT_FORMS.get(value)))
+        else:
+            forms = tuple(RESULT_FORMS.get(attribute) for _, attribute in value)
+            plan.append((key, tuple(name for name, _ in value), attrgetter(*[attribute for _, attribute in value]), forms if any(forms) else None))
+    return plan
+
+def _converted(keys, forms, values):
+    """Return a value, or the values of a section as a dict, in the form of `result()`."""
+    if keys is None:
+        return values if forms is None else forms(values)
+    if forms is None:
+        return dict(zip(keys, values))
+    return {name: value if form is None else form(value) for name, form, value in zip(keys, forms, values)}
+
+PLAN = _plan(RESULT_SCHEMA)
+
+# Selected field groups to the plan of a projection, filled on first use like `Export._plans`
+_plans = {None: PLAN}
+
+def diff(previous, report):
+    """Return the values of `report.result()` that differ from `previous.result()`, without building either dict.
+
+    Values are grouped like `result()`: a changed wind speed is returned as
+    {'wind': {'speed': 20}}. The raw report and identifier are not compared.
+    Only the field groups selected for `report` are compared, see `Report`.
+
+    Parameters
+    ----------
+    previous : Report or CompactReport or None
+      Earlier report of the same station. If None, all values are returned.
+    report : Report or CompactReport
+      New report.
+    """
+    fields = report._fields
+    plan = _plans.get(fields)
+    if plan is None:
+        plan = _plans[fields] = _plan(project_schema(fields))
+
+    changes = {}
+    for key, keys, values, forms in plan:
+        new = values(report)
+        if previous is None:
+            changes[key] = _converted(keys, forms, new)
+            continue
+
+        old = values(previous)
+        if new == old:
+            continue
+        if keys is None:
+            changes[key] = _converted(keys, forms, new)
+        else:
+            converted = _converted(keys, forms, new)
+            changes[key] = {name: converted[name] for name, before, value in zip(keys, old, new) if before != value}
+    return changes
+
+
+class ReportDiffer:
+    """Compares each report with the previous report of the same station, and returns only what changed.
+
+    Example:
+
+        differ = ReportDiffer()
+        for raw in feed:
+            delta = differ.parse(raw)
+            if delta is not None:
+                print(delta)    # {'ident': 'EHAM', 'time': '08:55', 'wind': {'speed': 20}, ...}
+    """
+    def __init__(self, reference=None):
+        """Create a differ without previous reports.
+
+        Parameters
+        ----------
+        reference : date or datetime, optional
+          Date used to fill in the year and month of the reports parsed by `parse()`, see `Report`.
+        """
+        self.reference = reference
+
+        self._previous = {}                     # station to its previous report
+
+    def __len__(self):
+        return len(self._previous)
+
+    def update(self, report):
+        """Return the changes since the previous report of the same station, and remember the report.
+
+        The changes are returned as a dict with the station identifier and the
+        changed values, see `diff()`. All values are returned for the first
+        report of a station. Returns None if the raw report is equal to the
+        previous one, if no value changed, or if the report has no identifier.
+
+        Parameters
+        ----------
+        report : Report or CompactReport
+          Parsed report.
+        """
+        if report.ident is None:
+            return None
+
+        previous = self._previous.get(report.ident)
+        if previous is not None and previous.raw == report.raw:
+            return None
+        self._previous[report.ident] = report
+
+        changes = diff(previous, report)
+        if not changes:
+            return None
+        return dict(ident=report.ident, **changes)
+
+    def parse(self, raw):
+        """Parse a report and return the changes, see `update()`.
+
+        A report equal to the previous report of its station is not parsed again.
+
+        Parameters
+        ----------
+        raw : str
+          Input METAR report.
+        """
+        raw = raw.strip()
+        previous = self._previous.get(raw[:4])
+        if previous is not None and previous.raw == raw:
+            return None
+        return self.update(Report(raw, self.reference))
+
+    def update_many(self, reports):
+        """Yield the changes of each report that has changes, see `update()`.
+
+        Parameters
+        ----------
+        reports : iterable of Report or CompactReport
+          Parsed reports, ordered by observation time per station.
+        """
+        for report in reports:
+            changes = self.update(report)
+            if changes is not None:
+                yield changes
+
+    def reset(self):
+        """Forget all previous reports."""
+        self._previous.clear()
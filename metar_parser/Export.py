@@ -0,0 +1,367 @@
+import csv
+from json.encoder import encode_basestring_ascii   # C implementation when available
+from operator import attrgetter
+from types import MappingProxyType
+
+from metar_parser.Metar import SECTIONS, WeatherGroup, CloudLayer, projection
+
+# Keys of `Report.result()` in order, with the attribute holding each value or the keys of a section
+RESULT_SCHEMA = [
+    ('raw', 'raw'),
+    ('parsed', 'parsed'),
+    ('ident', 'ident'),
+    ('reported', 'reported'),
+    ('date', 'date'),
+    ('time', 'time'),
+    ('report_modifier', 'report_modifier'),
+    ('wind', [
+        ('direction', 'wind_direction'),
+        ('speed', 'wind_speed'),
+        ('speed_unit', 'wind_speed_unit'),
+        ('gust', 'wind_gust'),
+        ('variable_directions', 'wind_variable_directions'),
+        ('speed_ms', 'wind_speed_ms'),
+        ('gust_ms', 'wind_gust_ms'),
+    ]),
+    ('temperatures', [
+        ('temperature', 'temperature'),
+        ('dew_point', 'dew_point'),
+    ]),
+    ('visibility', [
+        ('distance', 'visibility_distance'),
+        ('distance_unit', 'visibility_distance_unit'),
+        ('distance_m', 'visibility_distance_m'),
+        ('distance_str', 'visibility_distance_str'),
+    ]),
+    ('present_weather', 'present_weather'),
+    ('clouds', [
+        ('layers', 'cloud_layers'),
+        ('sky_condition', 'sky_condition'),
+    ]),
+    ('altimeter', [
+        ('pressure', 'altimeter_pressure'),
+        ('pressure_unit', 'altimeter_pressure_unit'),
+        ('pressure_pa', 'altimeter_pressure_pa'),
+    ]),
+    ('remarks', [
+        ('text', 'remarks_text'),
+        ('station_type', 'station_type'),
+        ('temperature', 'remarks_temperature'),
+        ('dew_point', 'remarks_dew_point'),
+        ('sea_level_pressure', 'sea_level_pressure'),
+        ('sea_level_pressure_pa', 'sea_level_pressure_pa'),
+        ('precipitation', 'precipitation'),
+        ('precipitation_mm', 'precipitation_mm'),
+    ]),
+]
+
+def _fragments(schema):
+    """Flatten a schema to a list of (JSON text before the value, attribute) and the JSON text after the last value."""
+    fragments = []
+    text = '{'
+    for index, (key, value) in enumerate(schema):
+        if index:
+            text += ', '
+        text += encode_basestring_ascii(key) + ': '
+
+        if isinstance(value, str):
+            fragments.append((text, value))
+            text = ''
+        else:
+            nested, end = _fragments(value)
+            nested[0] = (text + nested[0][0], nested[0][1])
+            fragments.extend(nested)
+            text = end
+    return fragments, text + '}'
+
+FRAGMENTS, END = _fragments(RESULT_SCHEMA)
+_TEXTS = [text for text, _ in FRAGMENTS]
+_VALUES = attrgetter(*[attribute for _, attribute in FRAGMENTS])
+
+def project_schema(fields):
+    """Return the part of `RESULT_SCHEMA` in the result of a report with only the selected field groups."""
+    excluded = {key for group, key in SECTIONS.items() if group not in fields}
+    return [(key, value) for key, value in RESULT_SCHEMA if key not in excluded]
+
+# Selected field groups to the JSON texts, the getter of the values and the JSON text after the last value.
+# Threads that compile the same plan at once store equal plans, so the cache needs no lock.
+_plans = {None: (_TEXTS, _VALUES, END)}
+
+def _plan(fields):
+    """Return the JSON texts, the getter of the values and the end text of a projection, compiled once."""
+    plan = _plans.get(fields)
+    if plan is None:
+        fragments, end = _fragments(project_schema(fields))
+        plan = _plans[fields] = ([text for text, _ in fragments], attrgetter(*[attribute for _, attribute in fragments]), end)
+    return plan
+
+def _encode_float(value):
+    """Encode a float like `json.dumps()`."""
+    if value != value:
+        return 'NaN'
+    if value == float('inf'):
+        return 'Infinity'
+    if value == -float('inf'):
+        return '-Infinity'
+    return float.__repr__(value)
+
+def _encode_list(value):
+    return '[' + ', '.join([ENCODERS[item.__class__](item) for item in value]) + ']'
+
+def _encode_dict(value):
+    return '{' + ', '.join([encode_basestring_ascii(key) + ': ' + ENCODERS[item.__class__](item) for key, item in value.items()]) + '}'
+
+def _encode_record(value):
+    """Encode a named tuple as an object with its fields as keys, like the dicts of `result()`."""
+    return '{' + ', '.join([encode_basestring_ascii(key) + ': ' + ENCODERS[item.__class__](item) for key, item in zip(value._fields, value)]) + '}'
+
+# JSON encoder for each type of value in a report
+ENCODERS = MappingProxyType({
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: 'null',
+    list: _encode_list,
+    tuple: _encode_list,
+    dict: _encode_dict,
+    WeatherGroup: _encode_record,
+    CloudLayer: _encode_record,
+})
+
+def _encode(report, plan):
+    """Return a report as JSON following a plan of `_plan()`."""
+    texts, values, end = plan
+    encoders = ENCODERS
+    return ''.join([text + encoders[value.__class__](value) for text, value in zip(texts, values(report))]) + end
+
+def to_json(report):
+    """Return a report as JSON, equal to `report.json()` but without building the `result()` dict.
+
+    Parameters
+    ----------
+    report : Report or CompactReport
+      Parsed report.
+    """
+    return _encode(report, _plan(report._fields))
+
+def write_ndjson(reports, fp, chunksize=1000, fields=None):
+    """Write reports as newline delimited JSON, one `report.json()` per line.
+
+    Parameters
+    ----------
+    reports : iterable of Report or CompactReport
+      Parsed reports.
+    fp : file object
+      Text file to write to.
+    chunksize : int
+      Number of reports written to the file at once.
+    fields : iterable of str, optional
+      Field groups written, see `Report`. Defaults to the groups selected for
+      each report, which is all groups for a `CompactReport`.
+    """
+    plan = None if fields is None else _plan(projection(fields)[0])
+    lines = []
+    for report in reports:
+        lines.append(_encode(report, plan or _plan(report._fields)))
+        if len(lines) >= chunksize:
+            lines.append('')
+            fp.write('\n'.join(lines))
+            lines = []
+
+    if lines:
+        lines.append('')
+        fp.write('\n'.join(lines))
+
+def write_json_array(reports, fp, chunksize=1000):
+    """Write reports as a JSON array, equal to `json.dumps([report.result() for report in reports])`.
+
+    Parameters
+    ----------
+    reports : iterable of Report or CompactReport
+      Parsed reports.
+    fp : file object
+      Text file to write to.
+    chunksize : int
+      Number of reports written to the file at once.
+    """
+    fp.write('[')
+    separator = ''
+    lines = []
+    for report in reports:
+        lines.append(to_json(report))
+        if len(lines) >= chunksize:
+            fp.write(separator + ', '.join(lines))
+            separator = ', '
+            lines = []
+
+    if lines:
+        fp.write(separator + ', '.join(lines))
+    fp.write(']')
+
+# Datatype of each flat column, following the output format in the README. Values that are an int
+# or a float are floats, the wind direction (degrees or 'VRB') is a string, and the lists are
+# 'directions' (ints), 'weather' and 'clouds' (objects). CSV files have the lists as JSON.
+COLUMN_TYPES = MappingProxyType({
+    'raw': 'string',
+    'parsed': 'bool',
+    'ident': 'string',
+    'reported': 'string',
+    'date': 'string',
+    'time': 'string',
+    'report_modifier': 'string',
+    'wind_direction': 'string',
+    'wind_speed': 'int',
+    'wind_speed_unit': 'string',
+    'wind_gust': 'int',
+    'wind_variable_directions': 'directions',
+    'wind_speed_ms': 'float',
+    'wind_gust_ms': 'float',
+    'temperature': 'int',
+    'dew_point': 'int',
+    'visibility_distance': 'float',
+    'visibility_distance_unit': 'string',
+    'visibility_distance_m': 'float',
+    'visibility_distance_str': 'string',
+    'present_weather': 'weather',
+    'cloud_layers': 'clouds',
+    'sky_condition': 'string',
+    'altimeter_pressure': 'float',
+    'altimeter_pressure_unit': 'string',
+    'altimeter_pressure_pa': 'float',
+    'remarks_text': 'string',
+    'station_type': 'string',
+    'remarks_temperature': 'float',
+    'remarks_dew_point': 'float',
+    'sea_level_pressure': 'float',
+    'sea_level_pressure_pa': 'float',
+    'precipitation': 'float',
+    'precipitation_mm': 'float',
+})
+
+def flat_columns(fields=None):
+    """Return the names of the columns written by `write_csv()` and `write_parquet()`, the attributes holding the values of `result()`.
+
+    Parameters
+    ----------
+    fields : iterable of str, optional
+      Field groups, see `Report`. All groups by default.
+    """
+    schema = RESULT_SCHEMA if fields is None else project_schema(projection(fields)[0])
+    return [attribute for _, attribute in _fragments(schema)[0]]
+
+def write_csv(reports, fp, fields=None, chunksize=1000):
+    """Write reports as CSV with a header, one row per report and one column per value of `result()`.
+
+    The columns are named after the report attributes, see `flat_columns()`.
+    Missing values are empty and lists are written as JSON, see `COLUMN_TYPES`.
+
+    Parameters
+    ----------
+    reports : iterable of Report or CompactReport
+      Parsed reports.
+    fp : file object
+      Text file to write to, opened with `newline=''`.
+    fields : iterable of str, optional
+      Field groups written, see `Report`. All groups by default.
+    chunksize : int
+      Number of reports written to the file at once.
+    """
+    columns = flat_columns(fields)
+    values = attrgetter(*columns)
+    lists = [index for index, name in enumerate(columns) if COLUMN_TYPES[name] in ('directions', 'weather', 'clouds')]
+
+    writer = csv.writer(fp, lineterminator='\n')
+    writer.writerow(columns)
+
+    rows = []
+    for report in reports:
+        row = list(values(report))
+        for index in lists:
+            value = row[index]
+            if value is not None:
+                row[index] = _encode_list(value)
+        rows.append(row)
+        if len(rows) >= chunksize:
+            writer.writerows(rows)
+            rows = []
+
+    if rows:
+        writer.writerows(rows)
+
+def parquet_schema(fields=None):
+    """Return the Arrow schema of the Parquet files written by `write_parquet()`. Requires pyarrow.
+
+    Parameters
+    ----------
+    fields : iterable of str, optional
+      Field groups, see `Report`. All groups by default.
+    """
+    import pyarrow
+
+    types = {
+        'string': pyarrow.string(),
+        'bool': pyarrow.bool_(),
+        'int': pyarrow.int32(),
+        'float': pyarrow.float64(),
+        'directions': pyarrow.list_(pyarrow.int32()),
+        'weather': pyarrow.list_(pyarrow.struct([
+            ('intensity', pyarrow.string()),
+            ('descriptor', pyarrow.string()),
+            ('phenomena', pyarrow.list_(pyarrow.string())),
+        ])),
+        'clouds': pyarrow.list_(pyarrow.struct([
+            ('cover', pyarrow.string()),
+            ('height', pyarrow.int32()),
+            ('height_m', pyarrow.float64()),
+            ('type', pyarrow.string()),
+        ])),
+    }
+    return pyarrow.schema([(column, types[COLUMN_TYPES[column]]) for column in flat_columns(fields)])
+
+def _row_group(pyarrow, schema, rows):
+    """Return a table of rows of values, in the order of the schema."""
+    columns = [list(column) for column in zip(*rows)]
+    if 'wind_direction' in schema.names:
+        directions = columns[schema.get_field_index('wind_direction')]
+        directions[:] = [None if direction is None else str(direction) for direction in directions]
+    return pyarrow.Table.from_arrays([pyarrow.array(column, type=field.type) for column, field in zip(columns, schema)], schema=schema)
+
+def write_parquet(reports, path, fields=None, row_group_size=10000, compression='snappy'):
+    """Write reports as a Parquet file, one row per report and one column per value of `result()`. Requires pyarrow.
+
+    The columns are those of `write_csv()`, with the datatypes of
+    `COLUMN_TYPES`: ints are 32 bit, floats 64 bit, and the cloud layers and
+    present weather are lists of structs. Missing values are null. Reports
+    are written one row group at a time, so memory use depends on the row
+    group size and not on the number of reports.
+
+    Parameters
+    ----------
+    reports : iterable of Report or CompactReport
+      Parsed reports.
+    path : str or path
+      File to write to.
+    fields : iterable of str, optional
+      Field groups written, see `Report`. All groups by default.
+    row_group_size : int
+      Number of reports per row group.
+    compression : str
+      Compression of the columns, see `pyarrow.parquet.ParquetWriter`.
+    """
+    import pyarrow
+    import pyarrow.parquet
+
+    schema = parquet_schema(fields)
+    values = attrgetter(*schema.names)
+
+    with pyarrow.parquet.ParquetWriter(path, schema, compression=compression) as writer:
+        rows = []
+        for report in reports:
+            rows.append(values(report))
+            if len(rows) >= row_group_size:
+                writer.write_table(_row_group(pyarrow, schema, rows))
+                rows = []
+
+        if rows:
+            writer.write_table(_row_group(pyarrow, schema, rows))
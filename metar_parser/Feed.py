@@ -0,0 +1,165 @@
+import asyncio
+from collections import deque
+from time import monotonic
+
+from metar_parser.Batch import parse_many
+from metar_parser.Metar import projection, validate
+
+
+class FeedParser:
+    """Asynchronous iterator over the METAR reports received on asyncio streams.
+
+    Each line read from the streams is one report. Lines are collected in a
+    bounded queue and parsed in batches in an executor, off the event loop.
+    When the queue is full, reading stops until the reports are consumed, so a
+    slow consumer slows down the senders instead of using more memory.
+
+    Example:
+
+        reader, writer = await asyncio.open_connection('localhost', 8000)
+        async for report in FeedParser(reader):
+            print(report.get_ident())
+    """
+    def __init__(self, *readers, batch_size=100, queue_size=1000, executor=None, reference=None, lazy=False, fields=None, skip_invalid=False, rejected=None):
+        """Create a parser reading from one or more streams.
+
+        Parameters
+        ----------
+        readers : asyncio.StreamReader
+          Streams to read reports from, one report per line.
+        batch_size : int
+          Maximum number of reports parsed at once.
+        queue_size : int
+          Maximum number of reports waiting to be parsed.
+        executor : concurrent.futures.Executor, optional
+          Executor in which the reports are parsed. Defaults to the default executor of the event loop.
+        reference : date or datetime, optional
+          Date used to fill in the year and month of the reports, see `Report`.
+        lazy : boolean
+          Decode the field groups of each report on first access.
+        fields : iterable of str, optional
+          Field groups to decode, see `Report`. All groups are decoded by default.
+        skip_invalid : boolean
+          Skip lines that are not METAR reports, see `validate()`. Lines are checked before they are queued.
+        rejected : callable, optional
+          Called with each skipped line and the reason it was skipped. Implies `skip_invalid`.
+        """
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.executor = executor
+        self.reference = reference
+        self.lazy = lazy
+        self.fields = None if fields is None else projection(fields)[0]
+        self.skip_invalid = skip_invalid or rejected is not None
+        self.rejected = rejected
+
+        self.reports = 0                        # number of reports returned
+        self.skipped = 0                        # number of lines skipped by `skip_invalid`
+
+        self._readers = readers
+        self._lines = None                      # raw reports waiting to be parsed, None when a stream has ended
+        self._batches = None                    # parsed batches, None when all streams have ended
+        self._batch = deque()                   # reports of the current batch not returned yet
+        self._tasks = []
+        self._started = None
+        self._done = False
+        self._error = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._batches is None:
+            self._start()
+
+        while not self._batch:
+            if self._done:
+                raise StopAsyncIteration
+
+            batch = await self._batches.get()
+            if batch is None:
+                self._done = True
+                if self._error is not None:
+                    raise self._error
+                raise StopAsyncIteration
+            self._batch.extend(batch)
+
+        self.reports += 1
+        return self._batch.popleft()
+
+    def _start(self):
+        """Start reading and parsing in the running event loop."""
+        self._started = monotonic()
+        self._lines = asyncio.Queue(self.queue_size)
+        self._batches = asyncio.Queue(2)
+        self._tasks = [asyncio.ensure_future(self._read(reader)) for reader in self._readers]
+        self._tasks.append(asyncio.ensure_future(self._parse()))
+
+    async def _read(self, reader):
+        """Put the lines of a stream in the queue, followed by None."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                line = line.decode('latin-1').strip().rstrip('=')
+                if not line:
+                    continue
+
+                if self.skip_invalid:
+                    reason = validate(line)
+                    if reason is not None:
+                        self.skipped += 1
+                        if self.rejected is not None:
+                            self.rejected(line, reason)
+                        continue
+
+                await self._lines.put(line)
+        except Exception as e:
+            self._error = e
+        await self._lines.put(None)
+
+    async def _parse(self):
+        """Parse the lines in the queue in batches until all streams have ended."""
+        loop = asyncio.get_running_loop()
+        readers = len(self._readers)
+
+        try:
+            while readers:
+                batch = []
+                line = await self._lines.get()
+                while True:
+                    if line is None:
+                        readers -= 1
+                    else:
+                        batch.append(line)
+
+                    if len(batch) >= self.batch_size or self._lines.empty():
+                        break
+                    line = self._lines.get_nowait()
+
+                if batch:
+                    reports = await loop.run_in_executor(self.executor, parse_many, batch, self.reference, self.lazy, self.fields)
+                    await self._batches.put(reports)
+        except Exception as e:
+            self._error = e
+        await self._batches.put(None)
+
+    def stats(self):
+        """Return the number of reports returned and lines skipped, the throughput since the first report was requested and the queue depth."""
+        elapsed = 0 if self._started is None else monotonic() - self._started
+        return {
+            'reports': self.reports,
+            'skipped': self.skipped,
+            'reports_per_second': self.reports / elapsed if elapsed else 0,
+            'queue_depth': 0 if self._lines is None else self._lines.qsize(),
+            'queue_size': self.queue_size,
+        }
+
+    async def aclose(self):
+        """Stop reading and parsing."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._done = True
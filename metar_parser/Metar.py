@@ -1,247 +1,479 @@
 import re
-from datetime import datetime
-import json
-from fractions import Fraction
-
-SPEED_TO_MS = {
+from collections import namedtuple
+from functools import lru_cache
+from datetime import datetime, timezone
+from time import time as _now
+from operator import itemgetter
+from types import MappingProxyType
+
+# Module-level tables are read-only, so that reports can be parsed in many threads without shared mutable state
+SPEED_UNITS = MappingProxyType({
+    'KT': 'kt',
+    'MPS': 'mps'
+})
+
+SPEED_TO_MS = MappingProxyType({
     'mps': 1,
     'kt': 0.514444
-}
+})
 
-DISTANCE_TO_M = {
+DISTANCE_TO_M = MappingProxyType({
     'm': 1,
     'sm': 1852
-}
+})
 
-PRESSURE_UNITS = {
+PRESSURE_UNITS = MappingProxyType({
     'Q': 'hPa',
     'A': 'inHg'
-}
+})
 
-PRESSURE_TO_PA = {
+PRESSURE_TO_PA = MappingProxyType({
     'hPa': 100,
     'inHg': 3376.85 # inches of mercury (60 °F)
-}
-
-class Report:
-    """A parsed METAR report."""
-    def _convert(self, value, unit, constants):
-        """Convert a value
-
-        Parameters
-        ----------
-        value : int/float
-          Input value.
-        unit : str
-          Unit to convert from.
-        constants : dict
-          Dict containing conversion constants
-        """
-        if value is None or unit is None:
-            return None
-
-        if unit in constants:
-            return value * constants[unit]
+})
+
+PRECIPITATION_TO_MM = MappingProxyType({
+    'in': 25.4
+})
+
+HEIGHT_TO_M = MappingProxyType({
+    'ft': 0.3048
+})
+
+# Vocabularies of the cloud and present weather groups. The token patterns are built from these tables.
+CLOUD_COVER = MappingProxyType({
+    'FEW': 'few',
+    'SCT': 'scattered',
+    'BKN': 'broken',
+    'OVC': 'overcast',
+    'VV': 'vertical visibility'
+})
+
+CLOUD_TYPES = MappingProxyType({
+    'CB': 'cumulonimbus',
+    'TCU': 'towering cumulus'
+})
+
+SKY_CONDITIONS = MappingProxyType({
+    'NSC': 'no significant cloud',
+    'NCD': 'no cloud detected',
+    'CLR': 'clear below 12000 ft',
+    'SKC': 'sky clear'
+})
+
+WEATHER_INTENSITY = MappingProxyType({
+    '-': 'light',
+    '+': 'heavy',
+    'VC': 'in the vicinity'
+})
+
+WEATHER_DESCRIPTORS = MappingProxyType({
+    'MI': 'shallow',
+    'PR': 'partial',
+    'BC': 'patches',
+    'DR': 'low drifting',
+    'BL': 'blowing',
+    'SH': 'showers',
+    'TS': 'thunderstorm',
+    'FZ': 'freezing'
+})
+
+WEATHER_PHENOMENA = MappingProxyType({
+    'DZ': 'drizzle',
+    'RA': 'rain',
+    'SN': 'snow',
+    'SG': 'snow grains',
+    'IC': 'ice crystals',
+    'PL': 'ice pellets',
+    'GR': 'hail',
+    'GS': 'small hail',
+    'UP': 'unknown precipitation',
+    'BR': 'mist',
+    'FG': 'fog',
+    'FU': 'smoke',
+    'VA': 'volcanic ash',
+    'DU': 'widespread dust',
+    'SA': 'sand',
+    'HZ': 'haze',
+    'PY': 'spray',
+    'PO': 'dust whirls',
+    'SQ': 'squalls',
+    'FC': 'funnel cloud',
+    'SS': 'sandstorm',
+    'DS': 'duststorm'
+})
+
+# Codes of the vocabularies to themselves, so that decoded groups share the strings of the tables instead of holding a copy each
+CODES = MappingProxyType({code: code for table in (CLOUD_COVER, CLOUD_TYPES, SKY_CONDITIONS, WEATHER_INTENSITY, WEATHER_DESCRIPTORS, WEATHER_PHENOMENA) for code in table})
+
+# Tokens that start a trend forecast, after which the groups describe the expected weather
+TRENDS = frozenset(('NOSIG', 'BECMG', 'TEMPO'))
+
+def _alternatives(table):
+    """Return a pattern matching any code of a vocabulary table."""
+    return '|'.join(re.escape(code) for code in sorted(table, key=len, reverse=True))
+
+@lru_cache(maxsize=None)
+def _compiled(pattern):
+    """Return a compiled regular expression. Patterns are compiled when they are first used, to keep importing the module fast."""
+    return re.compile(pattern)
+
+# Present weather: optional intensity, then a descriptor and/or phenomena
+WEATHER_PATTERN = '(?:{intensity})?(?:(?:{descriptors})(?:{phenomena})*|(?:{phenomena})+)'.format(
+    intensity=_alternatives(WEATHER_INTENSITY),
+    descriptors=_alternatives(WEATHER_DESCRIPTORS),
+    phenomena=_alternatives(WEATHER_PHENOMENA),
+)
+
+# Cloud layer: cover, height in hundreds of feet and optional cloud type
+CLOUD_PATTERN = r'(?P<cloud_cover>{cover})(?P<cloud_height>\d{{3}}|///)(?P<cloud_type>{types}|///)?'.format(
+    cover=_alternatives(CLOUD_COVER),
+    types=_alternatives(CLOUD_TYPES),
+)
+
+# Patterns are compiled once, on first use with `_compiled()`, and shared by every report
+REPORT_PARTS_PATTERN = r'^(\S{4})\s*(.*?Z)(.*?)(?:RMK(.*))?$'     # https://regex101.com/r/Nq5xhk/1
+
+# Shapes of the body tokens, matched once per token. The name of the outer group routes a token to its field group.
+TOKEN_PATTERN = (
+    r'(?P<auto>AUTO)|(?P<cor>COR)'
+    r'|(?P<wind>(?P<wind_direction>[\d/]{3}|VRB)(?P<wind_speed>[\d/]{2,3})(?:G(?P<wind_gust>\d{2,3}))?(?P<wind_unit>KT|MPS))'  # '21022KT', 'VRB09G18MPS'
+    r'|(?P<wind_variable>(?P<wind_from>\d{3})V(?P<wind_to>\d{3}))'                     # '190V250'
+    r'|(?P<temperatures>(?P<temperature>M?\d{2})/(?P<dew_point>M?\d{2}))'             # '17/15', 'M04/M05'
+    r'|(?P<visibility>(?P<visibility_m>\d{4})|(?P<visibility_less>M)?(?P<visibility_sm>[\d/]{1,5})SM|(?P<cavok>CAVOK))'   # '9999', 'M1/4SM', 'CAVOK'
+    r'|(?P<altimeter>(?P<altimeter_unit>[QA])(?P<altimeter_value>\d{4}))'              # 'Q1002', 'A3004'
+    r'|(?P<weather>' + WEATHER_PATTERN + ')'                                               # '-SHRA', 'VCFG', 'TS'
+    r'|(?P<cloud>' + CLOUD_PATTERN + ')'                                                   # 'FEW008', 'BKN025CB', 'VV///'
+    r'|(?P<sky_condition>' + _alternatives(SKY_CONDITIONS) + ')'                           # 'NSC', 'CLR'
+)
+
+# Token shapes of which all tokens are kept, instead of only the first one
+REPEATED_TOKENS = frozenset(('weather', 'cloud'))
+
+# Shapes of the remarks tokens that are decoded, matched once per token like `TOKEN_PATTERN`
+REMARKS_PATTERN = (
+    r'(?P<station_type>AO[12])'                                                     # 'AO2'
+    r'|(?P<sea_level_pressure>SLP(?P<sea_level_pressure_value>\d{3}))'                # 'SLP013'
+    r'|(?P<precipitation>P(?P<precipitation_value>\d{4}))'                            # 'P0012'
+    r'|(?P<temperatures>T(?P<temperature_sign>[01])(?P<temperature_value>\d{3})'      # 'T01720150', 'T1006'
+    r'(?:(?P<dew_point_sign>[01])(?P<dew_point_value>\d{3}))?)'
+)
+
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _int_or_str(string):
+    """Convert a token to int. Returns None for missing values ('///') and the token itself if it is not a number ('VRB')."""
+    if string is None:
         return None
 
-    def _int_or_none(self, string):
-        if string is None:
-            return None
-
-        string = string.strip()
-
-        if '/' in string:
-            return None
-
-        try:
-            return int(string)
-        except ValueError:
-            return string
-
-    def __int_or_str(self, string):
-        """Try converting to int, if fails, return string."""
-        if string is None:
-            return None
-
-        value = self._int_or_none(string)
-
-        if value is None and not '/' in string:
-            return string
-        return value
-
-    def __init__(self, raw):
-        """Parse an input METAR report.
-
-        Parameters
-        ----------
-        raw : str
-          Input METAR report.
-        """
-        self.raw = raw.strip()                  # input METAR report ('EHAM 020825Z 21022G23KT 190V250 9999 FEW008...')
-        self.parsed = False                     # parsed status
-        self.ident = None                       # weather station identifier ('EHAM')
-        self.report_modifier = None             # auto/corrected modifier ('AUTO', 'COR')
+    string = string.strip()
+    if '/' in string:
+        return None
 
-        self.reported = None                    # date and time of report in ISO 8601 ('2020-11-02T08:25:00+00:00'), assuming current year and month
-        self.date = None                        # date of report in 'YYYY-MM-DD', assuming current year and month
-        self.time = None                        # time of report in 'HH:MM'
+    try:
+        return int(string)
+    except ValueError:
+        return string
 
-        self.wind_direction = None              # wind direction
-        self.wind_speed = None                  # wind speed
-        self.wind_speed_unit = None             # unit of wind speed ('kt', 'mps')
-        self.wind_gust = None                   # gust speed
-        self.wind_variable_directions = None    # list containing variable wind directions ([210, 240])
-        self.wind_speed_ms = None               # converted wind speed in meters per second
-        self.wind_gust_ms = None                # converted gust speed in meters per second
+def _statute_miles(value):
+    """Convert a visibility in statute miles ('10', '1/4', '2 1/4') to a number. Returns None if it is not a number."""
+    if value.count('/') != 1:
+        return _int_or_str(value)
 
-        self.temperature = None                 # temperature in degrees Celsius
-        self.dew_point = None                   # dew point in degrees Celsius
+    whole, _, fraction = value.rpartition(' ')
+    numerator, _, denominator = fraction.partition('/')
+    if not (numerator.isdecimal() and denominator.isdecimal() and (whole == '' or whole.isdecimal())):
+        return None
+    denominator = int(denominator)
+    if not denominator:
+        return None
 
-        self.visibility_distance = None         # visibility distance (negative value to be interpreted as 'visibility less than value')
-        self.visibility_distance_unit = None    # unit of visibility distance ('m', 'sm')
-        self.visibility_distance_m = None       # converted visibility distance in meters
-        self.visibility_distance_str = None     # visibility distance as string, with 'less than' symbol and unit if applicable,
-                                                # retains fractions ('< 2 1/4 sm', '200 m', 'CAVOK')
+    # Integer division rounds like `float(Fraction(value))`
+    return (int(whole or 0) * denominator + int(numerator)) / denominator
+
+class _Table(dict):
+    """Read-only lookup table with the decoded value of each legal token. Other tokens are converted when they are looked up."""
+    __slots__ = ('convert',)
+
+    def __init__(self, values, convert):
+        super().__init__(values)
+        self.convert = convert
+
+    def __missing__(self, token):
+        return self.convert(token)
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('lookup tables are read-only')
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _readonly
+
+# Lookup tables of the numeric tokens, so that decoding a report does not convert strings.
+# Numbers of one to three digits: wind directions, speeds and gusts ('210', '05', '7')
+NUMBERS = _Table({str(number).zfill(width): number for width in (1, 2, 3) for number in range(10 ** width)}, _int_or_str)
+
+# Temperatures and dew points ('17', 'M05')
+TEMPERATURES = _Table({sign + str(number).zfill(2): -number if sign else number for sign in ('', 'M') for number in range(100)},
+                      lambda token: _int_or_str(token.replace('M', '-')))
+
+# Visibilities in statute miles: whole numbers and fractions in halves to sixteenths, also after a whole number ('1/4', '2 1/4')
+STATUTE_MILES = _Table({**NUMBERS, **{
+    '{}{}/{}'.format(whole, numerator, denominator): (int(whole or 0) * denominator + numerator) / denominator
+    for whole in [''] + ['{} '.format(digit) for digit in range(10)]
+    for denominator in (2, 4, 8, 16)
+    for numerator in range(1, denominator)
+}}, _statute_miles)
+
+# Attributes set by each field group, used to decode groups on first access in lazy mode.
+# The reported date and time strings are derived from `observed` when they are first accessed,
+# and the remarks when one of their values is first accessed, also when not in lazy mode.
+FIELD_GROUPS = MappingProxyType({
+    'datetime': ('parsed', 'observed'),
+    'reported': ('reported',),
+    'date': ('date',),
+    'time': ('time',),
+    'modifier': ('report_modifier',),
+    'wind': ('wind_direction', 'wind_speed', 'wind_speed_unit', 'wind_gust', 'wind_variable_directions', 'wind_speed_ms', 'wind_gust_ms'),
+    'temperatures': ('temperature', 'dew_point'),
+    'visibility': ('visibility_distance', 'visibility_distance_unit', 'visibility_distance_m', 'visibility_distance_str'),
+    'weather': ('present_weather',),
+    'clouds': ('cloud_layers', 'sky_condition'),
+    'altimeter': ('altimeter_pressure', 'altimeter_pressure_unit', 'altimeter_pressure_pa'),
+    'remarks': ('remarks_text', 'station_type', 'remarks_temperature', 'remarks_dew_point', 'sea_level_pressure', 'sea_level_pressure_pa', 'precipitation', 'precipitation_mm'),
+})
+
+FIELD_ATTRIBUTES = MappingProxyType({attribute: group for group, attributes in FIELD_GROUPS.items() for attribute in attributes})
+
+# Field groups that can be selected with the `fields` argument of `Report`, and their key in `result()`.
+# The date and time are always decoded, since they decide whether a report is parsed.
+SECTIONS = MappingProxyType({
+    'modifier': 'report_modifier',
+    'wind': 'wind',
+    'temperatures': 'temperatures',
+    'visibility': 'visibility',
+    'weather': 'present_weather',
+    'clouds': 'clouds',
+    'altimeter': 'altimeter',
+    'remarks': 'remarks',
+})
+
+# Selected field groups to (field groups, decoder methods to call), compiled once per projection.
+# Threads that compile the same projection at once store equal plans, so the cache needs no lock.
+_projections = {}
+
+def projection(fields):
+    """Return the field groups and the names of the decoder methods for a selection of field groups.
+
+    Parameters
+    ----------
+    fields : iterable of str
+      Field groups to decode, from `SECTIONS` ('wind', 'altimeter', ...).
+    """
+    selected = frozenset(fields)
+    plan = _projections.get(selected)
+    if plan is None:
+        unknown = selected.difference(SECTIONS)
+        if unknown:
+            raise ValueError('Unknown field groups: {}'.format(', '.join(sorted(unknown))))
+
+        decoders = ('_decode_datetime',) + tuple('_decode_' + group for group in SECTIONS if group in selected)
+        plan = _projections[selected] = (selected, decoders)
+    return plan
+
+# Values stored by `CompactReport`, in order
+FIELDS = ('raw', 'ident') + tuple(name for name in FIELD_ATTRIBUTES if name not in ('reported', 'date', 'time'))
+
+# Current UTC date and the time at which it expires, shared by all reports parsed without a reference date.
+# Replaced as a whole, so that threads never read a date with the expiry time of another.
+_clock = (0, None)
+
+def utc_today():
+    """Return the current date in UTC, looking up the clock at most once a day."""
+    global _clock
+    expires, today = _clock
+    now = _now()
+    if now >= expires:
+        today = datetime.fromtimestamp(now, timezone.utc).date()
+        _clock = (now - now % 86400 + 86400, today)     # expires at midnight UTC
+    return today
+
+def resolve_month(day, reference):
+    """Return the year and month of the latest date with this day of the month on or before the reference date.
+
+    Parameters
+    ----------
+    day : int
+      Day of the month (1-31).
+    reference : date or datetime
+      Reference date.
+    """
+    year = reference.year
+    month = reference.month
+    if day > reference.day:
+        month -= 1
+
+    # Go back to the previous month until the day exists (the 31st in a month with 30 days)
+    while True:
+        if month == 0:
+            year -= 1
+            month = 12
+
+        days = DAYS_IN_MONTH[month - 1]
+        if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+            days = 29
+
+        if day <= days:
+            return year, month
+        month -= 1
+
+def _observed(time, reference):
+    """Return the date and time of a date and time group ('020825Z') as a datetime in UTC, or None if it is not valid."""
+    # Fixed width day, hour and minute ('020825Z')
+    if time is None or len(time) != 7 or not time[:6].isdigit():
+        return None
 
-        self.altimeter_pressure = None          # pressure at station (1015, 29.92)
-        self.altimeter_pressure_unit = None     # unit of pressure ('inHg', 'hPa')
-        self.altimeter_pressure_pa = None       # converted pressure in pascals
+    day = int(time[0:2])
+    hour = int(time[2:4])
+    minute = int(time[4:6])
+    if not (1 <= day <= 31 and hour < 24 and minute < 60):
+        return None
 
-        # Split report into main parts: ident, date+time, body, remarks
-        parts = re.match(r'^(\S{4})\s*(.*?Z)(.*?)(?:RMK(.*))?$', self.raw)  # https://regex101.com/r/Nq5xhk/1
+    year, month = resolve_month(day, reference or utc_today())
+    return datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+
+# Number of tokens and date and time groups remembered by the decoders of `shared_decoders()`
+SHARED_CACHE_SIZE = 4096
+
+def shared_decoders():
+    """Return a token matcher and a date and time decoder that remember their results, to parse the reports of one batch.
+
+    Reports parsed together share many tokens ('9999', 'NOSIG', 'Q1013') and
+    date and time groups, which are then matched and decoded once. See
+    `Report._parse()`.
+    """
+    return lru_cache(maxsize=SHARED_CACHE_SIZE)(_compiled(TOKEN_PATTERN).fullmatch), lru_cache(maxsize=SHARED_CACHE_SIZE)(_observed)
+
+# Reasons returned by `validate()` for lines that are not METAR reports
+REJECT_REASONS = ('empty', 'header', 'taf', 'no_ident', 'bad_time', 'empty_body')
+
+def validate(raw):
+    """Return why a line is not a METAR report, or None if it looks like one.
+
+    A cheap check of the structure of a line, without regular expressions,
+    so that lines that are not reports can be skipped before parsing. The
+    reasons are:
+      empty: the line is empty
+      header: a date and time line of a NOAA cycle file ('2020/11/02 08:25')
+      taf: a terminal aerodrome forecast ('TAF EHAM ...')
+      no_ident: the line does not start with a 4 character station identifier and a space
+      bad_time: the identifier is not followed by a valid date and time group ('020825Z')
+      empty_body: the report has no groups after the date and time, apart from remarks
+    A report that passes is parsed by `Report` (`is_parsed()` is True).
+
+    Parameters
+    ----------
+    raw : str
+      Input line.
+    """
+    raw = raw.strip()
+    if not raw:
+        return 'empty'
+
+    ident = raw[:4]
+    if ident == 'TAF ' or raw == 'TAF':
+        return 'taf'
+    if ident.isdigit() and raw[4:5] == '/':
+        return 'header'
+    if not ident.isalnum() or len(ident) < 4 or (len(raw) > 4 and not raw[4].isspace()):
+        return 'no_ident'
+
+    rest = raw[5:].lstrip()
+
+    # Fixed width day, hour and minute ('020825Z'), like `Report._decode_datetime`
+    if len(rest) < 7 or rest[6] != 'Z' or not rest[:6].isdigit():
+        return 'bad_time'
+    if not (1 <= int(rest[0:2]) <= 31 and int(rest[2:4]) < 24 and int(rest[4:6]) < 60):
+        return 'bad_time'
+
+    body = rest[7:]
+    remarks = body.find('RMK')
+    if remarks >= 0:
+        body = body[:remarks]
+    if not body or body.isspace():
+        return 'empty_body'
+
+    return None
+
+def _format_reported(observed):
+    """Format the date and time of a report in ISO 8601 ('2020-11-02T08:25:00+00:00')."""
+    if observed is None:
+        return None
+    return observed.isoformat()
 
-        if not parts:
-            return
+def _format_date(observed):
+    """Format the date of a report in 'YYYY-MM-DD'."""
+    if observed is None:
+        return None
+    return '{:04d}-{:02d}-{:02d}'.format(observed.year, observed.month, observed.day)
 
-        self.ident = parts.group(1)
-
-        # Get date and time
-        if parts.group(2):
-            try:
-                dt = datetime.strptime(parts.group(2), '%d%H%M%z')
-                dt = dt.replace(year=datetime.today().year, month=datetime.today().month)
-                self.reported = dt.isoformat()
-                self.date = dt.strftime('%Y-%m-%d')
-                self.time = dt.strftime('%H:%M')
-            except ValueError as e:
-                return
-
-        if parts.group(3):
-            # Get wind data
-            wind = re.search(r'\s(?:([\d\/]{3}|VRB)([\d\/]{2,3}))(?:G(\d{2,3}))?(KT|MPS)(?:\s(\d{3})V(\d{3})\s)?', parts.group(3))  # https://regex101.com/r/wuyEsI/3
-            if wind:
-                # Add main wind data
-                self.wind_direction = self.__int_or_str(wind.group(1))
-                self.wind_speed = self.__int_or_str(wind.group(2))
-                self.wind_gust = self.__int_or_str(wind.group(3))
+def _format_time(observed):
+    """Format the time of a report in 'HH:MM'."""
+    if observed is None:
+        return None
+    return '{:02d}:{:02d}'.format(observed.hour, observed.minute)
 
-                if self.wind_speed is not None:
-                    self.wind_speed_unit = wind.group(4).lower()
-
-                # Add variable wind direction
-                variable_directions = [
-                    self.__int_or_str(wind.group(5)),
-                    self.__int_or_str(wind.group(6))
-                ]
-
-                if variable_directions[0] is not None and variable_directions[1] is not None:
-                    self.wind_variable_directions = variable_directions
-
-                if self.wind_speed_unit is not None:
-                    if self.wind_speed is not None:
-                        self.wind_speed_ms = self._convert(self.wind_speed, self.wind_speed_unit, SPEED_TO_MS)
-
-                    if self.wind_gust is not None:
-                        self.wind_gust_ms = self._convert(self.wind_gust, self.wind_speed_unit, SPEED_TO_MS)
-
-            # Get temperature data
-            temps = re.search(r'\s(M?\d{2})/(M?\d{2})', parts.group(3))    # https://regex101.com/r/oqplsG/1
-            if temps:
-                temperature = temps.group(1).replace('M', '-')
-                self.temperature = self.__int_or_str(temperature)
-
-                dew_point = temps.group(2).replace('M', '-')
-                self.dew_point = self.__int_or_str(dew_point)
-
-            # Get report modifier
-            for modifier in ['AUTO', 'COR']:    
-                # Note: In case both AUTO and COR are present, COR will be used as per https://www.ofcm.gov/publications/fmh/FMH1/FMH1.pdf
-                # (p. 58: "In the event of a corrected METAR or SPECI, the report modifier, COR, shall be substituted in place of AUTO")
-                if modifier in parts.group(3):
-                    self.report_modifier = modifier
-
-            # Get visibility data
-            visibility = re.search(r'\s(?:(\d{4})\s|(M)?([\d\s/]{1,5})(SM)|(CAVOK))', parts.group(3))   # https://regex101.com/r/YWZkDI/2/
-            if visibility:
-                distance = None
-                distance_str = None
-                unit = None
-
-                # Check for several visibilty formats
-                if visibility.group(5): # 'CAVOK'
-                    distance_str = visibility.group(5)
-                    distance = 10000
-                    unit = 'm'
-                elif visibility.group(1):   # '8000', '9999', '0300'
-                    distance = int(visibility.group(1))    # Convert '0300' to 300
-                    unit = 'm'
-                    distance_str = '{} {}'.format(distance, unit)   # 300 to '300 m'
-                elif visibility.group(3):   # '10SM', 2 1/4SM', 'M1/4SM'
-                    # Check for only one '/' for a fraction. This rules out invalid values like '////SM'.
-                    if visibility.group(3).count('/') == 1:
-                        # Convert fraction to float (https://stackoverflow.com/a/1806309)
-                        # Note: negative values fail using this method. Since only positive values are handled this should not be an issue.
-                        distance = float(sum(Fraction(s) for s in visibility.group(3).split()))
-                    else:
-                        distance = self.__int_or_str(visibility.group(3))
-
-                    # The character 'M' is used to define a visibility distance less than the value.
-                    # We'll use negative values to indicate this.
-                    if visibility.group(2) is not None:
-                        distance = distance * -1
-
-                    if visibility.group(4) is not None:
-                        unit = visibility.group(4).lower()
-                        distance_str = '{} {}'.format(visibility.group(3), unit)
-
-                if distance is not None and unit is not None:
-                    self.visibility_distance_m = self._convert(abs(distance), unit, DISTANCE_TO_M)
-
-                if distance_str is not None and distance is not None:
-                    # Remove leading zero ('05 sm' to '5 sm')
-                    distance_str = distance_str.strip()
-                    if abs(distance) != 0:
-                        distance_str = distance_str.lstrip('0')
-
-                    # Add 'less than' symbol ('1/4 sm' to '< 1/4 sm')
-                    if distance < 0:
-                        distance_str = '< {}'.format(distance_str)
-
-                self.visibility_distance = distance
-                self.visibility_distance_unit = unit
-                self.visibility_distance_str = distance_str
-
-            # Get altimeter data
-            altimeter = re.search(r'\s(?:(Q|A)(\d{4}))', parts.group(3))    # https://regex101.com/r/VFeX74/1
-            if altimeter:
-                value = altimeter.group(2)
-                unit = altimeter.group(1).upper()
-
-                # Add decimal point to values in inHg ('3004' to '30.04')
-                if unit == 'A':
-                    value = value[:2] + '.' + value[2:]
-
-                if unit in PRESSURE_UNITS:
-                    if unit == 'Q':
-                        self.altimeter_pressure = int(value)
-                    else:
-                        self.altimeter_pressure = float(value)
+# Variable wind directions, present weather groups and cloud layers are stored as tuples, which take less memory than
+# lists and dicts and cannot be changed, so that reports can be shared. The getters and `result()` return new lists and
+# dicts, see `RESULT_FORMS`.
+WeatherGroup = namedtuple('WeatherGroup', ['intensity', 'descriptor', 'phenomena'])
+CloudLayer = namedtuple('CloudLayer', ['cover', 'height', 'height_m', 'type'])
 
-                    self.altimeter_pressure_unit = PRESSURE_UNITS[unit]  # Convert 'Q' to 'hPa'
-                    self.altimeter_pressure_pa = self._convert(self.altimeter_pressure, self.altimeter_pressure_unit, PRESSURE_TO_PA)
+def _directions_list(directions):
+    """Return variable wind directions as a list, as in `result()`."""
+    if directions is None:
+        return None
+    return list(directions)
 
-        self.parsed = True
+def _weather_dicts(groups):
+    """Return present weather groups as a list of dicts, as in `result()`."""
+    if groups is None:
+        return None
+    return [{'intensity': group.intensity, 'descriptor': group.descriptor, 'phenomena': list(group.phenomena)} for group in groups]
 
+def _layer_dicts(layers):
+    """Return cloud layers as a list of dicts, as in `result()`."""
+    if layers is None:
+        return None
+    return [{'cover': layer.cover, 'height': layer.height, 'height_m': layer.height_m, 'type': layer.type} for layer in layers]
+
+# Attributes stored in another form than their value in `result()`, to the function converting them
+RESULT_FORMS = MappingProxyType({
+    'wind_variable_directions': _directions_list,
+    'present_weather': _weather_dicts,
+    'cloud_layers': _layer_dicts,
+})
+
+def _decode_weather_group(group):
+    """Split a present weather group into its intensity, descriptor and phenomena ('-SHRA' to '-', 'SH', ('RA',))."""
+    intensity = None
+    if group[0] in WEATHER_INTENSITY:
+        intensity = CODES[group[0]]
+        group = group[1:]
+    elif group[:2] in WEATHER_INTENSITY:
+        intensity = CODES[group[:2]]
+        group = group[2:]
+
+    descriptor = None
+    if group[:2] in WEATHER_DESCRIPTORS:
+        descriptor = CODES[group[:2]]
+        group = group[2:]
+
+    return WeatherGroup(intensity, descriptor, tuple([CODES[group[i:i + 2]] for i in range(0, len(group), 2)]))
+
+class BaseReport:
+    """Output and getters of a decoded METAR report, shared by `Report` and `CompactReport`."""
+    __slots__ = ()
+
+    _fields = None                              # selected field groups, None for all
 
     def wind(self):
         """Return the parsed wind data."""
@@ -250,7 +482,7 @@ class Report:
             'speed': self.wind_speed,
             'speed_unit': self.wind_speed_unit,
             'gust': self.wind_gust,
-            'variable_directions': self.wind_variable_directions,
+            'variable_directions': _directions_list(self.wind_variable_directions),
             'speed_ms': self.wind_speed_ms,
             'gust_ms': self.wind_gust_ms
         }
@@ -271,6 +503,13 @@ class Report:
             'distance_str': self.visibility_distance_str
         }
 
+    def clouds(self):
+        """Return the parsed cloud data."""
+        return {
+            'layers': _layer_dicts(self.cloud_layers),
+            'sky_condition': self.sky_condition
+        }
+
     def altimeter(self):
         """Return the parsed altimeter data."""
         return {
@@ -279,8 +518,25 @@ class Report:
             'pressure_pa': self.altimeter_pressure_pa
         }
 
+    def remarks(self):
+        """Return the parsed remarks."""
+        return {
+            'text': self.remarks_text,
+            'station_type': self.station_type,
+            'temperature': self.remarks_temperature,
+            'dew_point': self.remarks_dew_point,
+            'sea_level_pressure': self.sea_level_pressure,
+            'sea_level_pressure_pa': self.sea_level_pressure_pa,
+            'precipitation': self.precipitation,
+            'precipitation_mm': self.precipitation_mm
+        }
+
     def result(self):
-        """Return the parsed report."""
+        """Return the parsed report. Only the selected field groups are included if the report was parsed with `fields`."""
+        fields = self._fields
+        if fields is not None:
+            return self._projected_result(fields)
+
         return {
             'raw': self.raw,
             'parsed': self.parsed,
@@ -292,9 +548,28 @@ class Report:
             'wind': self.wind(),
             'temperatures': self.temperatures(),
             'visibility': self.visibility(),
-            'altimeter': self.altimeter()
+            'present_weather': _weather_dicts(self.present_weather),
+            'clouds': self.clouds(),
+            'altimeter': self.altimeter(),
+            'remarks': self.remarks()
         }
 
+    def _projected_result(self, fields):
+        """Return the parsed report with only the selected field groups."""
+        result = {
+            'raw': self.raw,
+            'parsed': self.parsed,
+            'ident': self.ident,
+            'reported': self.reported,
+            'date': self.date,
+            'time': self.time,
+        }
+        for group, key in SECTIONS.items():
+            if group in fields:
+                # Sections of one value are read with their getter, the others are methods returning a dict
+                result[key] = getattr(self, 'get_' + key)() if key in FIELD_ATTRIBUTES else getattr(self, key)()
+        return result
+
     def json(self, pretty=False):
         """Return the parsed report as JSON.        
 
@@ -303,6 +578,8 @@ class Report:
         pretty : boolean
           Beautify JSON output.
         """
+        import json
+
         if pretty:
             return json.dumps(self.result(), indent=4, sort_keys=True)
         
@@ -329,6 +606,10 @@ class Report:
         """Return the reported date and time"""
         return self.reported
 
+    def get_observed(self):
+        """Return the date and time of the report as a datetime in UTC"""
+        return self.observed
+
     def get_date(self):
         """Return the date of the report"""
         return self.date
@@ -356,7 +637,7 @@ class Report:
 
     def get_wind_variable_directions(self):
         """Return the variable wind directions"""
-        return self.wind_variable_directions
+        return _directions_list(self.wind_variable_directions)
 
     def get_wind_speed_ms(self):
         """Return the wind speed in meters per second"""
@@ -393,6 +674,20 @@ class Report:
         return self.visibility_distance_str
 
 
+    def get_present_weather(self):
+        """Return the present weather groups"""
+        return _weather_dicts(self.present_weather)
+
+
+    def get_cloud_layers(self):
+        """Return the cloud layers"""
+        return _layer_dicts(self.cloud_layers)
+
+    def get_sky_condition(self):
+        """Return the sky condition without cloud layers"""
+        return self.sky_condition
+
+
     def get_altimeter_pressure(self):
         """Return the pressure"""
         return self.altimeter_pressure
@@ -404,3 +699,498 @@ class Report:
     def get_altimeter_pressure_pa(self):
         """Return the converted pressure in pascals"""
         return self.altimeter_pressure_pa
+
+
+    def get_remarks_text(self):
+        """Return the remarks, without 'RMK'"""
+        return self.remarks_text
+
+    def get_station_type(self):
+        """Return the type of automated station ('AO1', 'AO2')"""
+        return self.station_type
+
+    def get_remarks_temperature(self):
+        """Return the temperature in degrees Celsius from the remarks, in tenths of degrees"""
+        return self.remarks_temperature
+
+    def get_remarks_dew_point(self):
+        """Return the dew point in degrees Celsius from the remarks, in tenths of degrees"""
+        return self.remarks_dew_point
+
+    def get_sea_level_pressure(self):
+        """Return the sea level pressure in hectopascals"""
+        return self.sea_level_pressure
+
+    def get_sea_level_pressure_pa(self):
+        """Return the sea level pressure in pascals"""
+        return self.sea_level_pressure_pa
+
+    def get_precipitation(self):
+        """Return the precipitation of the last hour in inches"""
+        return self.precipitation
+
+    def get_precipitation_mm(self):
+        """Return the precipitation of the last hour in millimeters"""
+        return self.precipitation_mm
+
+class Report(BaseReport):
+    """A parsed METAR report."""
+    def _convert(self, value, unit, constants):
+        """Convert a value
+
+        Parameters
+        ----------
+        value : int/float
+          Input value.
+        unit : str
+          Unit to convert from.
+        constants : dict
+          Dict containing conversion constants
+        """
+        if value is None or unit is None:
+            return None
+
+        if unit in constants:
+            return value * constants[unit]
+        return None
+
+    def __init__(self, raw, reference=None, lazy=False, fields=None):
+        """Parse an input METAR report.
+
+        Parameters
+        ----------
+        raw : str
+          Input METAR report.
+        reference : date or datetime, optional
+          Date used to fill in the year and month of the report: the report is
+          assumed to be from the latest date on or before the reference date with
+          the reported day of the month. Defaults to the current date in UTC.
+        lazy : boolean
+          Only split the report into its main parts. Each field group is decoded
+          the first time one of its values is accessed.
+        fields : iterable of str, optional
+          Field groups to decode, from `SECTIONS` ('modifier', 'wind', 'temperatures',
+          'visibility', 'weather', 'clouds', 'altimeter', 'remarks'). The other groups are skipped and left out of
+          `result()` and `json()`. All groups are decoded by default.
+        """
+        self._parse(raw, reference, lazy, fields, None, _observed)
+
+    def _parse(self, raw, reference, lazy, fields, fullmatch, observed):
+        """Parse a report, see `__init__()`. `Batch.parse_many()` calls this with the decoders of `shared_decoders()`.
+
+        Parameters
+        ----------
+        fullmatch : callable or None
+          Matches a body token against `TOKEN_PATTERN`, see `_tokenize()`.
+        observed : callable
+          Returns the datetime of a date and time group and a reference date, see `_decode_datetime()`.
+        """
+        self.raw = raw.strip()                  # input METAR report ('EHAM 020825Z 21022G23KT 190V250 9999 FEW008...')
+        self.ident = None                       # weather station identifier ('EHAM')
+
+        self._reference = reference
+        self._time = None                       # date and time group ('020825Z')
+        self._body = None                       # report body, without remarks
+        self._remarks = None                    # remarks, without 'RMK'
+
+        self._split()
+
+        if fields is not None:
+            self._fields, decoders = projection(fields)
+
+        if lazy:
+            return
+
+        self._decode_datetime(observed)
+
+        # Tokenized here, not on first access, so that the attributes keep the key order shared by all reports
+        if self.parsed and self._body:
+            self._tokenize(fullmatch)
+
+        if fields is not None:
+            for name in decoders[1:]:           # after '_decode_datetime'
+                getattr(self, name)()
+        else:
+            self._decode_modifier()
+            self._decode_wind()
+            self._decode_temperatures()
+            self._decode_visibility()
+            self._decode_weather()
+            self._decode_clouds()
+            self._decode_altimeter()
+
+        # The tokens are only needed while decoding
+        self.__dict__.pop('_tokens', None)
+
+    def __getattr__(self, name):
+        """Decode the field group of an attribute that has not been decoded yet (lazy mode).
+
+        The group is decoded on a copy of the report and its values are only
+        set once they are all decoded, so that threads sharing a report never
+        see a group that is half decoded. Threads decoding the same group at
+        once set equal values.
+        """
+        if name == '_tokens':
+            method = '_tokenize'
+        else:
+            group = FIELD_ATTRIBUTES.get(name)
+            if group is None:
+                raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+            method = '_decode_' + group
+
+        copy = object.__new__(self.__class__)
+        decoded = copy.__dict__
+        decoded.update(self.__dict__)
+        getattr(copy, method)()
+
+        # Set one by one, in the order they were decoded, to keep the attributes compact
+        values = self.__dict__
+        for key, value in decoded.items():
+            if key not in values:
+                setattr(self, key, value)
+        return decoded[name]
+
+    def _split(self):
+        """Split the report into its main parts: ident, date+time, body, remarks."""
+        parts = _compiled(REPORT_PARTS_PATTERN).match(self.raw.rstrip('='))     # reports in WMO bulletins end with '='
+
+        if parts:
+            self.ident = parts.group(1)
+            self._time = parts.group(2)
+            self._body = parts.group(3)
+            self._remarks = parts.group(4)
+
+    def _tokenize(self, fullmatch=None):
+        """Split the body into tokens once and route each token to its field group by shape.
+
+        Only the first token of each shape is kept, together with the token before
+        it, except for the shapes in `REPEATED_TOKENS` of which a list of all
+        matches is kept. Tokens of a trend forecast are skipped.
+
+        Parameters
+        ----------
+        fullmatch : callable, optional
+          Matches a token against `TOKEN_PATTERN`. Defaults to the compiled pattern.
+        """
+        self._tokens = tokens = {}
+        previous = None
+        if fullmatch is None:
+            fullmatch = _compiled(TOKEN_PATTERN).fullmatch
+
+        for token in self._body.split():
+            if token in TRENDS:
+                break
+
+            match = fullmatch(token)
+            if match is not None:
+                kind = match.lastgroup
+                if kind in REPEATED_TOKENS:
+                    if kind in tokens:
+                        tokens[kind].append(match)
+                    else:
+                        tokens[kind] = [match]
+                elif kind not in tokens:
+                    tokens[kind] = (match, previous)
+            previous = token
+
+    def _decode_datetime(self, observed=_observed):
+        """Decode the date and time of the report.
+
+        Parameters
+        ----------
+        observed : callable
+          Returns the datetime of a date and time group and a reference date, or None if the group is not valid.
+        """
+        observed = observed(self._time, self._reference)
+        self.parsed = observed is not None      # parsed status
+        self.observed = observed                # date and time of report (datetime in UTC)
+
+    def _decode_reported(self):
+        """Format the reported date and time."""
+        self.reported = _format_reported(self.observed)
+
+    def _decode_date(self):
+        """Format the date of the report."""
+        self.date = _format_date(self.observed)
+
+    def _decode_time(self):
+        """Format the time of the report."""
+        self.time = _format_time(self.observed)
+
+    def _decode_modifier(self):
+        """Decode the report modifier."""
+        self.report_modifier = None             # auto/corrected modifier ('AUTO', 'COR')
+
+        if not self.parsed or not self._body:
+            return
+
+        # Note: In case both AUTO and COR are present, COR will be used as per https://www.ofcm.gov/publications/fmh/FMH1/FMH1.pdf
+        # (p. 58: "In the event of a corrected METAR or SPECI, the report modifier, COR, shall be substituted in place of AUTO")
+        if 'cor' in self._tokens:
+            self.report_modifier = 'COR'
+        elif 'auto' in self._tokens:
+            self.report_modifier = 'AUTO'
+
+    def _decode_wind(self):
+        """Decode the wind data."""
+        self.wind_direction = None              # wind direction
+        self.wind_speed = None                  # wind speed
+        self.wind_speed_unit = None             # unit of wind speed ('kt', 'mps')
+        self.wind_gust = None                   # gust speed
+        self.wind_variable_directions = None    # tuple containing variable wind directions ((210, 240))
+        self.wind_speed_ms = None               # converted wind speed in meters per second
+        self.wind_gust_ms = None                # converted gust speed in meters per second
+
+        if not self.parsed or not self._body:
+            return
+
+        if 'wind' in self._tokens:
+            wind, _ = self._tokens['wind']
+
+            # Add main wind data
+            direction, speed, gust = wind.group('wind_direction', 'wind_speed', 'wind_gust')
+            self.wind_direction = NUMBERS[direction]
+            self.wind_speed = NUMBERS[speed]
+            self.wind_gust = NUMBERS[gust]
+
+            if self.wind_speed is not None:
+                self.wind_speed_unit = SPEED_UNITS[wind.group('wind_unit')]
+
+            # Add variable wind direction, which directly follows the wind group ('21022KT 190V250')
+            if 'wind_variable' in self._tokens:
+                variable, previous = self._tokens['wind_variable']
+                if previous == wind.group():
+                    self.wind_variable_directions = (
+                        NUMBERS[variable.group('wind_from')],
+                        NUMBERS[variable.group('wind_to')]
+                    )
+
+            if self.wind_speed_unit is not None:
+                if self.wind_speed is not None:
+                    self.wind_speed_ms = self._convert(self.wind_speed, self.wind_speed_unit, SPEED_TO_MS)
+
+                if self.wind_gust is not None:
+                    self.wind_gust_ms = self._convert(self.wind_gust, self.wind_speed_unit, SPEED_TO_MS)
+
+    def _decode_temperatures(self):
+        """Decode the temperature data."""
+        self.temperature = None                 # temperature in degrees Celsius
+        self.dew_point = None                   # dew point in degrees Celsius
+
+        if not self.parsed or not self._body:
+            return
+
+        if 'temperatures' in self._tokens:
+            temps, _ = self._tokens['temperatures']
+
+            self.temperature = TEMPERATURES[temps.group('temperature')]
+            self.dew_point = TEMPERATURES[temps.group('dew_point')]
+
+    def _decode_visibility(self):
+        """Decode the visibility data."""
+        self.visibility_distance = None         # visibility distance (negative value to be interpreted as 'visibility less than value')
+        self.visibility_distance_unit = None    # unit of visibility distance ('m', 'sm')
+        self.visibility_distance_m = None       # converted visibility distance in meters
+        self.visibility_distance_str = None     # visibility distance as string, with 'less than' symbol and unit if applicable,
+                                                # retains fractions ('< 2 1/4 sm', '200 m', 'CAVOK')
+
+        if not self.parsed or not self._body:
+            return
+
+        if 'visibility' in self._tokens:
+            visibility, previous = self._tokens['visibility']
+            distance = None
+            distance_str = None
+            unit = None
+
+            # Check for several visibilty formats
+            if visibility.group('cavok'): # 'CAVOK'
+                distance_str = visibility.group('cavok')
+                distance = 10000
+                unit = 'm'
+            elif visibility.group('visibility_m'):   # '8000', '9999', '0300'
+                distance = int(visibility.group('visibility_m'))    # Convert '0300' to 300
+                unit = 'm'
+                distance_str = '{} {}'.format(distance, unit)   # 300 to '300 m'
+            else:   # '10SM', 2 1/4SM', 'M1/4SM'
+                value = visibility.group('visibility_sm')
+                less = visibility.group('visibility_less') is not None
+
+                # The 'less than' symbol or the whole number of a fraction can be a separate token ('M 10SM', 'M2 1/4SM')
+                if previous == 'M':
+                    less = True
+                elif '/' in value and previous is not None and len(previous.lstrip('M')) == 1 and previous[-1].isdigit():
+                    less = less or previous[0] == 'M'
+                    value = '{} {}'.format(previous[-1], value)
+
+                # Fractions are converted to float ('2 1/4' to 2.25). Invalid values like '////' are None.
+                distance = STATUTE_MILES[value]
+
+                # The character 'M' is used to define a visibility distance less than the value.
+                # We'll use negative values to indicate this.
+                if less and distance is not None:
+                    distance = distance * -1
+
+                unit = 'sm'
+                distance_str = '{} {}'.format(value, unit)
+
+            if distance is not None and unit is not None:
+                self.visibility_distance_m = self._convert(abs(distance), unit, DISTANCE_TO_M)
+
+            if distance_str is not None and distance is not None:
+                # Remove leading zero ('05 sm' to '5 sm')
+                distance_str = distance_str.strip()
+                if abs(distance) != 0:
+                    distance_str = distance_str.lstrip('0')
+
+                # Add 'less than' symbol ('1/4 sm' to '< 1/4 sm')
+                if distance < 0:
+                    distance_str = '< {}'.format(distance_str)
+
+            self.visibility_distance = distance
+            self.visibility_distance_unit = unit
+            self.visibility_distance_str = distance_str
+
+    def _decode_weather(self):
+        """Decode the present weather groups."""
+        self.present_weather = None             # tuple of present weather groups ((WeatherGroup('-', 'SH', ('RA',)),))
+
+        if not self.parsed or not self._body:
+            return
+
+        if 'weather' in self._tokens:
+            self.present_weather = tuple([_decode_weather_group(match.group()) for match in self._tokens['weather']])
+
+    def _decode_clouds(self):
+        """Decode the cloud layers and sky condition."""
+        self.cloud_layers = None                # tuple of cloud layers ((CloudLayer('FEW', 800, 243.84, None),))
+        self.sky_condition = None               # sky condition without cloud layers ('NSC', 'NCD', 'CLR', 'SKC', 'CAVOK')
+
+        if not self.parsed or not self._body:
+            return
+
+        if 'cloud' in self._tokens:
+            layers = []
+            for cloud in self._tokens['cloud']:
+                cover, height, cloud_type = cloud.group('cloud_cover', 'cloud_height', 'cloud_type')
+                height = None if height == '///' else int(height) * 100     # hundreds of feet ('008' to 800)
+
+                cloud_type = None if cloud_type is None or cloud_type == '///' else CODES[cloud_type]
+                layers.append(CloudLayer(CODES[cover], height, self._convert(height, 'ft', HEIGHT_TO_M), cloud_type))
+            self.cloud_layers = tuple(layers)
+
+        if 'sky_condition' in self._tokens:
+            self.sky_condition = CODES[self._tokens['sky_condition'][0].group()]
+        elif 'visibility' in self._tokens and self._tokens['visibility'][0].group('cavok'):
+            self.sky_condition = 'CAVOK'
+
+    def _decode_altimeter(self):
+        """Decode the altimeter data."""
+        self.altimeter_pressure = None          # pressure at station (1015, 29.92)
+        self.altimeter_pressure_unit = None     # unit of pressure ('inHg', 'hPa')
+        self.altimeter_pressure_pa = None       # converted pressure in pascals
+
+        if not self.parsed or not self._body:
+            return
+
+        if 'altimeter' in self._tokens:
+            altimeter, _ = self._tokens['altimeter']
+            value = altimeter.group('altimeter_value')
+            unit = altimeter.group('altimeter_unit')
+
+            if unit in PRESSURE_UNITS:
+                if unit == 'Q':
+                    self.altimeter_pressure = int(value)
+                else:
+                    self.altimeter_pressure = int(value) / 100     # hundredths of inches ('3004' to 30.04)
+
+                self.altimeter_pressure_unit = PRESSURE_UNITS[unit]  # Convert 'Q' to 'hPa'
+                self.altimeter_pressure_pa = self._convert(self.altimeter_pressure, self.altimeter_pressure_unit, PRESSURE_TO_PA)
+
+    def _decode_remarks(self):
+        """Decode the remarks. Only called when one of their values is first accessed."""
+        self.remarks_text = None                # remarks, without 'RMK' ('AO2 SLP013 T01720150')
+        self.station_type = None                # type of automated station ('AO1', 'AO2')
+        self.remarks_temperature = None         # temperature in degrees Celsius, in tenths of degrees (17.2)
+        self.remarks_dew_point = None           # dew point in degrees Celsius, in tenths of degrees (15.0)
+        self.sea_level_pressure = None          # sea level pressure in hectopascals (1001.3)
+        self.sea_level_pressure_pa = None       # converted sea level pressure in pascals
+        self.precipitation = None               # precipitation of the last hour in inches (0.12)
+        self.precipitation_mm = None            # converted precipitation in millimeters
+
+        if not self.parsed or self._remarks is None:
+            return
+
+        self.remarks_text = self._remarks.strip()
+
+        # Only the first token of each shape is used
+        found = set()
+        fullmatch = _compiled(REMARKS_PATTERN).fullmatch
+        for token in self.remarks_text.split():
+            match = fullmatch(token)
+            if match is None or match.lastgroup in found:
+                continue
+            found.add(match.lastgroup)
+
+            if match.lastgroup == 'station_type':
+                self.station_type = token
+            elif match.lastgroup == 'sea_level_pressure':
+                # Tenths of hectopascals without the leading 9 or 10 ('SLP982' is 998.2, 'SLP013' is 1001.3)
+                value = int(match.group('sea_level_pressure_value'))
+                self.sea_level_pressure = (value + (9000 if value >= 500 else 10000)) / 10
+                self.sea_level_pressure_pa = self._convert(self.sea_level_pressure, 'hPa', PRESSURE_TO_PA)
+            elif match.lastgroup == 'precipitation':
+                # Hundredths of inches ('P0012' is 0.12)
+                self.precipitation = int(match.group('precipitation_value')) / 100
+                self.precipitation_mm = self._convert(self.precipitation, 'in', PRECIPITATION_TO_MM)
+            else:
+                # Tenths of degrees, with 1 for negative values ('T01720150' is 17.2 and 15.0, 'T1006' is -0.6)
+                self.remarks_temperature = int(match.group('temperature_value')) / 10
+                if match.group('temperature_sign') == '1':
+                    self.remarks_temperature = -self.remarks_temperature
+                if match.group('dew_point_value') is not None:
+                    self.remarks_dew_point = int(match.group('dew_point_value')) / 10
+                    if match.group('dew_point_sign') == '1':
+                        self.remarks_dew_point = -self.remarks_dew_point
+
+
+class CompactReport(BaseReport, tuple):
+    """A decoded METAR report stored as an immutable tuple of its values.
+
+    Takes less memory than a `Report` with all field groups decoded, with the same getters.
+    """
+    __slots__ = ()
+
+    def __new__(cls, values):
+        """Create a compact report from the values of `FIELDS`, in order."""
+        return tuple.__new__(cls, values)
+
+    def __getnewargs__(self):
+        return (tuple(self),)
+
+    @classmethod
+    def from_report(cls, report):
+        """Create a compact report from a `Report`."""
+        return tuple.__new__(cls, [getattr(report, name) for name in FIELDS])
+
+    def to_report(self):
+        """Convert back to a `Report`, without decoding the report again."""
+        report = Report(self.raw, lazy=True)
+        report.__dict__.update(zip(FIELDS, self))
+        return report
+
+    @property
+    def reported(self):
+        return _format_reported(self.observed)
+
+    @property
+    def date(self):
+        return _format_date(self.observed)
+
+    @property
+    def time(self):
+        return _format_time(self.observed)
+
+for index, name in enumerate(FIELDS):
+    setattr(CompactReport, name, property(itemgetter(index)))
+del index, name
@@ -0,0 +1,130 @@
+import threading
+from collections import deque
+from time import perf_counter
+from types import MappingProxyType
+
+from metar_parser.Metar import Report, FIELD_GROUPS, validate
+
+# Method of `Report` for each stage, in the order they run
+STAGES = MappingProxyType(dict(
+    [('split', '_split'), ('tokenize', '_tokenize')] + [(group, '_decode_' + group) for group in FIELD_GROUPS]
+))
+
+# Maximum number of reports that could not be parsed kept by `stats()`
+FAILED_REPORTS = 100
+
+_lock = threading.Lock()
+_originals = {}                                 # method name to the original method, while enabled
+_times = {}                                     # stage to cumulative time in seconds
+_calls = {}                                     # stage to number of calls
+_parsed = 0                                     # number of reports parsed
+_failures = {}                                  # reason to number of reports that could not be parsed
+_failed = deque(maxlen=FAILED_REPORTS)          # latest reports that could not be parsed
+
+def _failure_reason(report):
+    """Return why a report could not be parsed, see `validate()`."""
+    return validate(report.raw) or 'bad_time'
+
+def _timed(stage, method):
+    """Return a method that calls `method` and records its time."""
+    def timed(self, *args):
+        start = perf_counter()
+        method(self, *args)
+        elapsed = perf_counter() - start
+        with _lock:
+            _times[stage] += elapsed
+            _calls[stage] += 1
+    return timed
+
+def _timed_datetime(method):
+    """Return a method that calls `method`, records its time and counts whether the report was parsed."""
+    def timed(self, *args):
+        global _parsed
+        start = perf_counter()
+        method(self, *args)
+        elapsed = perf_counter() - start
+        with _lock:
+            _times['datetime'] += elapsed
+            _calls['datetime'] += 1
+            if self.parsed:
+                _parsed += 1
+            else:
+                reason = _failure_reason(self)
+                _failures[reason] = _failures.get(reason, 0) + 1
+                _failed.append(self.raw)
+    return timed
+
+def enable():
+    """Start recording the time and number of calls of each parse stage, and the number of reports parsed.
+
+    Enabling replaces the stage methods of `Report` with timed versions and
+    `disable()` restores them, so there is no overhead while profiling is
+    disabled. Reports parsed in other processes, such as by
+    `Batch.parse_parallel()`, are not counted. The counters are kept, use
+    `reset()` to clear them.
+
+    Example:
+
+        Profile.enable()
+        reports = Batch.parse_many(open('metars.txt'))
+        print(Profile.stats())
+        Profile.disable()
+    """
+    with _lock:
+        if _originals:
+            return
+        for stage, name in STAGES.items():
+            _times.setdefault(stage, 0.0)
+            _calls.setdefault(stage, 0)
+
+            method = Report.__dict__[name]
+            _originals[name] = method
+            setattr(Report, name, _timed_datetime(method) if stage == 'datetime' else _timed(stage, method))
+
+def disable():
+    """Stop recording. The counters are kept."""
+    with _lock:
+        for name, method in _originals.items():
+            setattr(Report, name, method)
+        _originals.clear()
+
+def is_enabled():
+    """Return whether profiling is enabled."""
+    return bool(_originals)
+
+def reset():
+    """Clear all counters."""
+    global _parsed
+    with _lock:
+        for stage in STAGES:
+            _times[stage] = 0.0
+            _calls[stage] = 0
+        _parsed = 0
+        _failures.clear()
+        _failed.clear()
+
+def stats():
+    """Return the recorded counters.
+
+    Returns a dict with:
+      stages: dict of stage to {'calls': int, 'seconds': float, 'us_per_call': float}
+      parsed: number of reports parsed
+      failed: dict of reason to number of reports that could not be parsed, see `validate()`
+      failed_reports: the latest reports that could not be parsed (at most `FAILED_REPORTS`)
+
+    Reports are counted when their date and time are decoded, so lazy reports are counted on first access.
+    """
+    with _lock:
+        return {
+            'stages': {
+                stage: {
+                    'calls': _calls.get(stage, 0),
+                    'seconds': _times.get(stage, 0.0),
+                    'us_per_call': _times[stage] / _calls[stage] * 1e6 if _calls.get(stage) else 0.0,
+                }
+                for stage in STAGES
+            },
+            'parsed': _parsed,
+            'failed': dict(_failures),
+            'failed_reports': list(_failed),
+        }
@@ -0,0 +1,148 @@
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import timezone
+
+
+class ReportStore:
+    """In-memory store of parsed METAR reports, indexed by station and observation time.
+
+    The reports of each station are kept sorted by observation time, so the
+    latest report is found in constant time and reports between two times by
+    binary search. A corrected report (COR) replaces the report with the same
+    station and observation time.
+    """
+    def __init__(self, retention=None):
+        """Create an empty store.
+
+        Parameters
+        ----------
+        retention : int, optional
+          Maximum number of reports kept per station. The oldest reports are removed first.
+          Reports are kept until removed by default.
+        """
+        self.retention = retention
+
+        self._times = {}                        # station to sorted observation times
+        self._reports = {}                      # station to reports, in the same order as the times
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(reports) for reports in self._reports.values())
+
+    def __contains__(self, ident):
+        return ident in self._reports
+
+    def idents(self):
+        """Return the identifiers of all stations with reports."""
+        return list(self._reports)
+
+    def add(self, report):
+        """Add a report. Returns False if the report was not added.
+
+        Reports that could not be parsed are not added. A report with the same
+        station and observation time as a stored report replaces it, unless the
+        stored report is corrected (COR) and the new report is not. Reports older
+        than the retained reports of a station are not added either.
+
+        Parameters
+        ----------
+        report : Report or CompactReport
+          Parsed report.
+        """
+        observed = report.observed
+        if observed is None or report.ident is None:
+            return False
+
+        with self._lock:
+            times = self._times.get(report.ident)
+            if times is None:
+                times = self._times[report.ident] = []
+                reports = self._reports[report.ident] = []
+            else:
+                reports = self._reports[report.ident]
+
+            # Reports usually arrive in order, so check the end first
+            if not times or times[-1] < observed:
+                times.append(observed)
+                reports.append(report)
+            else:
+                index = bisect_left(times, observed)
+                if index < len(times) and times[index] == observed:
+                    if reports[index].report_modifier == 'COR' and report.report_modifier != 'COR':
+                        return False
+                    reports[index] = report
+                    return True
+
+                if self.retention is not None and index <= len(times) - self.retention:
+                    return False
+
+                times.insert(index, observed)
+                reports.insert(index, report)
+
+            if self.retention is not None and len(times) > self.retention:
+                del times[:-self.retention]
+                del reports[:-self.retention]
+
+        return True
+
+    def add_many(self, reports):
+        """Add many reports, see `add()`. Returns the number of reports added.
+
+        Parameters
+        ----------
+        reports : iterable of Report or CompactReport
+          Parsed reports.
+        """
+        return sum(self.add(report) for report in reports)
+
+    def latest(self, ident):
+        """Return the latest report of a station, or None if the station has no reports.
+
+        Parameters
+        ----------
+        ident : str
+          Weather station identifier.
+        """
+        reports = self._reports.get(ident)
+        if not reports:
+            return None
+        return reports[-1]
+
+    def between(self, ident, start=None, end=None):
+        """Return the reports of a station observed between two times, including both, ordered by time.
+
+        Parameters
+        ----------
+        ident : str
+          Weather station identifier.
+        start : datetime, optional
+          Earliest observation time, in UTC or with a timezone. Defaults to the first report.
+        end : datetime, optional
+          Latest observation time, in UTC or with a timezone. Defaults to the last report.
+        """
+        # Times without a timezone are in UTC, like the observation times of the reports
+        if start is not None and start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        if end is not None and end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+
+        with self._lock:
+            times = self._times.get(ident)
+            if not times:
+                return []
+
+            first = 0 if start is None else bisect_left(times, start)
+            last = len(times) if end is None else bisect_right(times, end)
+            return self._reports[ident][first:last]
+
+    def remove(self, ident):
+        """Remove all reports of a station.
+
+        Parameters
+        ----------
+        ident : str
+          Weather station identifier.
+        """
+        with self._lock:
+            self._times.pop(ident, None)
+            self._reports.pop(ident, None)
@@ -0,0 +1,130 @@
+import bz2
+import gzip
+import io
+import mmap
+import os
+import re
+from datetime import datetime, timezone
+
+from metar_parser.Metar import Report, projection, validate
+
+# Date and time line before each report in NOAA cycle files ('2020/11/02 08:25')
+HEADER_RE = re.compile(r'^(\d{4})/(\d{2})/(\d{2}) (\d{2}):(\d{2})$')
+
+def _open(source):
+    """Yield the lines of a path or file object, decompressing gzip and bz2 data.
+
+    Uncompressed files given by path are memory-mapped.
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, 'rb') as f:
+            magic = f.read(3)
+            if magic[:2] == b'\x1f\x8b':
+                f.seek(0)
+                yield from gzip.GzipFile(fileobj=f)
+            elif magic == b'BZh':
+                f.seek(0)
+                yield from bz2.BZ2File(f)
+            elif magic:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    yield from iter(data.readline, b'')
+        return
+
+    if isinstance(source, io.TextIOBase):
+        yield from source
+        return
+
+    # Binary file object, buffered when needed so the magic bytes can be peeked at without consuming them
+    if not hasattr(source, 'peek'):
+        source = io.BufferedReader(source)
+    magic = source.peek(3)[:3]
+    if magic[:2] == b'\x1f\x8b':
+        yield from gzip.GzipFile(fileobj=source)
+    elif magic == b'BZh':
+        yield from bz2.BZ2File(source)
+    else:
+        yield from source
+
+def _read(source):
+    """Yield each report in a file with the date and time of its NOAA header, if any."""
+    reference = None
+    parts = []
+
+    for line in _open(source):
+        if isinstance(line, bytes):
+            line = line.decode('latin-1')
+
+        stripped = line.strip()
+
+        # Lines starting with whitespace continue the previous report
+        if stripped and parts and line[0].isspace():
+            parts.append(stripped)
+        else:
+            if parts:
+                yield ' '.join(parts), reference
+                parts = []
+
+            header = HEADER_RE.match(stripped)
+            if header:
+                reference = datetime(*map(int, header.groups()), tzinfo=timezone.utc)
+            elif stripped:
+                parts.append(stripped)
+
+        # Reports in WMO bulletins end with '='
+        if parts and parts[-1].endswith('='):
+            parts[-1] = parts[-1].rstrip('=')
+            yield ' '.join(parts), reference
+            parts = []
+
+    if parts:
+        yield ' '.join(parts), reference
+
+def read_lines(source):
+    """Yield the raw METAR reports in a file, one report per item.
+
+    Reads line by line, so memory use does not depend on the size of the file.
+    Reports wrapped over lines starting with whitespace are joined. Blank lines,
+    NOAA date and time lines and a trailing '=' are left out.
+
+    Parameters
+    ----------
+    source : str, path or file object
+      File to read. Gzip and bz2 compressed files are decompressed.
+    """
+    for raw, _ in _read(source):
+        yield raw
+
+def read_reports(source, reference=None, lazy=False, fields=None, skip_invalid=False, rejected=None):
+    """Yield the parsed METAR reports in a file, one `Report` per report.
+
+    See `read_lines()` for how the file is read.
+
+    Parameters
+    ----------
+    source : str, path or file object
+      File to read. Gzip and bz2 compressed files are decompressed.
+    reference : datetime, optional
+      Date used to fill in the year and month of the reports, see `Report`.
+      Defaults to the date and time line before the report in NOAA cycle
+      files, or the current date in UTC.
+    lazy : boolean
+      Decode the field groups of each report on first access.
+    fields : iterable of str, optional
+      Field groups to decode, see `Report`. All groups are decoded by default.
+    skip_invalid : boolean
+      Skip lines that are not METAR reports, see `validate()`, without creating a `Report` for them.
+    rejected : callable, optional
+      Called with each skipped line and the reason it was skipped. Implies `skip_invalid`.
+    """
+    if fields is not None:
+        fields = projection(fields)[0]
+    check = skip_invalid or rejected is not None
+
+    for raw, header in _read(source):
+        if check:
+            reason = validate(raw)
+            if reason is not None:
+                if rejected is not None:
+                    rejected(raw, reason)
+                continue
+        yield Report(raw, reference or header, lazy, fields)
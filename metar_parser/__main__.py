@@ -0,0 +1,148 @@
+import argparse
+import os
+import sys
+from time import perf_counter
+
+FORMATS = ('ndjson', 'csv', 'parquet', 'binary')
+
+def _arguments(argv):
+    """Return the parsed command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog='python -m metar_parser',
+        description='Parse METAR reports, one per line, and write the decoded values.',
+    )
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                        help='files with reports, gzip and bz2 compressed files are decompressed (default: standard input)')
+    parser.add_argument('-f', '--format', choices=FORMATS, default='ndjson',
+                        help='output format (default: ndjson)')
+    parser.add_argument('-o', '--output', metavar='PATH',
+                        help='file to write to (default: standard output), required for the parquet and binary formats')
+    parser.add_argument('-w', '--workers', type=int, default=1, metavar='N',
+                        help='number of worker processes (default: 1, parse in this process)')
+    parser.add_argument('--fields', metavar='GROUPS',
+                        help='comma-separated field groups to decode, e.g. wind,temperatures (default: all)')
+    parser.add_argument('--reference', metavar='YYYY-MM-DD',
+                        help='date used to fill in the year and month of the reports (default: NOAA header lines or today)')
+    parser.add_argument('--keep-invalid', action='store_true',
+                        help='also write lines that are not METAR reports, as reports that could not be parsed')
+    parser.add_argument('--stats', action='store_true',
+                        help='print the number of reports, rejected lines and throughput to standard error')
+
+    args = parser.parse_args(argv)
+    if args.format in ('parquet', 'binary') and args.output is None:
+        parser.error('the {} format requires --output'.format(args.format))
+    if args.format == 'parquet':
+        try:
+            import pyarrow
+        except ImportError:
+            parser.error('the parquet format requires pyarrow')
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.fields is not None:
+        from metar_parser.Metar import projection
+        args.fields = [group.strip() for group in args.fields.split(',') if group.strip()]
+        try:
+            projection(args.fields)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.reference is not None:
+        from datetime import datetime, timezone
+        try:
+            args.reference = datetime.strptime(args.reference, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        except ValueError:
+            parser.error('--reference must be a date like 2020-11-02')
+    return args
+
+def _sources(files):
+    """Return the sources to read: the files, or the binary standard input."""
+    if not files or files == ['-']:
+        return [sys.stdin.buffer]
+    return files
+
+def _reports(args, rejected):
+    """Yield the parsed reports of all sources."""
+    from metar_parser import Stream
+
+    rejected = None if args.keep_invalid else rejected
+    if args.workers == 1:
+        for source in _sources(args.files):
+            yield from Stream.read_reports(source, args.reference, fields=args.fields, rejected=rejected)
+        return
+
+    from metar_parser import Batch
+
+    lines = (raw for source in _sources(args.files) for raw in Stream.read_lines(source))
+    yield from Batch.parse_parallel(lines, args.workers, reference=args.reference, fields=args.fields, rejected=rejected)
+
+def _write(args, reports):
+    """Write the reports in the selected format."""
+    if args.format == 'binary':
+        from metar_parser.Archive import ArchiveWriter
+        with ArchiveWriter(args.output) as writer:
+            writer.write_many(reports)
+        return
+
+    from metar_parser import Export
+
+    if args.format == 'parquet':
+        Export.write_parquet(reports, args.output, args.fields)
+        return
+
+    fp = sys.stdout if args.output is None else open(args.output, 'w', newline='', encoding='utf-8')
+    try:
+        if args.format == 'csv':
+            Export.write_csv(reports, fp, args.fields)
+        else:
+            Export.write_ndjson(reports, fp, fields=args.fields)
+    finally:
+        if fp is not sys.stdout:
+            fp.close()
+
+def _print_stats(count, rejected, elapsed):
+    """Print the number of reports, rejected lines per reason and throughput to standard error."""
+    lines = [
+        'reports: {}'.format(count),
+        'rejected: {}'.format(sum(rejected.values())),
+    ]
+    lines.extend('  {}: {}'.format(reason, number) for reason, number in sorted(rejected.items()))
+    lines.append('seconds: {:.3f}'.format(elapsed))
+    lines.append('reports/s: {:.0f}'.format(count / elapsed if elapsed else 0))
+    print('\n'.join(lines), file=sys.stderr)
+
+def main(argv=None):
+    """Run the command-line tool. Returns the exit status.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+      Command-line arguments, without the program name. Defaults to `sys.argv[1:]`.
+    """
+    args = _arguments(argv)
+
+    rejected = {}
+    count = 0
+
+    def reject(raw, reason):
+        rejected[reason] = rejected.get(reason, 0) + 1
+
+    def counted(reports):
+        nonlocal count
+        for report in reports:
+            count += 1
+            yield report
+
+    start = perf_counter()
+    try:
+        _write(args, counted(_reports(args, reject)))
+    except BrokenPipeError:
+        # Output closed early, e.g. by `head`. Silence the flush at exit, see the Python signal documentation.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    elapsed = perf_counter() - start
+
+    if args.stats:
+        _print_stats(count, rejected, elapsed)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Batch, Aggregate
+from datetime import datetime, timedelta
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+REPORTS = [
+    'EHAM 020825Z 35010KT 9999 17/15 Q1002',
+    'EHAM 020855Z 01020G30KT 9999 15/13 Q1004',
+    'EHAM 020905Z 00000KT 9999 14/12 Q1006',
+    'EHAM 020925Z VRB02KT 9999 13/M01 Q1008',
+    'K2W6 020835Z AUTO 27005KT 02/M05 A3004 RMK AO1',
+    'K2W6 020845Z AUTO 02/M05 RMK AO1',
+    'invalid',
+]
+
+@unittest.skipIf(numpy is None, 'requires numpy')
+class TestAggregate(unittest.TestCase):
+    def setUp(self):
+        self.columns = Batch.parse_columns(REPORTS, reference=datetime(2020, 11, 15))
+        self.result = Aggregate.aggregate(self.columns)
+
+    def test_groups(self):
+        self.assertEqual(self.result['ident'].tolist(), ['EHAM', 'EHAM', 'K2W6'])
+        self.assertEqual([str(bucket) for bucket in self.result['bucket']], ['2020-11-02T08:00:00', '2020-11-02T09:00:00', '2020-11-02T08:00:00'])
+        self.assertEqual(self.result['reports'].tolist(), [2, 2, 2])
+
+    def test_statistics(self):
+        self.assertEqual(self.result['temperature_min'].tolist(), [15, 13, 2])
+        self.assertEqual(self.result['temperature_max'].tolist(), [17, 14, 2])
+        self.assertEqual(self.result['temperature_mean'].tolist(), [16, 13.5, 2])
+        self.assertEqual(self.result['dew_point_min'].tolist(), [13, -1, -5])
+        self.assertEqual(self.result['altimeter_pressure_pa_mean'][0], 100300)
+        self.assertAlmostEqual(self.result['wind_speed_ms_max'][0], 20 * 0.514444)
+
+    def test_missing(self):
+        # Only one K2W6 report has wind and pressure, and there are no gusts in the second EHAM bucket
+        self.assertEqual(self.result['wind_speed_ms_count'].tolist(), [2, 2, 1])
+        self.assertEqual(self.result['altimeter_pressure_pa_count'].tolist(), [2, 2, 1])
+        self.assertEqual(self.result['wind_gust_ms_count'].tolist(), [1, 0, 0])
+        self.assertIs(self.result['wind_gust_ms_max'][1], numpy.ma.masked)
+
+    def test_directions(self):
+        # 350 and 10 degrees average to 0, calm and VRB winds have no direction
+        self.assertEqual(self.result['wind_direction_count'].tolist(), [2, 0, 1])
+        self.assertAlmostEqual(self.result['wind_direction_mean'][0], 0)
+        self.assertIs(self.result['wind_direction_mean'][1], numpy.ma.masked)
+        self.assertEqual(self.result['wind_direction_mean'][2], 270)
+        self.assertNotIn('wind_direction_min', self.result)
+
+    def test_interval(self):
+        result = Aggregate.aggregate(self.columns, interval=timedelta(days=1), values=['temperature'])
+        self.assertEqual(result['ident'].tolist(), ['EHAM', 'K2W6'])
+        self.assertEqual(result['temperature_mean'].tolist(), [14.75, 2])
+        self.assertNotIn('wind_speed_ms_mean', result)
+
+    def test_fields(self):
+        columns = Batch.parse_columns(REPORTS, reference=datetime(2020, 11, 15), fields=['wind'])
+        result = Aggregate.aggregate(columns)
+        self.assertEqual(result['wind_speed_ms_max'].tolist(), self.result['wind_speed_ms_max'].tolist())
+        self.assertNotIn('temperature_mean', result)
+
+        with self.assertRaisesRegex(ValueError, 'temperature, dew_point'):
+            Aggregate.aggregate(columns, values=['wind_speed_ms', 'temperature', 'dew_point'])
+
+    def test_empty(self):
+        result = Aggregate.aggregate(Batch.parse_columns([]))
+        self.assertEqual(len(result['ident']), 0)
+        self.assertEqual(len(result['temperature_mean']), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Archive
+from datetime import date
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+REFERENCE = date(2020, 11, 15)
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+    'ZMUB 021000Z VRB09G18MPS CAVOK M09/M13 Q1025 NOSIG RMK QFE660.4 66',
+    'KJFK 021451Z COR 28015KT M1/4SM FG OVC002 M01/M01 A2992',
+    'invalid',
+]
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'metars.arc')
+        self.reports = [Metar.Report(raw, REFERENCE) for raw in REPORTS]
+        with Archive.ArchiveWriter(self.path, chunksize=2) as writer:
+            writer.write_many(self.reports)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_records(self):
+        with Archive.Archive(self.path) as archive:
+            self.assertEqual(len(archive), len(REPORTS))
+            for record, report in zip(archive, self.reports):
+                self.assertEqual(record.raw, report.raw)
+                self.assertEqual(record.ident, report.ident)
+                self.assertEqual(record.observed, report.observed)
+                self.assertEqual(record.parsed, report.parsed)
+                for name in ('report_modifier', 'wind_direction', 'wind_speed', 'wind_speed_unit', 'wind_gust', 'temperature', 'dew_point', 'altimeter_pressure_pa'):
+                    self.assertEqual(getattr(record, name), getattr(report, name), name)
+                self.assertEqual(record.visibility_distance_m, report.visibility_distance_m)
+
+    def test_random_access(self):
+        with Archive.Archive(self.path) as archive:
+            self.assertEqual(archive[-2].ident, 'KJFK')
+            self.assertTrue(archive[-2].visibility_less)
+            self.assertEqual(archive[2].wind_direction, 'VRB')
+            self.assertEqual(archive[2].wind_speed_unit, 'mps')
+            self.assertEqual(archive.raw(1), REPORTS[1])
+            self.assertIsNone(archive[4].observed)
+            with self.assertRaises(IndexError):
+                archive[len(REPORTS)]
+
+    def test_empty(self):
+        path = os.path.join(self.directory, 'empty.arc')
+        Archive.ArchiveWriter(path).close()
+        with Archive.Archive(path) as archive:
+            self.assertEqual(len(archive), 0)
+            self.assertEqual(list(archive), [])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Archive.Archive(self.path + '.raw')
+
+    @unittest.skipIf(numpy is None, 'requires numpy')
+    def test_columns(self):
+        archive = Archive.Archive(self.path)
+        columns = archive.columns()
+        self.assertEqual(columns['ident'].tolist(), [b'EHAM', b'K2W6', b'ZMUB', b'KJFK', b''])
+        self.assertEqual(columns['wind_speed'].tolist(), [22, Archive.MISSING_INT, 9, 15, Archive.MISSING_INT])
+        self.assertEqual(columns['altimeter_pressure_pa'][0], 100200)
+        self.assertTrue(numpy.isnan(columns['altimeter_pressure_pa'][4]))
+        self.assertFalse(columns['temperature'].flags.writeable)
+        del columns
+        archive.close()
+
+if __name__ == '__main__':
+    unittest.main()
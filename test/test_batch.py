@@ -0,0 +1,64 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Batch
+from datetime import datetime
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+    'KIAB 020956Z COR AUTO 17005KT 10SM CLR 04/M05 A3045 RMK AO2 SLP318 T00391053 COR 1000',
+    'invalid',
+]
+
+class TestBatch(unittest.TestCase):
+    def test_parse_many(self):
+        reports = Batch.parse_many(REPORTS)
+        self.assertEqual(len(reports), len(REPORTS))
+        for i, report in enumerate(reports):
+            self.assertEqual(report.result(), Metar.Report(REPORTS[i]).result())
+
+    def test_reference(self):
+        reports = Batch.parse_many(REPORTS, reference=datetime(2019, 3, 15))
+        self.assertEqual([report.get_date() for report in reports], ['2019-03-02', '2019-03-02', '2019-03-02', None])
+
+    def test_shared_decoders(self):
+        # Tokens and times repeated in a batch are decoded once, with the same values as parsing each line
+        reference = datetime(2019, 3, 15)
+        reports = Batch.parse_many(REPORTS * 3, reference=reference)
+        for raw, report in zip(REPORTS * 3, reports):
+            expected = Metar.Report(raw, reference)
+            self.assertEqual(list(report.__dict__.items()), list(expected.__dict__.items()))
+        self.assertIs(reports[0].observed, reports[4].observed)
+
+    def test_parse_parallel(self):
+        reports = REPORTS * 5
+        expected = [report.result() for report in Batch.parse_many(reports)]
+
+        results = list(Batch.parse_parallel(reports, workers=2, chunksize=3))
+        self.assertTrue(all(isinstance(report, Metar.CompactReport) for report in results))
+        self.assertEqual([report.result() for report in results], expected)
+
+        results = Batch.parse_parallel(reports, workers=2, chunksize=3, ordered=False)
+        self.assertCountEqual([report.result() for report in results], expected)
+
+    def test_parse_threaded(self):
+        reports = REPORTS * 5
+        expected = [report.result() for report in Batch.parse_many(reports)]
+
+        results = list(Batch.parse_threaded(reports, workers=2, chunksize=3))
+        self.assertTrue(all(isinstance(report, Metar.Report) for report in results))
+        self.assertEqual([report.result() for report in results], expected)
+
+        results = Batch.parse_threaded(reports, workers=2, chunksize=3, ordered=False, lazy=True)
+        self.assertCountEqual([report.result() for report in results], expected)
+
+        rejected = []
+        results = Batch.parse_threaded(reports, workers=2, chunksize=3, fields=['wind'], rejected=lambda raw, reason: rejected.append(reason))
+        self.assertEqual([report.result() for report in results], [Metar.Report(raw, fields=['wind']).result() for raw in REPORTS[:3] * 5])
+        self.assertEqual(rejected, ['no_ident'] * 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import unittest
+from unittest import mock
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Cache
+from datetime import date
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+    'KIAB 020956Z COR AUTO 17005KT 10SM CLR 04/M05 A3045 RMK AO2 SLP318 T00391053 COR 1000',
+]
+
+class TestCache(unittest.TestCase):
+    def test_result(self):
+        cache = Cache.ReportCache(reference=date(2020, 11, 15))
+        for raw in REPORTS:
+            report = cache.parse(raw)
+            self.assertIsInstance(report, Metar.CompactReport)
+            self.assertEqual(report.result(), Metar.Report(raw, date(2020, 11, 15)).result())
+
+    def test_hits(self):
+        cache = Cache.ReportCache()
+        first = cache.parse_many(REPORTS)
+        second = cache.parse_many(REPORTS)
+        self.assertEqual((cache.hits, cache.misses), (3, 3))
+        for i in range(len(REPORTS)):
+            self.assertIs(first[i], second[i])
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_immutable(self):
+        cache = Cache.ReportCache()
+        report = cache.parse(REPORTS[0])
+        report.get_wind_variable_directions().append(999)
+        report.get_cloud_layers()[0]['height'] = -1
+        report.result()['clouds']['layers'].clear()
+
+        report = cache.parse(REPORTS[0])
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(report.get_wind_variable_directions(), [190, 250])
+        self.assertEqual([layer['height'] for layer in report.get_cloud_layers()], [800, 1800, 2200])
+        with self.assertRaises(TypeError):
+            report.cloud_layers[0][1] = -1
+
+    def test_maxsize(self):
+        cache = Cache.ReportCache(maxsize=2)
+        cache.parse(REPORTS[0])
+        cache.parse(REPORTS[1])
+        cache.parse(REPORTS[0])
+        cache.parse(REPORTS[2])     # removes REPORTS[1], the least recently used
+        self.assertEqual(len(cache), 2)
+
+        cache.parse(REPORTS[0])
+        cache.parse(REPORTS[1])
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_ttl(self):
+        cache = Cache.ReportCache(ttl=60)
+        with mock.patch.object(Cache, 'monotonic', return_value=1000):
+            cache.parse(REPORTS[0])
+        with mock.patch.object(Cache, 'monotonic', return_value=1059):
+            cache.parse(REPORTS[0])
+        with mock.patch.object(Cache, 'monotonic', return_value=1060):
+            cache.parse(REPORTS[0])
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_interned_ident(self):
+        cache = Cache.ReportCache()
+        first = cache.parse(REPORTS[0])
+        second = cache.parse(REPORTS[0].replace('17/15', '16/15'))
+        self.assertIs(first.get_ident(), second.get_ident())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import sys
+import contextlib
+import csv
+import io
+import json
+import tempfile
+import unittest
+from unittest import mock
+from datetime import datetime, timezone
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Archive
+from metar_parser.__main__ import main
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'TAF EHAM 020500Z 0206/0312 22015KT 9999 SCT025',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+    'invalid',
+]
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(self.directory, 'metars.txt')
+        with open(self.path, 'w') as f:
+            f.write('\n'.join(REPORTS) + '\n')
+
+    def _run(self, *args):
+        """Run the tool and return the exit status, standard output and standard error."""
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            status = main(list(args))
+        return status, out.getvalue(), err.getvalue()
+
+    def test_ndjson(self):
+        status, out, _ = self._run('--reference', '2020-10-02', self.path)
+        self.assertEqual(status, 0)
+        lines = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual([line['ident'] for line in lines], ['EHAM', 'K2W6'])
+        self.assertEqual(lines[0]['reported'], '2020-10-02T08:25:00+00:00')
+        self.assertEqual(lines[0], Metar.Report(REPORTS[0], datetime(2020, 10, 2, tzinfo=timezone.utc)).result())
+
+    def test_keep_invalid(self):
+        _, out, _ = self._run('--keep-invalid', self.path)
+        self.assertEqual([json.loads(line)['parsed'] for line in out.splitlines()], [True, False, True, False])
+
+    def test_fields(self):
+        _, out, _ = self._run('--fields', 'wind', self.path)
+        line = json.loads(out.splitlines()[0])
+        self.assertIn('wind', line)
+        self.assertNotIn('temperatures', line)
+
+    def test_csv(self):
+        _, out, _ = self._run('--format', 'csv', '--fields', 'wind,temperatures', self.path)
+        rows = list(csv.DictReader(io.StringIO(out)))
+        self.assertEqual([row['ident'] for row in rows], ['EHAM', 'K2W6'])
+        self.assertEqual(rows[1]['temperature'], '2')
+        self.assertEqual(rows[1]['wind_speed'], '')
+
+    def test_binary(self):
+        output = os.path.join(self.directory, 'metars.arc')
+        status, out, _ = self._run('--format', 'binary', '--output', output, self.path)
+        self.assertEqual((status, out), (0, ''))
+        with Archive.Archive(output) as archive:
+            self.assertEqual([record.ident for record in archive], ['EHAM', 'K2W6'])
+
+    @unittest.skipIf(pyarrow is None, 'requires pyarrow')
+    def test_parquet(self):
+        output = os.path.join(self.directory, 'metars.parquet')
+        status, out, _ = self._run('--format', 'parquet', '--output', output, '--fields', 'wind', self.path)
+        self.assertEqual((status, out), (0, ''))
+        table = pyarrow.parquet.read_table(output)
+        self.assertEqual(table.column('ident').to_pylist(), ['EHAM', 'K2W6'])
+        self.assertEqual(table.column('wind_speed').to_pylist(), [22, None])
+
+    def test_workers(self):
+        _, serial, _ = self._run('--reference', '2020-10-02', '--fields', 'wind', self.path)
+        _, parallel, _ = self._run('--reference', '2020-10-02', '--fields', 'wind', '--workers', '2', self.path)
+        self.assertEqual(parallel, serial)
+
+    def test_stats(self):
+        _, _, err = self._run('--stats', self.path)
+        self.assertIn('reports: 2', err)
+        self.assertIn('rejected: 2', err)
+        self.assertIn('taf: 1', err)
+        self.assertIn('no_ident: 1', err)
+
+    def test_errors(self):
+        for args in [('--format', 'binary', self.path), ('--format', 'parquet', self.path), ('--fields', 'runway', self.path), ('--reference', '2020-13-01', self.path), ('--workers', '0', self.path)]:
+            with self.assertRaises(SystemExit):
+                self._run(*args)
+
+    def test_parquet_without_pyarrow(self):
+        output = os.path.join(self.directory, 'metars.parquet')
+        err = io.StringIO()
+        with mock.patch.dict(sys.modules, {'pyarrow': None}), contextlib.redirect_stderr(err), self.assertRaises(SystemExit):
+            main(['--format', 'parquet', '--output', output, self.path])
+        self.assertIn('requires pyarrow', err.getvalue())
+        self.assertFalse(os.path.exists(output))
+
+if __name__ == '__main__':
+    unittest.main()
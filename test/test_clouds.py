@@ -0,0 +1,52 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+    'UTDL 021030Z 08004MPS 7000 NSC 18/M04 Q1022 R26/CLRD70 NOSIG RMK QFE729/0972',
+    'ZMUB 021000Z VRB01MPS CAVOK M09/M13 Q1025 NOSIG RMK QFE660.4 66',
+    'EGLL 021050Z 24015KT 9999 SCT012 BKN025CB 12/10 Q1008 TEMPO OVC008',
+    'KJFK 021451Z 28015KT 1/4SM FG VV001 M01/M01 A2992',
+    'LFPG 021030Z AUTO 24010KT 9999 FEW///TCU BKN030/// 12/09 Q1012',
+]
+
+class TestClouds(unittest.TestCase):
+    def test_covers(self):
+        for i, value in enumerate([['FEW', 'SCT', 'BKN'], None, None, None, ['SCT', 'BKN'], ['VV'], ['FEW', 'BKN']]):
+            report = Metar.Report(REPORTS[i])
+            layers = report.get_cloud_layers()
+            self.assertEqual(None if layers is None else [layer['cover'] for layer in layers], value)
+
+    def test_heights(self):
+        for i, value in enumerate([[800, 1800, 2200], None, None, None, [1200, 2500], [100], [None, 3000]]):
+            report = Metar.Report(REPORTS[i])
+            layers = report.get_cloud_layers()
+            self.assertEqual(None if layers is None else [layer['height'] for layer in layers], value)
+
+    def test_heights_m(self):
+        report = Metar.Report(REPORTS[0])
+        self.assertAlmostEqual(report.get_cloud_layers()[0]['height_m'], 243.84)
+
+    def test_types(self):
+        for i, value in enumerate([[None, None, None], None, None, None, [None, 'CB'], [None], ['TCU', None]]):
+            report = Metar.Report(REPORTS[i])
+            layers = report.get_cloud_layers()
+            self.assertEqual(None if layers is None else [layer['type'] for layer in layers], value)
+
+    def test_stored_form(self):
+        report = Metar.Report(REPORTS[6])
+        self.assertEqual(report.cloud_layers[0], Metar.CloudLayer('FEW', None, None, 'TCU'))
+        self.assertEqual(report.get_cloud_layers()[0], {'cover': 'FEW', 'height': None, 'height_m': None, 'type': 'TCU'})
+
+    def test_sky_condition(self):
+        for i, value in enumerate([None, None, 'NSC', 'CAVOK', None, None, None]):
+            report = Metar.Report(REPORTS[i])
+            self.assertEqual(report.get_sky_condition(), value)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Batch
+from datetime import datetime
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+    'ZMUB 021000Z VRB09G18MPS CAVOK M09/M13 Q1025 NOSIG RMK QFE660.4 66',
+    'CYFC 021002Z AUTO 33002KT M3/4SM R09/5000FT/U -RA BR OVC029 10/10 A2917 RMK PRESFR SLP880 DENSITY ALT 200FT',
+    'invalid',
+]
+
+@unittest.skipIf(numpy is None, 'requires numpy')
+class TestColumns(unittest.TestCase):
+    def setUp(self):
+        self.reference = datetime(2020, 11, 15)
+        self.columns = Batch.parse_columns(REPORTS, reference=self.reference)
+        self.reports = Batch.parse_many(REPORTS, reference=self.reference)
+
+    def test_length(self):
+        for name, column in self.columns.items():
+            self.assertEqual(len(column), len(REPORTS), name)
+
+    def test_strings(self):
+        self.assertEqual(self.columns['ident'].tolist(), ['EHAM', 'K2W6', 'ZMUB', 'CYFC', ''])
+        self.assertEqual(self.columns['wind_speed_unit'].tolist(), ['kt', '', 'mps', 'kt', ''])
+
+    def test_observed(self):
+        self.assertEqual(str(self.columns['observed'][0]), '2020-11-02T08:25:00')
+        self.assertTrue(numpy.isnat(self.columns['observed'][4]))
+
+    def test_values(self):
+        for name in list(Batch.NUMERIC_COLUMNS) + ['wind_speed_ms', 'wind_gust_ms', 'visibility_distance_m', 'altimeter_pressure_pa']:
+            for i, report in enumerate(self.reports):
+                value = getattr(report, name)
+                if value is None or value == 'VRB':
+                    self.assertIs(self.columns[name][i], numpy.ma.masked, name)
+                else:
+                    self.assertAlmostEqual(self.columns[name][i], value, msg=name)
+
+    def test_fields(self):
+        columns = Batch.parse_columns(REPORTS, reference=self.reference, fields={'altimeter'})
+        self.assertEqual(sorted(columns), ['altimeter_pressure', 'altimeter_pressure_pa', 'altimeter_pressure_unit', 'ident', 'observed', 'parsed'])
+        for name, column in columns.items():
+            self.assertEqual(column.tolist(), self.columns[name].tolist(), name)
+
+    def test_default_fields(self):
+        columns = Batch.parse_columns(REPORTS, reference=self.reference, fields=Batch.COLUMN_GROUPS)
+        self.assertEqual(sorted(columns), sorted(self.columns))
+        for name, column in columns.items():
+            self.assertEqual(column.tolist(), self.columns[name].tolist(), name)
+
+if __name__ == '__main__':
+    unittest.main()
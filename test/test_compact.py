@@ -0,0 +1,52 @@
+import os
+import sys
+import pickle
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'KIAB 020956Z COR AUTO 17005KT 10SM CLR 04/M05 A3045 RMK AO2 SLP318 T00391053 COR 1000',
+    'CYBC 021001Z AUTO 33003KT M2 1/4SM R10/5500FT/N -RA BR BKN024 OVC045 04/03 A2926 RMK VIS VRB 5/8-3 SLP912',
+    'invalid',
+]
+
+class TestCompact(unittest.TestCase):
+    def test_result(self):
+        for raw in REPORTS:
+            report = Metar.Report(raw)
+            compact = Metar.CompactReport.from_report(report)
+            self.assertEqual(compact.result(), report.result())
+            self.assertEqual(compact.json(), report.json())
+
+    def test_getters(self):
+        compact = Metar.CompactReport.from_report(Metar.Report(REPORTS[0]))
+        self.assertEqual(compact.get_ident(), 'EHAM')
+        self.assertEqual(compact.get_time(), '08:25')
+        self.assertEqual(compact.get_wind_variable_directions(), [190, 250])
+        self.assertEqual(compact.get_altimeter_pressure_pa(), 100200)
+
+    def test_from_lazy_report(self):
+        for raw in REPORTS:
+            compact = Metar.CompactReport.from_report(Metar.Report(raw, lazy=True))
+            self.assertEqual(compact.result(), Metar.Report(raw).result())
+
+    def test_to_report(self):
+        for raw in REPORTS:
+            report = Metar.CompactReport.from_report(Metar.Report(raw)).to_report()
+            self.assertIsInstance(report, Metar.Report)
+            self.assertEqual(report.result(), Metar.Report(raw).result())
+
+    def test_immutable(self):
+        compact = Metar.CompactReport.from_report(Metar.Report(REPORTS[0]))
+        with self.assertRaises(AttributeError):
+            compact.ident = 'EGPK'
+
+    def test_pickle(self):
+        compact = Metar.CompactReport.from_report(Metar.Report(REPORTS[1]))
+        self.assertEqual(pickle.loads(pickle.dumps(compact)), compact)
+
+if __name__ == '__main__':
+    unittest.main()
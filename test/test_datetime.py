@@ -4,7 +4,7 @@ import unittest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from metar_parser import Metar
-from datetime import datetime
+from datetime import date, datetime, timezone
 
 REPORTS = [
     "EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG",
@@ -12,32 +12,74 @@ REPORTS = [
     "PAUN 131256Z AUTO 08006KT 10SM SCT021 M04/M05 A2931 RMK AO2 SNE15 SLP927 P0000 T10391050 FZRANO",
 ]
 
-DT = datetime.today()
-YEAR_MONTH = DT.strftime('%Y-%m-')
+REFERENCE = datetime(2020, 11, 15, 12, 0, tzinfo=timezone.utc)
 
-class TestVisibility(unittest.TestCase):
+class TestDatetime(unittest.TestCase):
     def test_iso(self):
         for i, value in enumerate([
-                YEAR_MONTH + '02T08:25:00+00:00',
-                YEAR_MONTH + '02T09:45:00+00:00',
-                YEAR_MONTH + '13T12:56:00+00:00',
+                '2020-11-02T08:25:00+00:00',
+                '2020-11-02T09:45:00+00:00',
+                '2020-11-13T12:56:00+00:00',
             ]):
-            report = Metar.Report(REPORTS[i])
+            report = Metar.Report(REPORTS[i], REFERENCE)
             self.assertEqual(report.get_reported(), value)
 
     def test_date(self):
         for i, value in enumerate([
-                YEAR_MONTH + '02',
-                YEAR_MONTH + '02',
-                YEAR_MONTH + '13',
+                '2020-11-02',
+                '2020-11-02',
+                '2020-11-13',
             ]):
-            report = Metar.Report(REPORTS[i])
+            report = Metar.Report(REPORTS[i], REFERENCE)
             self.assertEqual(report.get_date(), value)
 
     def test_time(self):
         for i, value in enumerate(['08:25', '09:45', '12:56']):
-            report = Metar.Report(REPORTS[i])
+            report = Metar.Report(REPORTS[i], REFERENCE)
             self.assertEqual(report.get_time(), value)
 
+    def test_observed(self):
+        report = Metar.Report(REPORTS[0], REFERENCE)
+        self.assertEqual(report.get_observed(), datetime(2020, 11, 2, 8, 25, tzinfo=timezone.utc))
+
+    def test_current_date(self):
+        today = datetime.now(timezone.utc).date()
+        report = Metar.Report('EHAM {:02d}0825Z 21022KT 9999 17/15 Q1002'.format(today.day))
+        self.assertEqual(report.get_date(), today.isoformat())
+
+    def test_previous_month(self):
+        for reference, value in [
+                (date(2020, 11, 1), '2020-10-13'),
+                (date(2020, 1, 12), '2019-12-13'),
+                (date(2020, 1, 13), '2020-01-13'),
+            ]:
+            report = Metar.Report(REPORTS[2], reference)
+            self.assertEqual(report.get_date(), value)
+
+    def test_missing_day(self):
+        for reference, value in [
+                (date(2020, 11, 15), '2020-10-31'),
+                (date(2020, 3, 15), '2020-01-31'),
+                (date(2020, 12, 30), '2020-10-31'),
+            ]:
+            report = Metar.Report('EHAM 310825Z 21022KT 9999 17/15 Q1002', reference)
+            self.assertEqual(report.get_date(), value)
+
+        report = Metar.Report('EHAM 290825Z 21022KT 9999 17/15 Q1002', date(2020, 3, 1))
+        self.assertEqual(report.get_date(), '2020-02-29')
+
+    def test_invalid(self):
+        for raw in [
+                'EHAM 320825Z 21022KT 9999 17/15 Q1002',
+                'EHAM 002425Z 21022KT 9999 17/15 Q1002',
+                'EHAM 020860Z 21022KT 9999 17/15 Q1002',
+                'EHAM 02082Z 21022KT 9999 17/15 Q1002',
+                'EHAM 0208250Z 21022KT 9999 17/15 Q1002',
+            ]:
+            report = Metar.Report(raw, REFERENCE)
+            self.assertFalse(report.is_parsed())
+            self.assertIsNone(report.get_reported())
+            self.assertIsNone(report.get_wind_speed())
+
 if __name__ == '__main__':
     unittest.main()
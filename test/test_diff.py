@@ -0,0 +1,60 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Diff
+from datetime import date
+
+REFERENCE = date(2020, 11, 15)
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'EHAM 020855Z 21020KT 9999 FEW008 17/15 Q1003 NOSIG',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+]
+
+def parse(raw):
+    return Metar.Report(raw, REFERENCE)
+
+class TestDiff(unittest.TestCase):
+    def test_diff(self):
+        changes = Diff.diff(parse(REPORTS[0]), parse(REPORTS[1]))
+        self.assertEqual(changes, {
+            'reported': '2020-11-02T08:55:00+00:00',
+            'time': '08:55',
+            'wind': {'speed': 20, 'variable_directions': None, 'speed_ms': parse(REPORTS[1]).get_wind_speed_ms()},
+            'clouds': {'layers': parse(REPORTS[1]).get_cloud_layers()},
+            'altimeter': {'pressure': 1003, 'pressure_pa': parse(REPORTS[1]).get_altimeter_pressure_pa()},
+        })
+
+    def test_diff_first(self):
+        report = parse(REPORTS[0])
+        result = report.result()
+        del result['raw'], result['ident']
+        self.assertEqual(Diff.diff(None, report), result)
+
+    def test_differ(self):
+        differ = Diff.ReportDiffer(REFERENCE)
+        first = differ.parse(REPORTS[0])
+        self.assertEqual(first['ident'], 'EHAM')
+        self.assertEqual(first['wind']['speed'], 22)
+
+        self.assertIsNone(differ.parse(REPORTS[0] + ' '))
+        self.assertEqual(differ.parse(REPORTS[1])['wind'], {'speed': 20, 'variable_directions': None, 'speed_ms': parse(REPORTS[1]).get_wind_speed_ms()})
+        self.assertEqual(differ.parse(REPORTS[2])['ident'], 'K2W6')
+        self.assertEqual(len(differ), 2)
+
+    def test_update_many(self):
+        differ = Diff.ReportDiffer()
+        reports = [parse(raw) for raw in [REPORTS[0], REPORTS[0], REPORTS[1]]]
+        self.assertEqual([changes['ident'] for changes in differ.update_many(reports)], ['EHAM', 'EHAM'])
+
+    def test_compact(self):
+        differ = Diff.ReportDiffer()
+        differ.update(Metar.CompactReport.from_report(parse(REPORTS[0])))
+        changes = differ.update(Metar.CompactReport.from_report(parse(REPORTS[1])))
+        self.assertEqual(changes['altimeter']['pressure'], 1003)
+
+if __name__ == '__main__':
+    unittest.main()
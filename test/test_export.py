@@ -0,0 +1,125 @@
+import os
+import sys
+import csv
+import io
+import json
+import tempfile
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Export
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+    'KIAB 020956Z COR AUTO 17005KT 10SM CLR 04/M05 A3045 RMK AO2 SLP318 T00391053 COR 1000',
+    'ZMUB 021000Z VRB09G18MPS CAVOK M09/M13 Q1025 NOSIG RMK QFE660.4 66',
+    'CYBC 021001Z AUTO 33003KT M2 1/4SM R10/5500FT/N -RA BR BKN024 OVC045 04/03 A2926 RMK VIS VRB 5/8-3 SLP912',
+    'MTPP 020959Z AUTO /////KT 9000 ////// ///// Q//// A//// NOSIG',
+    'invalid',
+]
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.reports = [Metar.Report(raw) for raw in REPORTS]
+
+    def test_to_json(self):
+        for report in self.reports:
+            self.assertEqual(Export.to_json(report), report.json())
+            self.assertEqual(Export.to_json(Metar.CompactReport.from_report(report)), report.json())
+
+    def test_write_ndjson(self):
+        for chunksize in [1, 3, 1000]:
+            f = io.StringIO()
+            Export.write_ndjson(self.reports, f, chunksize)
+            self.assertEqual(f.getvalue(), ''.join(report.json() + '\n' for report in self.reports))
+
+    def test_write_json_array(self):
+        for chunksize in [1, 3, 1000]:
+            f = io.StringIO()
+            Export.write_json_array(self.reports, f, chunksize)
+            self.assertEqual(f.getvalue(), json.dumps([report.result() for report in self.reports]))
+
+        f = io.StringIO()
+        Export.write_json_array([], f)
+        self.assertEqual(f.getvalue(), '[]')
+
+    def test_write_csv(self):
+        for chunksize in [1, 3, 1000]:
+            f = io.StringIO(newline='')
+            Export.write_csv(self.reports, f, chunksize=chunksize)
+            rows = list(csv.DictReader(io.StringIO(f.getvalue())))
+
+            self.assertEqual(list(rows[0]), Export.flat_columns())
+            self.assertEqual(len(rows), len(self.reports))
+            for row, report in zip(rows, self.reports):
+                self.assertEqual(row['raw'], report.raw)
+                self.assertEqual(row['temperature'], '' if report.temperature is None else str(report.temperature))
+                self.assertEqual(row['cloud_layers'], '' if report.cloud_layers is None else json.dumps(report.get_cloud_layers()))
+
+    def test_write_csv_fields(self):
+        f = io.StringIO(newline='')
+        Export.write_csv(self.reports, f, fields=['wind'])
+        header = f.getvalue().split('\n')[0].split(',')
+        self.assertEqual(header, Export.flat_columns(['wind']))
+        self.assertIn('wind_speed', header)
+        self.assertNotIn('temperature', header)
+
+    def test_write_ndjson_fields(self):
+        f = io.StringIO()
+        Export.write_ndjson([Metar.CompactReport.from_report(report) for report in self.reports], f, fields=['wind'])
+        expected = [Metar.Report(raw, fields=['wind']).json() for raw in REPORTS]
+        self.assertEqual(f.getvalue().splitlines(), expected)
+
+    def test_escape(self):
+        report = Metar.Report('EHAM 020825Z 21022KT 9999 17/15 Q1002 RMK "é\\')
+        self.assertEqual(Export.to_json(report), report.json())
+
+    def test_column_types(self):
+        self.assertEqual(sorted(Export.COLUMN_TYPES), sorted(Export.flat_columns()))
+        self.assertLessEqual(set(Export.COLUMN_TYPES.values()), {'string', 'bool', 'int', 'float', 'directions', 'weather', 'clouds'})
+
+        for group in Metar.SECTIONS:
+            self.assertLessEqual(set(Export.flat_columns([group])), set(Export.COLUMN_TYPES))
+
+    @unittest.skipIf(pyarrow is None, 'requires pyarrow')
+    def test_write_parquet(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'metars.parquet')
+            Export.write_parquet(self.reports, path, row_group_size=3)
+
+            file = pyarrow.parquet.ParquetFile(path)
+            self.assertEqual(file.metadata.num_row_groups, 3)
+            self.assertEqual(file.schema_arrow, Export.parquet_schema())
+
+            rows = file.read().to_pylist()
+            self.assertEqual(len(rows), len(self.reports))
+            for row, report in zip(rows, self.reports):
+                self.assertEqual(list(row), Export.flat_columns())
+                for name, value in row.items():
+                    expected = getattr(report, name)
+                    if name == 'wind_direction' and expected is not None:
+                        expected = str(expected)
+                    elif name in Metar.RESULT_FORMS:
+                        expected = Metar.RESULT_FORMS[name](expected)
+                    self.assertEqual(value, expected, name)
+
+    @unittest.skipIf(pyarrow is None, 'requires pyarrow')
+    def test_write_parquet_fields(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'metars.parquet')
+            Export.write_parquet(self.reports, path, fields=['temperatures'])
+            table = pyarrow.parquet.read_table(path)
+            self.assertEqual(table.column_names, Export.flat_columns(['temperatures']))
+            self.assertEqual(table.column('temperature').to_pylist(), [report.temperature for report in self.reports])
+
+            Export.write_parquet([], path)
+            self.assertEqual(pyarrow.parquet.read_table(path).num_rows, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import asyncio
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Feed
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+    'KIAB 020956Z COR AUTO 17005KT 10SM CLR 04/M05 A3045 RMK AO2 SLP318 T00391053 COR 1000',
+]
+
+def stream(lines):
+    reader = asyncio.StreamReader()
+    reader.feed_data(''.join(line + '\r\n' for line in lines).encode())
+    reader.feed_eof()
+    return reader
+
+class TestFeed(unittest.IsolatedAsyncioTestCase):
+    async def test_stream(self):
+        feed = Feed.FeedParser(stream(REPORTS * 10 + ['', 'EGPK 020920Z 25010G21KT 8000 09/08 Q0991=']), batch_size=4)
+        reports = [report async for report in feed]
+        self.assertEqual([report.get_raw() for report in reports], REPORTS * 10 + ['EGPK 020920Z 25010G21KT 8000 09/08 Q0991'])
+        self.assertEqual(reports[0].result(), Metar.Report(REPORTS[0]).result())
+        self.assertEqual(feed.stats()['reports'], 31)
+        self.assertEqual(feed.stats()['queue_depth'], 0)
+
+    async def test_streams(self):
+        feed = Feed.FeedParser(stream(REPORTS), stream(REPORTS[:1]), stream([]))
+        reports = [report.get_raw() async for report in feed]
+        self.assertCountEqual(reports, REPORTS + REPORTS[:1])
+
+    async def test_backpressure(self):
+        feed = Feed.FeedParser(stream(REPORTS * 100), batch_size=10, queue_size=20)
+        await feed.__anext__()
+        await asyncio.sleep(0.1)
+        self.assertLessEqual(feed.stats()['queue_depth'], 20)
+        self.assertLessEqual(feed.reports + len(feed._batch) + feed.stats()['queue_depth'], 20 + 3 * 10)
+        await feed.aclose()
+
+    async def test_socket(self):
+        async def send(reader, writer):
+            for raw in REPORTS:
+                writer.write(raw.encode() + b'\n')
+                await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(send, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            reports = [report.get_ident() async for report in Feed.FeedParser(reader)]
+            writer.close()
+        self.assertEqual(reports, ['EHAM', 'K2W6', 'KIAB'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import sys
+import json
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Batch, Export, Diff
+from datetime import date
+
+REFERENCE = date(2020, 11, 15)
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+    'KJFK 021451Z COR VRB03KT M1/4SM FG OVC002 M01/M01 A2992',
+    'invalid',
+]
+
+FIELDS = {'wind', 'altimeter'}
+
+class TestFields(unittest.TestCase):
+    def test_result(self):
+        for raw in REPORTS:
+            full = Metar.Report(raw, REFERENCE).result()
+            result = Metar.Report(raw, REFERENCE, fields=FIELDS).result()
+            self.assertEqual(list(result), ['raw', 'parsed', 'ident', 'reported', 'date', 'time', 'wind', 'altimeter'])
+            self.assertEqual(result, {key: value for key, value in full.items() if key in result})
+
+    def test_skipped(self):
+        report = Metar.Report(REPORTS[0], REFERENCE, fields=FIELDS)
+        self.assertIn('wind_speed', report.__dict__)
+        self.assertNotIn('temperature', report.__dict__)
+        self.assertNotIn('visibility_distance', report.__dict__)
+
+        # Skipped groups are still decoded on access
+        self.assertEqual(report.get_temperature(), 17)
+
+    def test_modifier(self):
+        result = Metar.Report(REPORTS[2], REFERENCE, fields=['modifier']).result()
+        self.assertEqual(result['report_modifier'], 'COR')
+        self.assertNotIn('wind', result)
+
+    def test_json(self):
+        for raw in REPORTS:
+            report = Metar.Report(raw, REFERENCE, fields=FIELDS)
+            self.assertEqual(Export.to_json(report), report.json())
+            self.assertEqual(json.loads(report.json()), report.result())
+
+    def test_lazy(self):
+        report = Metar.Report(REPORTS[0], REFERENCE, lazy=True, fields=FIELDS)
+        self.assertEqual(report.result(), Metar.Report(REPORTS[0], REFERENCE, fields=FIELDS).result())
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            Metar.Report(REPORTS[0], fields={'wind', 'runway'})
+
+    def test_parse_many(self):
+        reports = Batch.parse_many(REPORTS, REFERENCE, fields=FIELDS)
+        self.assertEqual([report.result() for report in reports], [Metar.Report(raw, REFERENCE, fields=FIELDS).result() for raw in REPORTS])
+
+    def test_parse_chunk(self):
+        values = Batch._parse_chunk(REPORTS[:1], REFERENCE, frozenset(FIELDS))
+        report = Metar.CompactReport(values[0])
+        self.assertEqual(report.get_wind_speed(), 22)
+        self.assertEqual(report.get_altimeter_pressure(), 1002)
+        self.assertIsNone(report.get_temperature())
+        self.assertEqual(report.get_time(), '08:25')
+
+    def test_diff(self):
+        old = Metar.Report(REPORTS[0], REFERENCE, fields={'altimeter'})
+        new = Metar.Report(REPORTS[0].replace('020825Z', '020855Z').replace('17/15', '18/15'), REFERENCE, fields={'altimeter'})
+        self.assertEqual(Diff.diff(old, new), {'reported': '2020-11-02T08:55:00+00:00', 'time': '08:55'})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,5 +23,17 @@ class TestGeneral(unittest.TestCase):
             report = Metar.Report(REPORTS[i])
             self.assertEqual(report.get_report_modifier(), ident)
 
+    def test_terminator(self):
+        # The '=' ending reports in WMO bulletins is not part of the last group
+        report = Metar.Report('EGPK 020920Z 25010G21KT 8000 09/08 Q0991=')
+        self.assertEqual(report.get_altimeter_pressure(), 991)
+        self.assertEqual(report.get_raw(), 'EGPK 020920Z 25010G21KT 8000 09/08 Q0991=')
+
+        report = Metar.Report('EHAM 020825Z 21022KT=')
+        self.assertEqual(report.get_wind_speed(), 22)
+
+        report = Metar.Report('K2W6 021035Z AUTO 02/M05 A3004 RMK AO1 SLP013=')
+        self.assertEqual(report.get_sea_level_pressure(), 1001.3)
+
 if __name__ == '__main__':
     unittest.main()
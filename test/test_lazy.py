@@ -0,0 +1,42 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'KIAB 020956Z COR AUTO 17005KT 10SM CLR 04/M05 A3045 RMK AO2 SLP318 T00391053 COR 1000',
+    'CYBC 021001Z AUTO 33003KT M2 1/4SM R10/5500FT/N -RA BR BKN024 OVC045 04/03 A2926 RMK VIS VRB 5/8-3 SLP912',
+    'EHAM 021361Z 21022KT 9999 17/15 Q1002',
+    'invalid',
+]
+
+class TestLazy(unittest.TestCase):
+    def test_result(self):
+        for raw in REPORTS:
+            self.assertEqual(Metar.Report(raw, lazy=True).result(), Metar.Report(raw).result())
+
+    def test_decode_on_access(self):
+        report = Metar.Report(REPORTS[0], lazy=True)
+        self.assertEqual(report.get_ident(), 'EHAM')
+        self.assertNotIn('altimeter_pressure', vars(report))
+        self.assertNotIn('wind_speed', vars(report))
+
+        self.assertEqual(report.get_altimeter_pressure(), 1002)
+        self.assertIn('altimeter_pressure_pa', vars(report))
+        self.assertNotIn('wind_speed', vars(report))
+
+    def test_unparsed(self):
+        for raw in REPORTS[3:]:
+            report = Metar.Report(raw, lazy=True)
+            self.assertFalse(report.is_parsed())
+            self.assertIsNone(report.get_wind_speed())
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            Metar.Report(REPORTS[0], lazy=True).unknown
+
+if __name__ == '__main__':
+    unittest.main()
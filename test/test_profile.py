@@ -0,0 +1,77 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Profile
+from datetime import date
+
+REFERENCE = date(2020, 11, 15)
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+    'EHAM 029925Z 21022KT 9999 17/15 Q1002',
+    'invalid',
+    '',
+]
+
+class TestProfile(unittest.TestCase):
+    def setUp(self):
+        Profile.reset()
+
+    def tearDown(self):
+        Profile.disable()
+        Profile.reset()
+
+    def test_disabled(self):
+        for raw in REPORTS:
+            Metar.Report(raw, REFERENCE)
+        self.assertFalse(Profile.is_enabled())
+        self.assertEqual(Profile.stats()['parsed'], 0)
+        self.assertEqual(Profile.stats()['stages']['split']['calls'], 0)
+
+    def test_stages(self):
+        Profile.enable()
+        self.assertTrue(Profile.is_enabled())
+        reports = [Metar.Report(raw, REFERENCE) for raw in REPORTS]
+        stats = Profile.stats()
+
+        self.assertEqual(stats['stages']['split']['calls'], 5)
+        self.assertEqual(stats['stages']['datetime']['calls'], 5)
+        self.assertEqual(stats['stages']['wind']['calls'], 5)
+        self.assertEqual(stats['stages']['tokenize']['calls'], 2)     # only parsed reports with a body
+        self.assertEqual(stats['stages']['time']['calls'], 0)
+        self.assertGreater(stats['stages']['split']['seconds'], 0)
+
+        # Profiling does not change the results
+        Profile.disable()
+        self.assertEqual([report.result() for report in reports], [Metar.Report(raw, REFERENCE).result() for raw in REPORTS])
+
+    def test_failures(self):
+        Profile.enable()
+        for raw in REPORTS:
+            Metar.Report(raw, REFERENCE)
+        stats = Profile.stats()
+        self.assertEqual(stats['parsed'], 2)
+        self.assertEqual(stats['failed'], {'bad_time': 1, 'no_ident': 1, 'empty': 1})
+        self.assertEqual(stats['failed_reports'], REPORTS[2:])
+
+    def test_lazy(self):
+        Profile.enable()
+        report = Metar.Report(REPORTS[0], REFERENCE, lazy=True)
+        self.assertEqual(Profile.stats()['stages']['wind']['calls'], 0)
+        report.get_wind_speed()
+        self.assertEqual(Profile.stats()['stages']['wind']['calls'], 1)
+        self.assertEqual(Profile.stats()['parsed'], 1)
+
+    def test_reset(self):
+        Profile.enable()
+        Metar.Report(REPORTS[3])
+        Profile.reset()
+        stats = Profile.stats()
+        self.assertEqual(stats['failed'], {})
+        self.assertEqual(stats['stages']['split']['calls'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Export
+
+REPORTS = [
+    'KJFK 021451Z 28015KT 10SM FEW250 17/15 A2992 RMK AO2 SLP013 P0012 T01720150',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1 SLP982 T10061050',
+    'CYFC 021002Z AUTO 33002KT M3/4SM R09/5000FT/U -RA BR OVC029 10/10 A2917 RMK PRESFR SLP880 DENSITY ALT 200FT',
+    'KORD 021451Z 28015KT 10SM 17/15 A2992 RMK AO2 SLPNO T0172',
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+]
+
+class TestRemarks(unittest.TestCase):
+    def test_remarks(self):
+        report = Metar.Report(REPORTS[0])
+        self.assertEqual(report.get_remarks_text(), 'AO2 SLP013 P0012 T01720150')
+        self.assertEqual(report.get_station_type(), 'AO2')
+        self.assertEqual(report.get_sea_level_pressure(), 1001.3)
+        self.assertAlmostEqual(report.get_sea_level_pressure_pa(), 100130)
+        self.assertEqual(report.get_precipitation(), 0.12)
+        self.assertAlmostEqual(report.get_precipitation_mm(), 3.048)
+        self.assertEqual(report.get_remarks_temperature(), 17.2)
+        self.assertEqual(report.get_remarks_dew_point(), 15.0)
+
+    def test_negative(self):
+        report = Metar.Report(REPORTS[1])
+        self.assertEqual(report.get_station_type(), 'AO1')
+        self.assertEqual(report.get_sea_level_pressure(), 998.2)
+        self.assertEqual(report.get_remarks_temperature(), -0.6)
+        self.assertEqual(report.get_remarks_dew_point(), -5.0)
+        self.assertIsNone(report.get_precipitation())
+
+    def test_partial(self):
+        report = Metar.Report(REPORTS[2])
+        self.assertEqual(report.get_sea_level_pressure(), 988.0)
+        self.assertIsNone(report.get_station_type())
+        self.assertIsNone(report.get_remarks_temperature())
+
+        report = Metar.Report(REPORTS[3])
+        self.assertIsNone(report.get_sea_level_pressure())
+        self.assertEqual(report.get_remarks_temperature(), 17.2)
+        self.assertIsNone(report.get_remarks_dew_point())
+
+    def test_no_remarks(self):
+        report = Metar.Report(REPORTS[4])
+        self.assertIsNone(report.get_remarks_text())
+        self.assertEqual(report.remarks(), dict.fromkeys(report.remarks()))
+
+    def test_on_demand(self):
+        report = Metar.Report(REPORTS[0])
+        self.assertNotIn('station_type', report.__dict__)
+        report.get_station_type()
+        self.assertIn('station_type', report.__dict__)
+
+    def test_result(self):
+        for raw in REPORTS:
+            report = Metar.Report(raw)
+            self.assertEqual(report.result()['remarks'], report.remarks())
+            self.assertEqual(Export.to_json(report), report.json())
+
+    def test_compact(self):
+        for raw in REPORTS:
+            compact = Metar.CompactReport.from_report(Metar.Report(raw))
+            self.assertEqual(compact.remarks(), Metar.Report(raw).remarks())
+            self.assertEqual(compact.to_report().get_sea_level_pressure(), compact.get_sea_level_pressure())
+
+if __name__ == '__main__':
+    unittest.main()
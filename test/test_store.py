@@ -0,0 +1,78 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Store
+from datetime import date, datetime, timezone
+
+REFERENCE = date(2020, 11, 15)
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'EHAM 020855Z 21020KT 9999 FEW008 17/15 Q1003 NOSIG',
+    'EHAM 020925Z 22018KT 9999 SCT010 16/15 Q1003 NOSIG',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+]
+
+def parse(raw):
+    return Metar.Report(raw, REFERENCE)
+
+def utc(day, hour, minute):
+    return datetime(2020, 11, day, hour, minute, tzinfo=timezone.utc)
+
+class TestStore(unittest.TestCase):
+    def test_latest(self):
+        store = Store.ReportStore()
+        self.assertEqual(store.add_many(parse(raw) for raw in REPORTS), 4)
+        self.assertEqual(store.latest('EHAM').get_raw(), REPORTS[2])
+        self.assertEqual(store.latest('K2W6').get_raw(), REPORTS[3])
+        self.assertIsNone(store.latest('EGPK'))
+        self.assertCountEqual(store.idents(), ['EHAM', 'K2W6'])
+        self.assertEqual(len(store), 4)
+
+    def test_out_of_order(self):
+        store = Store.ReportStore()
+        store.add_many(parse(raw) for raw in [REPORTS[2], REPORTS[0], REPORTS[1]])
+        self.assertEqual([report.get_raw() for report in store.between('EHAM')], REPORTS[:3])
+
+    def test_between(self):
+        store = Store.ReportStore()
+        store.add_many(parse(raw) for raw in REPORTS)
+        self.assertEqual([report.get_time() for report in store.between('EHAM', utc(2, 8, 55), utc(2, 9, 25))], ['08:55', '09:25'])
+        self.assertEqual([report.get_time() for report in store.between('EHAM', utc(2, 8, 30), utc(2, 8, 55))], ['08:55'])
+        self.assertEqual([report.get_time() for report in store.between('EHAM', end=utc(2, 8, 54))], ['08:25'])
+        self.assertEqual(store.between('EHAM', utc(3, 0, 0)), [])
+        self.assertEqual(store.between('EGPK'), [])
+
+        # Times without a timezone are in UTC
+        self.assertEqual([report.get_time() for report in store.between('EHAM', datetime(2020, 11, 2, 8, 55), datetime(2020, 11, 2, 9, 25))], ['08:55', '09:25'])
+
+    def test_retention(self):
+        store = Store.ReportStore(retention=2)
+        store.add_many(parse(raw) for raw in REPORTS)
+        self.assertEqual([report.get_time() for report in store.between('EHAM')], ['08:55', '09:25'])
+
+        self.assertFalse(store.add(parse(REPORTS[0])))
+        self.assertEqual([report.get_time() for report in store.between('EHAM')], ['08:55', '09:25'])
+
+    def test_correction(self):
+        store = Store.ReportStore()
+        store.add(parse(REPORTS[0]))
+        corrected = parse(REPORTS[0].replace('020825Z', '020825Z COR').replace('Q1002', 'Q1001'))
+        self.assertTrue(store.add(corrected))
+        self.assertFalse(store.add(parse(REPORTS[0])))
+        self.assertEqual(store.between('EHAM'), [corrected])
+
+    def test_compact(self):
+        store = Store.ReportStore()
+        store.add(Metar.CompactReport.from_report(parse(REPORTS[0])))
+        self.assertEqual(store.latest('EHAM').get_altimeter_pressure(), 1002)
+
+    def test_unparsed(self):
+        store = Store.ReportStore()
+        self.assertFalse(store.add(parse('invalid')))
+        self.assertEqual(len(store), 0)
+
+if __name__ == '__main__':
+    unittest.main()
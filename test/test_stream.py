@@ -0,0 +1,78 @@
+import os
+import sys
+import bz2
+import gzip
+import io
+import tempfile
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Stream
+from datetime import datetime
+
+DATA = '''2020/10/02 08:25
+EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG
+
+2020/10/13 12:56
+PAUN 131256Z AUTO 08006KT 10SM SCT021 M04/M05 A2931 RMK AO2 SNE15
+     SLP927 P0000 T10391050 FZRANO
+
+K2W6 021035Z AUTO 02/M05 A3004 RMK AO1=
+'''
+
+RAW = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'PAUN 131256Z AUTO 08006KT 10SM SCT021 M04/M05 A2931 RMK AO2 SNE15 SLP927 P0000 T10391050 FZRANO',
+    'K2W6 021035Z AUTO 02/M05 A3004 RMK AO1',
+]
+
+class TestStream(unittest.TestCase):
+    def _path(self, data, compress=None):
+        f = tempfile.NamedTemporaryFile(delete=False)
+        self.addCleanup(os.remove, f.name)
+        f.write(compress(data) if compress else data)
+        f.close()
+        return f.name
+
+    def test_text_file(self):
+        self.assertEqual(list(Stream.read_lines(io.StringIO(DATA))), RAW)
+
+    def test_binary_file(self):
+        self.assertEqual(list(Stream.read_lines(io.BytesIO(DATA.encode()))), RAW)
+
+    def test_path(self):
+        self.assertEqual(list(Stream.read_lines(self._path(DATA.encode()))), RAW)
+
+    def test_empty_path(self):
+        self.assertEqual(list(Stream.read_lines(self._path(b''))), [])
+
+    def test_compressed(self):
+        for compress in [gzip.compress, bz2.compress]:
+            path = self._path(DATA.encode(), compress)
+            self.assertEqual(list(Stream.read_lines(path)), RAW)
+
+            with open(path, 'rb') as f:
+                self.assertEqual(list(Stream.read_lines(f)), RAW)
+
+    def test_compressed_unbuffered(self):
+        # BytesIO and raw file objects have no peek()
+        for compress in [gzip.compress, bz2.compress]:
+            self.assertEqual(list(Stream.read_lines(io.BytesIO(compress(DATA.encode())))), RAW)
+
+            with open(self._path(DATA.encode(), compress), 'rb', buffering=0) as f:
+                self.assertEqual(list(Stream.read_lines(f)), RAW)
+
+    def test_reports(self):
+        reports = list(Stream.read_reports(io.StringIO(DATA), lazy=True))
+        self.assertEqual([report.get_ident() for report in reports], ['EHAM', 'PAUN', 'K2W6'])
+        self.assertEqual(reports[1].get_dew_point(), -5)
+
+    def test_reference(self):
+        reports = list(Stream.read_reports(io.StringIO(DATA)))
+        self.assertEqual([report.get_date() for report in reports], ['2020-10-02', '2020-10-13', '2020-10-02'])
+
+        reports = list(Stream.read_reports(io.StringIO(DATA), reference=datetime(2019, 3, 31)))
+        self.assertEqual([report.get_date() for report in reports], ['2019-03-02', '2019-03-13', '2019-03-02'])
+
+if __name__ == '__main__':
+    unittest.main()
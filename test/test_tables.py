@@ -0,0 +1,73 @@
+import os
+import sys
+import unittest
+from fractions import Fraction
+from itertools import product
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar
+
+def tokens(characters, lengths):
+    """Return all tokens of the given lengths made of the characters."""
+    return [''.join(token) for length in lengths for token in product(characters, repeat=length)]
+
+def int_or_str(string):
+    """Conversion of numeric tokens before the lookup tables."""
+    if string is None:
+        return None
+    string = string.strip()
+    if '/' in string:
+        return None
+    try:
+        return int(string)
+    except ValueError:
+        return string
+
+def statute_miles(value):
+    """Conversion of statute mile visibilities before the lookup tables. Invalid fractions are None."""
+    if value.count('/') == 1:
+        try:
+            return float(sum(Fraction(s) for s in value.split()))
+        except (ValueError, ZeroDivisionError):
+            return None
+    return int_or_str(value)
+
+class TestTables(unittest.TestCase):
+    def assertSame(self, value, expected, token):
+        self.assertEqual((value, type(value)), (expected, type(expected)), token)
+
+    def test_numbers(self):
+        # Wind directions ('[\d/]{3}', 'VRB'), speeds ('[\d/]{2,3}') and gusts ('\d{2,3}')
+        for token in tokens('0123456789/', (1, 2, 3)) + ['VRB', None]:
+            self.assertSame(Metar.NUMBERS[token], int_or_str(token), token)
+
+    def test_temperatures(self):
+        for token in tokens('0123456789', (2,)):
+            for token in (token, 'M' + token):
+                self.assertSame(Metar.TEMPERATURES[token], int_or_str(token.replace('M', '-')), token)
+
+    def test_statute_miles(self):
+        values = tokens('0123456789/', (1, 2, 3, 4, 5))
+        values += ['{} {}'.format(digit, value) for digit in range(10) for value in values if value.count('/') == 1 and len(value) <= 3]
+        for value in values:
+            self.assertSame(Metar.STATUTE_MILES[value], statute_miles(value), value)
+
+    def test_lookup(self):
+        # Legal values are looked up without converting
+        for table, token in [(Metar.NUMBERS, '007'), (Metar.NUMBERS, '210'), (Metar.TEMPERATURES, 'M05'), (Metar.STATUTE_MILES, '2 1/4'), (Metar.STATUTE_MILES, '15/16')]:
+            self.assertIn(token, table)
+        self.assertNotIn('1234', Metar.STATUTE_MILES)
+
+    def test_altimeter(self):
+        for token in tokens('0123456789', (4,)):
+            report = Metar.Report('KXXX 021035Z A' + token)
+            self.assertSame(report.altimeter_pressure, float(token[:2] + '.' + token[2:]), token)
+
+    def test_invalid_fractions(self):
+        # These raised an exception before
+        for token in ['1/0SM', '/4SM', '1/SM']:
+            report = Metar.Report('KXXX 021035Z 18010KT {} 10/05 A3004'.format(token))
+            self.assertIsNone(report.visibility_distance)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import sys
+import threading
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar, Batch, Export
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'EGPK 020920Z 25010G21KT 8000 -RA FEW014 SCT020 BKN042 09/08 Q0991',
+    'PAUN 131256Z AUTO 08006KT 10SM SCT021 M04/M05 A2931 RMK AO2 SNE15 SLP927 P0000 T10391050 FZRANO',
+    'ZMUB 021000Z VRB09G18MPS CAVOK M09/M13 Q1025 NOSIG RMK QFE660.4 66',
+    'CYBC 021001Z AUTO 33003KT M2 1/4SM R10/5500FT/N -RA BR BKN024 OVC045 04/03 A2926 RMK VIS VRB 5/8-3 SLP912',
+    'MTPP 020959Z AUTO /////KT 9000 ////// ///// Q//// A//// NOSIG',
+    'KXXX 021035Z 18010KT 1/0SM 10/05 A3004',
+    'invalid',
+]
+
+# Options of `Report` used by the threads, including field projections that are compiled on first use
+OPTIONS = [
+    {},
+    {'lazy': True},
+    {'fields': ['wind']},
+    {'fields': ['temperatures', 'altimeter']},
+    {'fields': ['clouds', 'weather', 'remarks'], 'lazy': True},
+]
+
+THREADS = 8
+ROUNDS = 50
+
+class TestThreads(unittest.TestCase):
+    def test_read_only(self):
+        for table in [Metar.SPEED_TO_MS, Metar.FIELD_GROUPS, Metar.SECTIONS, Metar.NUMBERS, Metar.STATUTE_MILES, Export.ENCODERS]:
+            with self.assertRaises(TypeError):
+                table['kt'] = 1
+
+    def test_stress(self):
+        expected = {
+            index: [(Metar.Report(raw, **options).result(), Export.to_json(Metar.Report(raw, **options))) for raw in REPORTS]
+            for index, options in enumerate(OPTIONS)
+        }
+
+        # Start all threads with empty caches, so that they also race to fill them
+        Metar._projections.clear()
+        Export._plans.clear()
+        Export._plans[None] = (Export._TEXTS, Export._VALUES, Export.END)
+
+        barrier = threading.Barrier(THREADS)
+        failures = []
+
+        def run(offset):
+            barrier.wait()
+            for round in range(ROUNDS):
+                index = (offset + round) % len(OPTIONS)
+                reports = [Metar.Report(raw, **OPTIONS[index]) for raw in REPORTS]
+                results = [(report.result(), Export.to_json(report)) for report in reports]
+                if results != expected[index]:
+                    failures.append((offset, round))
+
+        threads = [threading.Thread(target=run, args=(offset,)) for offset in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(failures, [])
+
+    def test_shared_lazy_reports(self):
+        # Lazy reports decoded by many threads at once
+        reports = Batch.parse_many(REPORTS * 20, lazy=True)
+        expected = [report.result() for report in Batch.parse_many(REPORTS * 20)]
+        barrier = threading.Barrier(THREADS)
+        results = [None] * THREADS
+
+        def run(offset):
+            barrier.wait()
+            results[offset] = [report.result() for report in reports]
+
+        threads = [threading.Thread(target=run, args=(offset,)) for offset in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for result in results:
+            self.assertEqual(result, expected)
+
+    def test_parse_threaded(self):
+        reports = REPORTS * 100
+        expected = [report.result() for report in Batch.parse_many(reports)]
+        for ordered in (True, False):
+            results = [report.result() for report in Batch.parse_threaded(reports, workers=THREADS, chunksize=7, ordered=ordered)]
+            if ordered:
+                self.assertEqual(results, expected)
+            else:
+                self.assertCountEqual(results, expected)
+
+if __name__ == '__main__':
+    unittest.main()
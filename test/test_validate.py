@@ -0,0 +1,61 @@
+import os
+import sys
+import io
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from metar_parser import Metar, Batch, Stream
+import corpus
+
+REPORTS = [
+    ('EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG', None),
+    ('K2W6 021035Z AUTO 02/M05 A3004 RMK AO1', None),
+    ('EHAM 020825Z 21022KT=\n', None),
+    ('', 'empty'),
+    ('   \n', 'empty'),
+    ('2020/11/02 08:25', 'header'),
+    ('TAF EHAM 020500Z 0206/0312 21015KT 9999 SCT025', 'taf'),
+    ('METAR EHAM 020825Z 21022KT 9999 17/15 Q1002', 'no_ident'),
+    ('EHA', 'no_ident'),
+    ('EHAM', 'bad_time'),
+    ('EHAM 0208', 'bad_time'),
+    ('EHAM 020825 21022KT', 'bad_time'),
+    ('EHAM 322525Z 21022KT', 'bad_time'),
+    ('EHAM 020860Z 21022KT', 'bad_time'),
+    ('EHAM 020825Z', 'empty_body'),
+    ('EHAM 020825Z RMK AO2', 'empty_body'),
+]
+
+class TestValidate(unittest.TestCase):
+    def test_reasons(self):
+        for raw, reason in REPORTS:
+            self.assertEqual(Metar.validate(raw), reason, raw)
+
+    def test_parsed(self):
+        # Lines that pass can be parsed, and lines that cannot be parsed do not pass
+        for raw in [raw for raw, _ in REPORTS] + corpus.generate(2000):
+            if Metar.validate(raw) is None:
+                self.assertTrue(Metar.Report(raw).is_parsed(), raw)
+            if not Metar.Report(raw).is_parsed():
+                self.assertIsNotNone(Metar.validate(raw), raw)
+
+    def test_parse_many(self):
+        lines = [raw for raw, _ in REPORTS]
+        self.assertEqual(len(Batch.parse_many(lines)), len(lines))
+        self.assertEqual(len(Batch.parse_many(lines, skip_invalid=True)), 3)
+
+        rejected = []
+        reports = Batch.parse_many(lines, rejected=lambda raw, reason: rejected.append(reason))
+        self.assertEqual([report.get_ident() for report in reports], ['EHAM', 'K2W6', 'EHAM'])
+        self.assertEqual(rejected, [reason for _, reason in REPORTS[3:]])
+
+    def test_read_reports(self):
+        text = '2020/11/02 08:25\nEHAM 020825Z 21022KT 9999 17/15 Q1002\nTAF EHAM 020500Z 0206/0312 21015KT\nEHAM 020825Z\n'
+        rejected = []
+        reports = list(Stream.read_reports(io.StringIO(text), rejected=lambda raw, reason: rejected.append(reason)))
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(rejected, ['taf', 'empty_body'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import os
+import re
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metar_parser import Metar
+
+REPORTS = [
+    'EHAM 020825Z 21022KT 190V250 9999 FEW008 SCT018 BKN022 17/15 Q1002 NOSIG',
+    'CYFC 021002Z AUTO 33002KT M3/4SM R09/5000FT/U -RA BR OVC029 10/10 A2917 RMK PRESFR SLP880 DENSITY ALT 200FT',
+    'CYHK 020945Z AUTO 31015KT 4SM -SN BKN034 M16/M18 A2998 RMK SLP162',
+    'KMIA 021853Z 09012KT 3SM +TSRAGR VCSH BKN020CB 25/23 A2995',
+    'EGLL 021050Z 24015KT 9999 SCT012 12/10 Q1008 TEMPO 4000 SHRA',
+    'EDDF 020820Z 26008KT 0300 FZFG VV002 M02/M02 Q1021',
+]
+
+class TestWeather(unittest.TestCase):
+    def test_present_weather(self):
+        values = [
+            None,
+            [{'intensity': '-', 'descriptor': None, 'phenomena': ['RA']}, {'intensity': None, 'descriptor': None, 'phenomena': ['BR']}],
+            [{'intensity': '-', 'descriptor': None, 'phenomena': ['SN']}],
+            [{'intensity': '+', 'descriptor': 'TS', 'phenomena': ['RA', 'GR']}, {'intensity': 'VC', 'descriptor': 'SH', 'phenomena': []}],
+            None,   # weather of the trend forecast is not present weather
+            [{'intensity': None, 'descriptor': 'FZ', 'phenomena': ['FG']}],
+        ]
+        for i, value in enumerate(values):
+            report = Metar.Report(REPORTS[i])
+            self.assertEqual(report.get_present_weather(), value)
+
+    def test_vocabulary(self):
+        for code in list(Metar.WEATHER_DESCRIPTORS) + list(Metar.WEATHER_PHENOMENA):
+            self.assertIsNotNone(re.fullmatch(Metar.TOKEN_PATTERN, code), code)
+        for token in ['NOSIG', 'RMK', 'R09/5000FT/U', '-', 'VC', 'XX']:
+            match = re.fullmatch(Metar.TOKEN_PATTERN, token)
+            self.assertTrue(match is None or match.lastgroup != 'weather', token)
+
+if __name__ == '__main__':
+    unittest.main()